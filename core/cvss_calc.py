@@ -8,10 +8,9 @@ from PyQt5.QtWidgets import (
     QGroupBox, QGridLayout, QTextEdit, QListWidget, QListWidgetItem, QApplication
 )
 from PyQt5.QtCore import Qt, QTimer, QSize
-from PyQt5.QtGui import QIcon
 from datetime import datetime
 from cvss import CVSS3
-from gui.common_widgets import get_copyright_label
+from gui.common_widgets import get_copyright_label, cached_icon, cached_pixmap
 
 class CVSSCalcTab(QWidget):
     def __init__(self):
@@ -23,7 +22,7 @@ class CVSSCalcTab(QWidget):
         heading_icon = QLabel()
         main_layout.addSpacing(25)
         
-        heading_icon.setPixmap(QIcon("assets/cvss_icon.jpg").pixmap(350, 180))
+        heading_icon.setPixmap(cached_pixmap("assets/cvss_icon.jpg", 350, 180))
         heading_icon.setStyleSheet("margin-right: 10px;")
 
         heading_text = QLabel("<b>CVSS v3.1 Calculator</b>")
@@ -96,7 +95,7 @@ class CVSSCalcTab(QWidget):
         score_row.addWidget(self.result_label)
 
         self.copy_button = QPushButton()
-        self.copy_button.setIcon(QIcon("assets/copy_icon.jpg"))
+        self.copy_button.setIcon(cached_icon("assets/copy_icon.jpg"))
         self.copy_button.setIconSize(QSize(24, 24))
         self.copy_button.setFixedSize(36, 36)
         self.copy_button.setStyleSheet("border: none; padding: 0px;")
@@ -191,7 +190,7 @@ class CVSSCalcTab(QWidget):
             btn = QPushButton(name)
             btn.setToolTip(f"<div style='background-color: #fff8dc; padding: 4px; border-radius: 6px;'>" + tooltip_texts.get(metric, {}).get(code, '') + "</div>")
             if icon_path:
-                btn.setIcon(QIcon(icon_path))
+                btn.setIcon(cached_icon(icon_path))
             btn.setIconSize(QSize(32, 32))
             btn.setText(name)
             btn.setCheckable(True)
@@ -4,18 +4,110 @@
 
 
 from pathlib import Path
-import os, sys, shutil, subprocess, platform, stat, webbrowser
+from functools import lru_cache
+import os, re, sys, shutil, subprocess, platform, stat, threading, time, selectors, webbrowser
+from collections import deque
 from typing import Callable, Optional, Tuple
 
 # =============================================================================
 # Small utilities
 # =============================================================================
 
+# basename -> full path of every executable on PATH, built by one scandir sweep
+_PATH_INDEX = None
+_PATH_INDEX_KEY = None          # PATH value the index was built from
+_PATH_INDEX_LOCK = threading.Lock()
+
+def _build_path_index() -> dict:
+    """
+    Scan each PATH directory once. Keys are bare command names (lowercased and
+    without a PATHEXT suffix on Windows); the first directory wins, as with which().
+    """
+    index = {}
+    windows = os.name == "nt"
+    if windows:
+        pathext = {e.lower() for e in os.environ.get("PATHEXT", ".COM;.EXE;.BAT;.CMD").split(os.pathsep) if e}
+    for d in os.environ.get("PATH", "").split(os.pathsep):
+        if not d:
+            continue
+        try:
+            it = os.scandir(d)
+        except OSError:
+            continue
+        with it:
+            for entry in it:
+                try:
+                    if not entry.is_file():
+                        continue
+                    if windows:
+                        stem, ext = os.path.splitext(entry.name)
+                        if ext.lower() not in pathext:
+                            continue
+                        key = stem.lower()
+                    else:
+                        if not entry.stat().st_mode & 0o111:
+                            continue
+                        key = entry.name
+                except OSError:
+                    continue
+                index.setdefault(key, entry.path)
+    return index
+
+def path_index() -> dict:
+    """Return the PATH index, rebuilding it when PATH changed or after invalidation."""
+    global _PATH_INDEX, _PATH_INDEX_KEY
+    path = os.environ.get("PATH", "")
+    with _PATH_INDEX_LOCK:
+        if _PATH_INDEX is None or _PATH_INDEX_KEY != path:
+            _PATH_INDEX = _build_path_index()
+            _PATH_INDEX_KEY = path
+        return _PATH_INDEX
+
+def invalidate_path_index():
+    """Forget PATH lookups (call after anything may have installed an executable)."""
+    global _PATH_INDEX
+    with _PATH_INDEX_LOCK:
+        _PATH_INDEX = None
+    _which.cache_clear()
+
 def has_cmd(cmd: str) -> bool:
-    return shutil.which(cmd) is not None
+    """
+    Check if an executable is available on PATH (Windows-aware).
+    Answers from the cached PATH index; explicit paths still go through which().
+    """
+    try:
+        if not isinstance(cmd, str) or not cmd.strip():
+            return False
+        cmd = cmd.strip()
+        if os.path.dirname(cmd):
+            return shutil.which(cmd) is not None
+        if os.name == "nt":
+            key = cmd.lower()
+            stem, ext = os.path.splitext(key)
+            index = path_index()
+            return key in index or (bool(ext) and stem in index)
+        return cmd in path_index()
+    except Exception:
+        return False
+
+@lru_cache(maxsize=None)
+def _which(cmd: str) -> Optional[str]:
+    """
+    Cached shutil.which for package-manager probes (apt/brew/choco/go/sudo).
+    Those don't come and go between plugins, so one PATH walk per name is enough;
+    invalidate_path_index() clears it together with the PATH index after an install.
+    """
+    return shutil.which(cmd)
+
+# Host OS and effective uid never change for the process; resolve them once at import
+_SYS = platform.system().lower()
+try:
+    _IS_ROOT = hasattr(os, "geteuid") and os.geteuid() == 0
+except Exception:
+    _IS_ROOT = False
 
 def is_windows() -> bool:
-    return platform.system().lower() == "windows"
+    return _SYS == "windows"
 
 def shims_dir() -> Path:
     p = Path.cwd() / ".rc_shims"
@@ -29,25 +121,32 @@ def ensure_exec(path: Path):
     except Exception:
         pass
 
-def run_cmd_stream(args, emit: Optional[Callable[[str], None]] = None) -> Tuple[int, str]:
+# run_cmd_stream() keeps only this many trailing lines for its returned text;
+# everything is streamed to emit as it arrives (installs can print megabytes)
+_OUTPUT_TAIL_LINES = 200
+
+# Ceiling for one installer command (apt/brew/choco/pip/go/compat methods), in seconds
+INSTALL_TIMEOUT = 30 * 60
+# Exit code reported for a command stopped by its timeout (same as timeout(1))
+TIMEOUT_RC = 124
+
+def run_cmd_stream(args, emit: Optional[Callable[[str], None]] = None,
+                   timeout: Optional[float] = None) -> Tuple[int, str]:
     """
     Safe runner for argv or shell string (when shell=True).
     Used by compat layer when run_streamed is not injected.
+    timeout: seconds before the command is killed and TIMEOUT_RC returned.
+
+    On POSIX the pipe is polled against the deadline (as run_streamed does), so
+    a grandchild that keeps stdout open (shell=True, sudo) cannot hold the call
+    past its timeout. Windows pipes are not selectable; there a timer kills the command.
     """
     shell = isinstance(args, str)
     try:
         p = subprocess.Popen(args,
                              stdout=subprocess.PIPE,
                              stderr=subprocess.STDOUT,
-                             text=True,
                              shell=shell)
-        buf = []
-        for line in p.stdout:
-            buf.append(line)
-            if emit: emit(line.rstrip("\n"))
-        rc = p.wait()
-        out = "".join(buf)
-        return rc, out
     except FileNotFoundError:
         if emit: emit(f"command not found: {args if isinstance(args, str) else args[0]}")
         return 127, ""
@@ -55,6 +154,73 @@ def run_cmd_stream(args, emit: Optional[Callable[[str], None]] = None) -> Tuple[
         if emit: emit(f"error: {e}")
         return 1, str(e)
 
+    tail = deque(maxlen=_OUTPUT_TAIL_LINES)
+    expired = threading.Event()
+
+    def _line(raw: bytes):
+        line = raw.decode(errors="replace")
+        tail.append(line)
+        if emit: emit(line.rstrip("\r\n"))
+
+    def _expire():
+        expired.set()
+        try:
+            p.kill()
+        except Exception:
+            pass
+
+    try:
+        if os.name == "nt":
+            timer = None
+            if timeout is not None:
+                timer = threading.Timer(timeout, _expire)
+                timer.daemon = True
+                timer.start()
+            try:
+                for raw in p.stdout:
+                    _line(raw)
+            finally:
+                if timer is not None:
+                    timer.cancel()
+        else:
+            deadline = None if timeout is None else time.monotonic() + timeout
+            fd = p.stdout.fileno()
+            buf = b""
+            with selectors.DefaultSelector() as sel:
+                sel.register(p.stdout, selectors.EVENT_READ)
+                while True:
+                    if deadline is not None and time.monotonic() > deadline:
+                        _expire()
+                        break
+                    if not sel.select(0.1):
+                        # Child gone and nothing readable: a grandchild may still hold the pipe open
+                        if p.poll() is not None:
+                            break
+                        continue
+                    chunk = os.read(fd, 4096)
+                    if not chunk:
+                        break
+                    buf += chunk
+                    *lines, buf = buf.split(b"\n")
+                    for raw in lines:
+                        _line(raw + b"\n")
+            if buf:
+                _line(buf)
+        p.stdout.close()
+        try:
+            # after a timeout, don't wait on a child the kill could not reach (e.g. root-owned sudo)
+            rc = p.wait(timeout=5 if expired.is_set() else None)
+        except subprocess.TimeoutExpired:
+            rc = TIMEOUT_RC
+    except Exception as e:
+        if emit: emit(f"error: {e}")
+        return 1, str(e)
+
+    if expired.is_set():
+        if emit: emit(f"timed out after {timeout:g}s")
+        rc = TIMEOUT_RC
+    return rc, "".join(tail)
+
 # =============================================================================
 # Docker helpers (for new plugin template)
 # =============================================================================
@@ -77,10 +243,16 @@ def create_docker_shim(alias: str, docker_run: str, emit: Callable[[str], None])
         emit(f"❌ Shim error: {e}")
         return None
 
+_IMAGE_TOKEN_RE = re.compile(r"\S*[:/]\S*")
+
+@lru_cache(maxsize=None)
+def infer_docker_image(docker_run: str) -> Optional[str]:
+    """Best-effort heuristic: last token that looks like an image (has '/' or ':')."""
+    toks = _IMAGE_TOKEN_RE.findall(docker_run or "")
+    return toks[-1] if toks else None
+
 def pull_image_if_mentioned(docker_run: str, emit: Callable[[str], None]):
-    # Best-effort heuristic: last token that looks like an image (has '/' or ':')
-    toks = docker_run.split()
-    image = next((t for t in reversed(toks) if ("/" in t or ":" in t)), None)
+    image = infer_docker_image(docker_run)
     if image:
         emit(f"🐳 docker pull {image}")
         run_cmd_stream(["docker", "pull", image], emit)
@@ -91,12 +263,8 @@ def pull_image_if_mentioned(docker_run: str, emit: Callable[[str], None]):
 
 def apt_install(pkg: str, emit) -> Tuple[bool, str]:
     # Preserve your previous sudo/root logic & messages
-    is_root = False
-    try:
-        is_root = hasattr(os, "geteuid") and os.geteuid() == 0
-    except Exception:
-        is_root = False
-    has_sudo = has_cmd("sudo")
+    is_root = _IS_ROOT
+    has_sudo = _which("sudo") is not None
 
     if is_root:
         cmd = ["apt", "install", "-y", pkg]
@@ -115,27 +283,27 @@ def apt_install(pkg: str, emit) -> Tuple[bool, str]:
     elif has_sudo:
         run_cmd_stream(["sudo", "apt-get", "update"], emit)
 
-    rc, out = run_cmd_stream(cmd, emit)
+    rc, out = run_cmd_stream(cmd, emit, timeout=INSTALL_TIMEOUT)
     return (rc == 0, out if out else ("OK" if rc == 0 else "apt install failed"))
 
 def brew_install(pkg: str, emit) -> Tuple[bool, str]:
-    if not has_cmd("brew"): return False, "Homebrew not found (https://brew.sh)"
-    rc, out = run_cmd_stream(["brew", "install", pkg], emit)
+    if not _which("brew"): return False, "Homebrew not found (https://brew.sh)"
+    rc, out = run_cmd_stream(["brew", "install", pkg], emit, timeout=INSTALL_TIMEOUT)
     return (rc == 0, out if out else ("OK" if rc == 0 else "brew install failed"))
 
 def choco_install(pkg: str, emit) -> Tuple[bool, str]:
-    if not has_cmd("choco"): return False, "Chocolatey not found (https://chocolatey.org/install)"
-    rc, out = run_cmd_stream(["choco", "install", pkg, "-y"], emit)
+    if not _which("choco"): return False, "Chocolatey not found (https://chocolatey.org/install)"
+    rc, out = run_cmd_stream(["choco", "install", pkg, "-y"], emit, timeout=INSTALL_TIMEOUT)
     return (rc == 0, out if out else ("OK" if rc == 0 else "choco install failed"))
 
 def pip_install(pkg: str, emit) -> Tuple[bool, str]:
     # Mirror your previous behavior: sys.executable -m pip install <pkg>
-    rc, out = run_cmd_stream([sys.executable, "-m", "pip", "install", pkg], emit)
+    rc, out = run_cmd_stream([sys.executable, "-m", "pip", "install", pkg], emit, timeout=INSTALL_TIMEOUT)
     return (rc == 0, out if out else ("OK" if rc == 0 else "pip install failed"))
 
 def go_install(go_path: str, emit) -> Tuple[bool, str]:
-    if not has_cmd("go"): return False, "Go not found (https://go.dev/dl/)"
-    rc, out = run_cmd_stream(["go", "install", go_path], emit)
+    if not _which("go"): return False, "Go not found (https://go.dev/dl/)"
+    rc, out = run_cmd_stream(["go", "install", go_path], emit, timeout=INSTALL_TIMEOUT)
     return (rc == 0, out if out else ("OK" if rc == 0 else "go install failed"))
 
 # =============================================================================
@@ -167,6 +335,11 @@ def get_plugin_install_meta(plugin) -> dict:
 # SAFE one-shot installer for a plugin module (preferred by ToolInstallWorker)
 # =============================================================================
 
+def _installed(result: Tuple[bool, str]) -> Tuple[bool, str]:
+    """Pass an installer result through, dropping PATH lookups it may have made stale."""
+    invalidate_path_index()
+    return result
+
 def safe_install_tool(plugin, emit: Callable[[str], None]) -> Tuple[bool, str]:
     """
     Single source of truth for installing ONE plugin/tool (new template).
@@ -195,15 +368,15 @@ def safe_install_tool(plugin, emit: Callable[[str], None]) -> Tuple[bool, str]:
         ok = bool(shim and shim.exists() and has_cmd(alias))
         return (ok, f"Shim created at {shim}" if ok else "Failed to create shim")
 
-    if hint == "apt":    return apt_install(req, emit)
-    if hint == "brew":   return brew_install(req, emit)
-    if hint == "choco":  return choco_install(req, emit)
-    if hint == "pip":    return pip_install(req, emit)
+    if hint == "apt":    return _installed(apt_install(req, emit))
+    if hint == "brew":   return _installed(brew_install(req, emit))
+    if hint == "choco":  return _installed(choco_install(req, emit))
+    if hint == "pip":    return _installed(pip_install(req, emit))
     if hint == "go":
         go_path = url or f"github.com/projectdiscovery/{req}/cmd/{req}@latest"
         if not url:
             emit(f"⚠️ No INSTALL_URL for Go tool '{req}', assuming ProjectDiscovery path: {go_path}")
-        return go_install(go_path, emit)
+        return _installed(go_install(go_path, emit))
     if hint == "git":
         return False, f"Manual git build required: {url or 'no URL provided'}"
 
@@ -213,68 +386,23 @@ def safe_install_tool(plugin, emit: Callable[[str], None]) -> Tuple[bool, str]:
 # COMPAT: exact behavior of your old try_install_tool (single call)
 # =============================================================================
 
-def compat_try_install_tool(
-    command_or_tool,
+def _build_install_methods(
+    tool_bin: str,
+    install_hint: Optional[str],
+    install_url: Optional[str],
     output_func: Callable[[str], None],
-    install_hint: Optional[str] = None,
-    install_url: Optional[str] = None,
-    max_attempts: int = 2,
-    run_streamed: Optional[Callable[..., int]] = None
-) -> str:
+) -> list:
     """
-    Mirrors your previous try_install_tool behavior (messages & flow),
-    while sharing the same native helpers above.
-
-    - If `command_or_tool` is a shell string with spaces, we stream it directly.
-    - Otherwise we build the methods list (apt/brew/choco/go/pip/git) and try each with attempts.
-    - Uses `run_streamed` if provided (your function from common_widget.py), else falls back to run_cmd_stream.
+    Return the (method_name, cmd) attempts for compat_try_install_tool, in order.
+    Host checks come from the import-time _SYS/_IS_ROOT and the cached _which() probes,
+    so installing several tools in a row does not repeat them.
     """
-    # choose a runner
-    def _stream(cmd, emit, shell=False):
-        if run_streamed:
-            # old signature: run_streamed(cmd, output_func, shell=True/False)
-            return run_streamed(cmd, emit, shell=shell)
-        # fallback to local
-        rc, _ = run_cmd_stream(cmd if shell else cmd, emit)
-        return rc
-
-    system = platform.system().lower()
-    is_linux = (system == "linux")
-    is_darwin = (system == "darwin")
-    is_windows_sys = (system == "windows")
-
-    # detect full shell command vs tool name
-    is_shell_command = isinstance(command_or_tool, str) and " " in command_or_tool
-    tool_bin = command_or_tool.strip().split()[0] if isinstance(command_or_tool, str) else str(command_or_tool)
-
-    # 1) explicit full command (string) -> stream as-is
-    if is_shell_command:
-        output_func(f"⚙️ Executing: {command_or_tool}")
-        try:
-            rc = _stream(command_or_tool, output_func, shell=True)
-            if rc == 0:
-                output_func(f"✅ Successfully installed via: {command_or_tool}")
-                return "installed"
-            else:
-                output_func(f"❌ Install failed (exit {rc}).")
-                return "failed"
-        except Exception as e:
-            output_func(f"❌ Exception occurred: {e}")
-            return "exception"
-
-    # 2) Build methods list exactly like your old function
     methods = []
-
-    # sudo/root detection (Linux only)
-    is_root = False
-    try:
-        is_root = hasattr(os, "geteuid") and os.geteuid() == 0
-    except Exception:
-        is_root = False
-    has_sudo = has_cmd("sudo")
+    is_root = _IS_ROOT
+    has_sudo = _which("sudo") is not None
 
     # apt
-    if install_hint == "apt" or (is_linux and has_cmd("apt")):
+    if install_hint == "apt" or (_SYS == "linux" and _which("apt")):
         if is_root:
             cmd = ["apt", "install", "-y", tool_bin]
         elif has_sudo:
@@ -293,15 +421,15 @@ def compat_try_install_tool(
         methods.append(("apt", cmd))
 
     # brew
-    if install_hint == "brew" or (is_darwin and has_cmd("brew")):
+    if install_hint == "brew" or (_SYS == "darwin" and _which("brew")):
         methods.append(("brew", ["brew", "install", tool_bin]))
 
     # choco
-    if install_hint == "choco" or (is_windows_sys and has_cmd("choco")):
+    if install_hint == "choco" or (_SYS == "windows" and _which("choco")):
         methods.append(("choco", ["choco", "install", tool_bin, "-y"]))
 
     # go
-    if install_hint == "go" or has_cmd("go"):
+    if install_hint == "go" or _which("go"):
         if install_url:
             go_path = install_url
         else:
@@ -317,6 +445,61 @@ def compat_try_install_tool(
     if install_hint == "git" and install_url:
         methods.append(("git", f"git clone {install_url} && cd {tool_bin} && sudo make install"))
 
+    return methods
+
+def compat_try_install_tool(
+    command_or_tool,
+    output_func: Callable[[str], None],
+    install_hint: Optional[str] = None,
+    install_url: Optional[str] = None,
+    max_attempts: int = 2,
+    run_streamed: Optional[Callable[..., int]] = None,
+    timeout: Optional[float] = INSTALL_TIMEOUT
+) -> str:
+    """
+    Mirrors your previous try_install_tool behavior (messages & flow),
+    while sharing the same native helpers above.
+
+    - If `command_or_tool` is a shell string with spaces, we stream it directly.
+    - Otherwise we build the methods list (apt/brew/choco/go/pip/git) and try each with attempts.
+    - Uses `run_streamed` if provided (your function from common_widget.py), else falls back to run_cmd_stream.
+    - `timeout` caps each command in seconds (None = no limit).
+    - A method whose command is missing (exit 127) or that timed out is not retried.
+    """
+    # choose a runner
+    def _stream(cmd, emit, shell=False):
+        if run_streamed:
+            # old signature: run_streamed(cmd, output_func, shell=True/False)
+            if timeout is None:
+                return run_streamed(cmd, emit, shell=shell)
+            return run_streamed(cmd, emit, shell=shell, timeout=timeout)
+        # fallback to local
+        rc, _ = run_cmd_stream(cmd, emit, timeout=timeout)
+        return rc
+
+    # detect full shell command vs tool name
+    is_shell_command = isinstance(command_or_tool, str) and " " in command_or_tool
+    tool_bin = command_or_tool.strip().split()[0] if isinstance(command_or_tool, str) else str(command_or_tool)
+
+    # 1) explicit full command (string) -> stream as-is
+    if is_shell_command:
+        output_func(f"⚙️ Executing: {command_or_tool}")
+        try:
+            rc = _stream(command_or_tool, output_func, shell=True)
+            if rc == 0:
+                output_func(f"✅ Successfully installed via: {command_or_tool}")
+                invalidate_path_index()
+                return "installed"
+            else:
+                output_func(f"❌ Install failed (exit {rc}).")
+                return "failed"
+        except Exception as e:
+            output_func(f"❌ Exception occurred: {e}")
+            return "exception"
+
+    # 2) Build methods list exactly like your old function
+    methods = _build_install_methods(tool_bin, install_hint, install_url, output_func)
+
     # 3) Try methods with attempts, preserve sudo prompt warning
     for method_name, cmd in methods:
         for attempt in range(1, max_attempts + 1):
@@ -335,9 +518,18 @@ def compat_try_install_tool(
                 rc = _stream(cmd, output_func, shell=isinstance(cmd, str))
                 if rc == 0:
                     output_func(f"✅ {tool_bin} installed successfully via {method_name}.")
+                    invalidate_path_index()
                     return "installed"
                 else:
                     output_func(f"❌ {method_name} failed (exit {rc}).")
+                    if rc in (127, TIMEOUT_RC):
+                        break  # command not found / ran out of time: another attempt won't do better
+            except FileNotFoundError as e:
+                output_func(f"❌ {method_name} exception: {e}")
+                break
+            except subprocess.TimeoutExpired as e:
+                output_func(f"❌ {method_name} timed out after {e.timeout:g}s.")
+                break
             except Exception as e:
                 output_func(f"❌ {method_name} exception: {e}")
 
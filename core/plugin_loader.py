@@ -10,15 +10,64 @@ from __future__ import annotations
 
 import importlib
 import importlib.util
+import pkgutil
 import sys
 from pathlib import Path
-from typing import Dict, Optional
+from typing import Dict, NamedTuple, Optional
 
 
 # Files we never load as plugins (case-insensitive stem match)
 IGNORE_STEMS = {"__init__", "template"}  # keeps your template.py ignored
 
 
+class PluginMeta(NamedTuple):
+    """
+    Install/runtime metadata of one plugin, read from its module once at load time
+    (get_install_info() first, then module attributes) so workers do not repeat
+    getattr chains (and cannot drift from each other).
+    """
+    name: str
+    required: str            # REQUIRED_TOOL (defaults to the plugin name)
+    hint: str                # INSTALL_HINT, stripped + lowercased ("manual" when unset)
+    url: str                 # INSTALL_URL
+    alias: str               # runtime name: TOOL_ALIAS -> EXECUTABLE -> REQUIRED_TOOL
+    docker_run: str          # DOCKER_RUN
+    script: Optional[str]    # SCRIPT_PATH for script-based plugins
+
+    @classmethod
+    def from_module(cls, name: str, module) -> "PluginMeta":
+        # Prefer the template's get_install_info() if present; module attributes
+        # remain the fallback for old/simple plugins (and for keys it leaves empty)
+        gi = {}
+        try:
+            if hasattr(module, "get_install_info"):
+                gi = module.get_install_info() or {}
+        except Exception:
+            gi = {}
+
+        required = gi.get("required_tool") or getattr(module, "REQUIRED_TOOL", name)
+        return cls(
+            name=name,
+            required=required,
+            hint=(gi.get("install_hint") or getattr(module, "INSTALL_HINT", "manual") or "manual").strip().lower(),
+            url=gi.get("install_url") or getattr(module, "INSTALL_URL", "") or "",
+            alias=(
+                (gi.get("alias_name") or "").strip()
+                or (getattr(module, "TOOL_ALIAS", "") or "").strip()
+                or (gi.get("exec_name") or "").strip()
+                or (getattr(module, "EXECUTABLE", "") or "").strip()
+                or required
+            ),
+            docker_run=gi.get("docker_run") or getattr(module, "DOCKER_RUN", "") or "",
+            script=getattr(module, "SCRIPT_PATH", None),
+        )
+
+
+def build_plugin_metas(plugin_map: Dict[str, object]) -> Dict[str, PluginMeta]:
+    """Return {plugin name: PluginMeta} for a discover_plugins() result."""
+    return {name: PluginMeta.from_module(name, module) for name, module in (plugin_map or {}).items()}
+
+
 def _find_plugins_dir(start_file: Optional[Path] = None) -> tuple[Optional[Path], Optional[Path]]:
     """
     Try to locate the real <project_root>/plugins directory in a robust way.
@@ -46,25 +95,16 @@ def _find_plugins_dir(start_file: Optional[Path] = None) -> tuple[Optional[Path]
     return None, None
 
 
-def _should_ignore(path: Path) -> bool:
+def _should_ignore(name: str) -> bool:
     """
-    Decide whether a file should be ignored by the loader.
+    Decide whether a module name reported by pkgutil should be ignored by the loader.
     """
-    name = path.name
-    stem = path.stem.lower()
-
-    # Only .py files are considered
-    if path.suffix != ".py":
+    # Ignore __init__ and template (case-insensitive)
+    if name.lower() in IGNORE_STEMS:
         return True
 
-    # Ignore __init__.py and template.py (case-insensitive)
-    if stem in IGNORE_STEMS:
-        return True
-
-    # Skip dunder/hidden and common junk/disabled suffixes
-    if name.startswith("__") or name.startswith("_"):
-        return True
-    if name.endswith((".bak", ".disabled", ".example", ".tmp", "~")):
+    # Skip dunder/hidden modules
+    if name.startswith("_"):
         return True
 
     return False
@@ -97,20 +137,25 @@ def discover_plugins(run_validate: bool = True, verbose: bool = True) -> Dict[st
     if verbose:
         print(f"[Plugin loader] Using plugins dir: {plugin_dir}")
 
-    # Iterate deterministically
-    for file in sorted(plugin_dir.iterdir(), key=lambda p: p.name.lower()):
-        if not file.is_file() or _should_ignore(file):
+    # Iterate deterministically; pkgutil only yields importable module names,
+    # so junk/disabled files (.bak, .disabled, ~, ...) never show up here.
+    infos = sorted(pkgutil.iter_modules([str(plugin_dir)]), key=lambda i: i.name.lower())
+    for info in infos:
+        if info.ispkg or _should_ignore(info.name):
             continue
 
-        plugin_name = file.stem
+        plugin_name = info.name
         module_name = f"plugins.{plugin_name}"
 
-        try:
-            module = importlib.import_module(module_name)
-        except Exception as e:
-            if verbose:
-                print(f"[Plugin import] skip {plugin_name}: {e}")
-            continue
+        # Reuse modules imported by an earlier discovery pass (UI refresh, scan start)
+        module = sys.modules.get(module_name)
+        if module is None:
+            try:
+                module = importlib.import_module(module_name)
+            except Exception as e:
+                if verbose:
+                    print(f"[Plugin import] skip {plugin_name}: {e}")
+                continue
 
         if run_validate and hasattr(module, "validate"):
             try:
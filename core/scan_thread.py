@@ -5,19 +5,66 @@
 
 
 from PyQt5.QtCore import QThread, pyqtSignal
-import os, sys, time, subprocess, threading, signal
+import os, sys, io, codecs, time, subprocess, threading, signal
 import concurrent.futures
 import importlib
 from core.plugin_loader import discover_plugins
 from pathlib import Path
 from core.file_conventions import run_paths
 from datetime import datetime
-from threading import Event, Lock
+from threading import Lock
+
+# (tool x target) jobs run side by side unless the caller asks otherwise;
+# the Settings tab's "Max Concurrent Scans" spin box starts at the same value
+DEFAULT_MAX_WORKERS = 2
+
+# Seconds a cancelled tool gets to exit on SIGTERM before its process group is killed
+_CANCEL_GRACE = 5.0
+# Tool stdout is drained in blocks of up to this many bytes, not line by line
+_READ_CHUNK = 64 * 1024
+
+
+def _signal_tree(proc, force: bool = False):
+    """
+    Stop a tool started by run_command() together with its children. POSIX tools
+    lead their own session, so the whole process group is signalled; on Windows
+    CTRL_BREAK reaches the tool's process group, with kill() as the hard stop.
+    """
+    try:
+        if os.name == "nt":
+            if proc.poll() is not None:
+                return
+            if force:
+                proc.kill()
+            else:
+                proc.send_signal(signal.CTRL_BREAK_EVENT)
+        else:
+            os.killpg(proc.pid, signal.SIGKILL if force else signal.SIGTERM)
+    except ProcessLookupError:
+        pass
+    except Exception:
+        try:
+            proc.kill() if force else proc.terminate()
+        except Exception:
+            pass
+
+
+def _stop_tree(proc):
+    """
+    Ask a tool's process tree to exit, give it _CANCEL_GRACE seconds, then kill it.
+    Returns once the tool itself has exited (a SIGTERM-ignoring tool can't hang the caller).
+    """
+    _signal_tree(proc)
+    try:
+        proc.wait(timeout=_CANCEL_GRACE)
+    except subprocess.TimeoutExpired:
+        _signal_tree(proc, force=True)
+        proc.wait()
 
         
 
 class ScanThread(QThread):
-    log_signal = pyqtSignal(str)
+    log_signal = pyqtSignal(list)       # batches of log lines (see _log)
     finished_signal = pyqtSignal(str)
     progress_signal = pyqtSignal(int)
     status_signal = pyqtSignal(str)
@@ -29,7 +76,8 @@ class ScanThread(QThread):
                 scan_mode="Normal",
                 # --- NEW (optional; safe defaults) ---
                 profile_mode=None,
-                custom_args_map=None):
+                custom_args_map=None,
+                max_workers=None):
         super().__init__()
         self.scan_mode = scan_mode     # storing the scanning mode (kept)
         self.targets = targets
@@ -37,11 +85,17 @@ class ScanThread(QThread):
         self.report_root_folder = report_root_folder
         self.total_tasks = len(targets) * len(tools)
         self.completed_tasks = 0
+        # (tool × target) jobs run side by side; they mostly wait on subprocesses
+        self.max_workers = max(1, min(int(max_workers or DEFAULT_MAX_WORKERS), self.total_tasks or 1))
         self.plugin_map = discover_plugins()
         self.cancel_event = threading.Event()   # <- allows Abort to signal cancellation
-        self._cancel = Event()      # ✅ cooperative cancel flag
+        self._cancel = self.cancel_event        # same flag (older name kept for callers)
         self._procs = set()         # ✅ track live subprocess.Popen objects
         self._procs_lock = Lock()
+        self._last_prog = -1        # last progress value sent to the UI
+        self._log_batch = []        # lines waiting for the next log_signal
+        self._log_lock = Lock()
+        self._log_timer = None
 
 
         # --- NEW: runtime profile + flattened custom args (no impact if not provided) ---
@@ -52,6 +106,44 @@ class ScanThread(QThread):
 
 
 
+    def _log(self, text):
+        """
+        Queue one log line for the UI. Lines leave in batches of up to 64, or
+        50 ms after the first queued line, so tool chatter costs one queued
+        signal per batch instead of one per line. Also handed to plugins as
+        their output callback.
+        """
+        with self._log_lock:
+            self._log_batch.append(text)
+            if len(self._log_batch) < 64:
+                if self._log_timer is None:
+                    self._log_timer = threading.Timer(0.05, self._flush_logs)
+                    self._log_timer.daemon = True
+                    self._log_timer.start()
+                return
+        self._flush_logs()
+
+    def _flush_logs(self):
+        with self._log_lock:
+            batch, self._log_batch = self._log_batch, []
+            timer, self._log_timer = self._log_timer, None
+            if timer is not None:
+                timer.cancel()
+            # emitted under the lock so batches keep their order
+            if batch:
+                self.log_signal.emit(batch)
+
+    def _finish(self, status):
+        """Deliver pending log lines, then report the final status."""
+        self._flush_logs()
+        self.finished_signal.emit(status)
+
+    def _emit_progress(self, value):
+        """Send progress only when it changed (the UI coalesces repaints per frame)."""
+        if value != self._last_prog:
+            self._last_prog = value
+            self.progress_signal.emit(value)
+
     def get_all_tools(self):
         """
         Returns the list of dynamically loaded plugin tools only.
@@ -59,21 +151,29 @@ class ScanThread(QThread):
         return list(self.plugin_map.keys())
 
     def request_cancel(self):
-        # set flag so workers stop asap
-        self._cancel.set()
-        try:
-            # trip the shared event used by run_command() cooperative checks
-            self.cancel_event.set()
-        except Exception:
-            pass
-        # kill any running processes quickly
+        """
+        Cooperative abort: set the cancel flag (queued tools are skipped) and ask
+        every running tool's process group to exit. Its closed stdout ends the
+        read loop in run_command(); groups still alive after a grace period are killed.
+        Never blocks the caller (the GUI thread).
+        """
+        self.cancel_event.set()
         with self._procs_lock:
             procs = list(self._procs)
         for p in procs:
-            try:
-                p.terminate() if os.name == "nt" else p.send_signal(signal.SIGTERM)
-            except Exception:
-                pass
+            _signal_tree(p)
+
+        if procs:
+            def _escalate():
+                for p in procs:
+                    if p.poll() is None:
+                        _signal_tree(p, force=True)
+            t = threading.Timer(_CANCEL_GRACE, _escalate)
+            t.daemon = True
+            t.start()
+
+    # Name used by other Qt-style callers
+    request_abort = request_cancel
 
 
     def run(self):
@@ -86,15 +186,15 @@ class ScanThread(QThread):
         # Prepare for future MCP/AI (folder only; no writes yet)
         #machine_dir = os.path.join(self.report_root_folder, "machine")
         #os.makedirs(machine_dir, exist_ok=True)
-        self.log_signal.emit(f"⚙ Launching tools on {len(self.targets)} target(s)...")
+        self._log(f"⚙ Launching tools on {len(self.targets)} target(s)...")
 
         if self.cancel_event.is_set():
-            self.log_signal.emit("⏹️ Scan aborted before start.")
-            self.finished_signal.emit("done_error")
+            self._log("⏹️ Scan aborted before start.")
+            self._finish("done_error")
             return
         
         import concurrent.futures  # ensure available in scope
-        with concurrent.futures.ThreadPoolExecutor() as executor:
+        with concurrent.futures.ThreadPoolExecutor(max_workers=self.max_workers) as executor:
             futures = []
 
             # 👉 Schedule all (tool × target) jobs
@@ -111,7 +211,7 @@ class ScanThread(QThread):
             if self.cancel_event.is_set():
                 for f in futures:
                     f.cancel()
-                self.log_signal.emit("⏹️ Cancelling remaining tasks…")
+                self._log("⏹️ Cancelling remaining tasks…")
                 try:
                     executor.shutdown(cancel_futures=True)  # Python 3.9+
                 except TypeError:
@@ -122,7 +222,7 @@ class ScanThread(QThread):
                         # best-effort cancel remaining futures
                         for f in futures:
                             f.cancel()
-                        self.log_signal.emit("⏹️ Cancelling remaining tasks…")
+                        self._log("⏹️ Cancelling remaining tasks…")
                         try:
                             executor.shutdown(cancel_futures=True)
                         except TypeError:
@@ -142,16 +242,16 @@ class ScanThread(QThread):
 
                     self.completed_tasks += 1
                     progress_percent = int((self.completed_tasks / self.total_tasks) * 100) if getattr(self, "total_tasks", 0) else 100
-                    self.log_signal.emit(result_msg)
-                    self.progress_signal.emit(progress_percent)
+                    self._log(result_msg)
+                    self._emit_progress(progress_percent)
 
         if self.cancel_event.is_set():
-            self.log_signal.emit("⏹️ Scan aborted by user.")
-            self.finished_signal.emit("done_error")
+            self._log("⏹️ Scan aborted by user.")
+            self._finish("done_error")
             return
         
         # ✅ Emit final status based on error flag
-        self.finished_signal.emit("done_error" if error_occurred else "done_success")
+        self._finish("done_error" if error_occurred else "done_success")
 
 
     # Refactored to handle both raw text and pre-saved paths
@@ -306,9 +406,9 @@ class ScanThread(QThread):
                         raw_template.replace("{{target}}", target).replace("{target}", target)
                     )
 
-                    # Optional: one-line telemetry to the UI, if log_signal exists
+                    # Optional: one-line telemetry to the UI
                     try:
-                        self.log_signal.emit(f"🧩 Using Custom args for {tool}: {raw_template} -> {replaced_args}")
+                        self._log(f"🧩 Using Custom args for {tool}: {raw_template} -> {replaced_args}")
                     except Exception:
                         pass
 
@@ -320,7 +420,7 @@ class ScanThread(QThread):
                         self.check_tool_installed,
                         self.extract_cves,
                         replaced_args,
-                        self.log_signal.emit
+                        self._log
                     )
 
                 # ---------- NON-CUSTOM PROFILES (Aggressive / Normal / Passive): UNCHANGED ----------
@@ -342,7 +442,7 @@ class ScanThread(QThread):
                     self.check_tool_installed,
                     self.extract_cves,
                     replaced_args,
-                    self.log_signal.emit
+                    self._log
                 )
             else:
                 raise Exception(f"Tool '{tool}' is not supported.")
@@ -405,76 +505,65 @@ class ScanThread(QThread):
         aborted = False
         try:
             # Create a new process group so we can terminate the whole tree on cancel.
+            # (start_new_session instead of preexec_fn=os.setsid: tools are launched
+            # from pool threads, and preexec_fn is not safe with threads.)
             creationflags = 0
-            preexec_fn = None
             if os.name == "nt":
                 creationflags = subprocess.CREATE_NEW_PROCESS_GROUP  # type: ignore[attr-defined]
-            else:
-                preexec_fn = os.setsid
 
             with open(out_path, "w", encoding="utf-8") as f:
                 proc = subprocess.Popen(
                     cmd_list,
                     stdout=subprocess.PIPE,
                     stderr=subprocess.STDOUT,
-                    text=True,
-                    bufsize=1,
-                    universal_newlines=True,
                     creationflags=creationflags,
-                    preexec_fn=preexec_fn,
+                    start_new_session=(os.name != "nt"),
                 )
                 # Track live processes for abort
                 with self._procs_lock:
                     self._procs.add(proc)
+                if self.cancel_event.is_set():
+                    # abort landed while this tool was starting (request_cancel's escalation missed it)
+                    _stop_tree(proc)
 
 
                 last_log = time.time()
                 if proc.stdout is not None:
-                    for line in iter(proc.stdout.readline, ""):
-                        f.write(line)
+                    # read1() hands back whatever the pipe holds (one syscall per block);
+                    # decoding stays incremental so split UTF-8 sequences and \r\n survive
+                    decoder = io.IncrementalNewlineDecoder(
+                        codecs.getincrementaldecoder("utf-8")(errors="replace"), translate=True
+                    )
+                    for chunk in iter(lambda: proc.stdout.read1(_READ_CHUNK), b""):
+                        text = decoder.decode(chunk)
+                        f.write(text)
 
-                        # trickle progress to UI (non-spammy)
-                        if output_callback and (time.time() - last_log) > 0.25:
+                        # trickle progress to UI (non-spammy): newest line of the block
+                        if output_callback and text.strip() and (time.time() - last_log) > 0.25:
                             last_log = time.time()
-                            output_callback(line.rstrip())
-
-                        # cooperative cancel
-                        if ( (getattr(self, "cancel_event", None) and self.cancel_event.is_set())
-                             or (getattr(self, "_cancel", None) and self._cancel.is_set()) ):
+                            output_callback(text.rstrip().rsplit("\n", 1)[-1])
 
+                        # cooperative cancel (request_cancel() already signalled the tree)
+                        if self.cancel_event.is_set():
                             aborted = True
-                            # try to terminate the process tree
-                            try:
-                                if os.name == "nt":
-                                    try:
-                                        proc.send_signal(signal.CTRL_BREAK_EVENT)
-                                    except Exception:
-                                        pass
-                                    proc.terminate()
-                                else:
-                                    try:
-                                        os.killpg(os.getpgid(proc.pid), signal.SIGTERM)
-                                    except Exception:
-                                        pass
-                                    proc.terminate()
-                            except Exception as e:
-                                if output_callback:
-                                    output_callback(f"❌ Error running: {command_str}")
-                                    output_callback(str(e))
-                            finally:
-                                # untrack proc
-                                try:
-                                    with self._procs_lock:
-                                        self._procs.discard(proc)
-                                except Exception:
-                                    pass
-
+                            _stop_tree(proc)
                             if output_callback:
                                 output_callback("⏹️ Aborted by user.")
                             break
+                    else:
+                        f.write(decoder.decode(b"", final=True))
 
                 # finalize
-                ret = proc.wait()
+                try:
+                    ret = proc.wait()
+                finally:
+                    with self._procs_lock:
+                        self._procs.discard(proc)
+                if self.cancel_event.is_set() and not aborted:
+                    # the tree was stopped while the tool was silent: stdout closed, loop ended
+                    aborted = True
+                    if output_callback:
+                        output_callback("⏹️ Aborted by user.")
                 if not aborted:
                     if output_callback:
                         output_callback(f"✅ Finished: {command_str} (Exit code: {ret})")
@@ -33,10 +33,13 @@ def is_tool_installed(tool_bin, script_path=None, debug=False):
         # 2. Try running --version or -h to check if it's usable (CLI tools only)
         for flag in ['--version', '-v', '-h', '--help']:
             try:
+                # Output is never read: discard it at the OS level, and give the
+                # tool an empty stdin so nothing can sit waiting for input until the timeout.
                 proc = subprocess.run(
                     [tool_bin, flag],
-                    stdout=subprocess.PIPE,
-                    stderr=subprocess.PIPE,
+                    stdin=subprocess.DEVNULL,
+                    stdout=subprocess.DEVNULL,
+                    stderr=subprocess.DEVNULL,
                     timeout=3
                 )
                 if debug:
@@ -1,17 +1,22 @@
 # ===================== gui/ansi_text_viewer.py =====================
-# A lightweight ANSI-to-HTML QTextEdit for Raw View rendering + search + copy-as-plain
+# A lightweight ANSI-aware QTextEdit for Raw View rendering + search + copy-as-plain
 
 try:
     from PyQt5.QtWidgets import QTextEdit, QApplication as _QApp
-    from PyQt5.QtGui import QTextCursor, QTextDocument
+    from PyQt5.QtGui import (
+        QTextCursor, QTextDocument, QSyntaxHighlighter, QTextCharFormat, QColor, QFont
+    )
     from PyQt5.QtCore import Qt
 except Exception:
     from PySide6.QtWidgets import QTextEdit, QApplication as _QApp
-    from PySide6.QtGui import QTextCursor, QTextDocument
+    from PySide6.QtGui import (
+        QTextCursor, QTextDocument, QSyntaxHighlighter, QTextCharFormat, QColor, QFont
+    )
     from PySide6.QtCore import Qt
 
-import html
 import re
+from bisect import bisect_right
+from functools import lru_cache
 
 ANSI_PATTERN = re.compile(r"\x1b\[([0-9;]*)m")
 
@@ -24,160 +29,198 @@ COLOR_MAP = {
 }
 BG_COLOR_MAP = {k + 10: v for k, v in COLOR_MAP.items() if k < 40} | {k + 10: v for k, v in COLOR_MAP.items() if k >= 90}
 
+ANSI_STRIP = re.compile(r"\x1b\[[0-9;]*m")
+
+def strip_ansi(s: str) -> str:
+    return ANSI_STRIP.sub("", s)
+
+
+def _qt_len(s: str) -> int:
+    """Length of s in UTF-16 code units (the unit QTextDocument positions use)."""
+    return len(s) if s.isascii() else len(s.encode("utf-16-le")) // 2
+
 
-def _ansi_to_html(text: str) -> str:
-    """Convert ANSI SGR sequences to HTML spans. Handles bold, underline, fg/bg colors.
-    Non-essential SGRs are ignored (safe fallback)."""
-    def close_span(state):
-        if state["open"]:
-            state["html"].append("</span>")
-            state["open"] = False
-
-    state = {
-        "bold": False,
-        "underline": False,
-        "italic": False,
-        "fg": None,
-        "bg": None,
-        "open": False,
-        "html": [],
-    }
+def _ansi_spans(text: str):
+    """Parse ANSI SGR sequences once.
 
+    Returns (plain_text, spans) where spans is a sorted list of
+    (start, end, style) over the stripped text and style is the
+    (bold, underline, italic, fg, bg) tuple used by _char_format().
+    """
+    if "\x1b" not in text:
+        return text, []
+
+    plain = []
+    spans = []
+    bold = underline = italic = False
+    fg = bg = None
+    offset = 0
     pos = 0
+
+    def emit(segment):
+        nonlocal offset
+        plain.append(segment)
+        length = _qt_len(segment)
+        if bold or underline or italic or fg or bg:
+            spans.append((offset, offset + length, (bold, underline, italic, fg, bg)))
+        offset += length
+
     for m in ANSI_PATTERN.finditer(text):
-        # emit literal segment (escaped)
         literal = text[pos:m.start()]
         if literal:
-            if not state["open"]:
-                # open with current style if needed
-                style = []
-                if state["bold"]:
-                    style.append("font-weight:bold")
-                if state["underline"]:
-                    style.append("text-decoration:underline")
-                if state["italic"]:
-                    style.append("font-style:italic")
-                if state["fg"]:
-                    style.append(f"color:{state['fg']}")
-                if state["bg"]:
-                    style.append(f"background-color:{state['bg']}")
-                if style:
-                    state["html"].append(f"<span style=\"{' ;'.join(style)}\">")
-                    state["open"] = True
-            state["html"].append(html.escape(literal).replace("\n", "<br>"))
-
-        # parse SGR codes
-        codes = [int(c) if c else 0 for c in m.group(1).split(";") if c != ""]
-        if not codes:
-            codes = [0]
+            emit(literal)
+
+        codes = [int(c) for c in m.group(1).split(";") if c != ""] or [0]
         for code in codes:
             if code == 0:  # reset
-                close_span(state)
-                state.update({"bold": False, "underline": False, "italic": False, "fg": None, "bg": None})
+                bold = underline = italic = False
+                fg = bg = None
             elif code == 1:
-                close_span(state); state["bold"] = True
+                bold = True
             elif code == 3:
-                close_span(state); state["italic"] = True
+                italic = True
             elif code == 4:
-                close_span(state); state["underline"] = True
+                underline = True
             elif 30 <= code <= 37 or 90 <= code <= 97:
-                close_span(state); state["fg"] = COLOR_MAP.get(code)
+                fg = COLOR_MAP.get(code)
             elif 40 <= code <= 47 or 100 <= code <= 107:
-                close_span(state); state["bg"] = BG_COLOR_MAP.get(code)
+                bg = BG_COLOR_MAP.get(code)
             # ignore other SGR codes safely
         pos = m.end()
 
-    # tail
     tail = text[pos:]
     if tail:
-        if not state["open"]:
-            style = []
-            if state["bold"]:
-                style.append("font-weight:bold")
-            if state["underline"]:
-                style.append("text-decoration:underline")
-            if state["italic"]:
-                style.append("font-style:italic")
-            if state["fg"]:
-                style.append(f"color:{state['fg']}")
-            if state["bg"]:
-                style.append(f"background-color:{state['bg']}")
-            if style:
-                state["html"].append(f"<span style=\"{' ;'.join(style)}\">")
-                state["open"] = True
-        state["html"].append(html.escape(tail).replace("\n", "<br>"))
-
-    if state["open"]:
-        state["html"].append("</span>")
-
-    return "".join(state["html"]) or ""
-
-
-ANSI_STRIP = re.compile(r"\x1b\[[0-9;]*m")
-
-def strip_ansi(s: str) -> str:
-    return ANSI_STRIP.sub("", s)
+        emit(tail)
+
+    return "".join(plain), spans
+
+
+@lru_cache(maxsize=1024)
+def _char_format(bold, underline, italic, fg, bg) -> QTextCharFormat:
+    fmt = QTextCharFormat()
+    if bold:
+        fmt.setFontWeight(QFont.Bold)
+    if underline:
+        fmt.setFontUnderline(True)
+    if italic:
+        fmt.setFontItalic(True)
+    if fg:
+        fmt.setForeground(QColor(fg))
+    if bg:
+        fmt.setBackground(QColor(bg))
+    return fmt
+
+
+class _AnsiHighlighter(QSyntaxHighlighter):
+    """Applies pre-parsed ANSI style runs to the plain-text document, block by block."""
+    def __init__(self, document):
+        super().__init__(document)
+        self._spans = []
+        self._ends = []
+
+    def set_spans(self, spans):
+        self._spans = spans
+        self._ends = [end for _, end, _ in spans]
+
+    def highlightBlock(self, text):
+        if not self._spans:
+            return
+        block_start = self.currentBlock().position()
+        block_end = block_start + self.currentBlock().length() - 1
+        i = bisect_right(self._ends, block_start)
+        while i < len(self._spans):
+            start, end, style = self._spans[i]
+            if start >= block_end:
+                break
+            s = max(start, block_start)
+            e = min(end, block_end)
+            if e > s:
+                self.setFormat(s - block_start, e - s, _char_format(*style))
+            i += 1
 
 
 class AnsiTextViewer(QTextEdit):
-    """QTextEdit that renders ANSI-colored text as HTML and supports find/next/prev."""
+    """QTextEdit that renders ANSI-colored text via a syntax highlighter and supports find/next/prev."""
     def __init__(self, parent=None):
         super().__init__(parent)
         self.setReadOnly(True)
+        self.setAcceptRichText(False)
+        font = QFont("Consolas")
+        font.setStyleHint(QFont.Monospace)
+        font.setPixelSize(12)
+        self.document().setDefaultFont(font)
+        self._highlighter = _AnsiHighlighter(self.document())
         self._raw_text = ""
+        self._plain = ""
         self._matches = []
         self._current = -1
+        self._last_find = None   # (term, case_sensitive, matches) of the previous search
+
+        # Find flags are built once; PyQt needs FindFlags(), some bindings FindFlags(0)
+        try:
+            base = QTextDocument.FindFlags()
+        except TypeError:
+            base = QTextDocument.FindFlags(0)
+        self._flags_fwd = base
+        self._flags_fwd_cs = base | QTextDocument.FindCaseSensitively
+        self._flags_back = base | QTextDocument.FindBackward
+        self._flags_back_cs = self._flags_back | QTextDocument.FindCaseSensitively
 
     def set_ansi_text(self, text: str):
         self._raw_text = text or ""
-        html_text = _ansi_to_html(self._raw_text)
-        # wrap in monospace + dark-friendly default
-        html_doc = f"""
-        <html><head><meta charset='utf-8'>
-        <style>
-            body {{ font-family: Consolas, 'Fira Code', monospace; font-size: 12px; }}
-            .highlight {{ background: yellow; color: black; }}
-        </style>
-        </head><body>{html_text}</body></html>
-        """
-        self.setHtml(html_doc)
+        # Plain text + highlighter: no HTML tokenization for potentially huge logs
+        self._plain, spans = _ansi_spans(self._raw_text)
+        self._highlighter.set_spans(spans)
+        self.setPlainText(self._plain)
         self.moveCursor(QTextCursor.Start)
         self._matches.clear(); self._current = -1
+        self._last_find = None
 
     def copy_plain(self):
         # copy stripped ANSI text to clipboard
         cb = _QApp.clipboard() if _QApp.instance() else None
-        plain = strip_ansi(self._raw_text)
+        plain = self._plain
         if cb:
             cb.setText(plain)
         return plain
 
     def find_all(self, term: str, case_sensitive: bool = False):
-        # For now, just navigate to next/prev using built-in find
-        self._matches.clear(); self._current = -1
+        """Index every match of term in the plain text and select the first one.
+        Repeating the same search reuses the previous match list instead of
+        rescanning the whole buffer."""
+        self._matches = []; self._current = -1
         if not term:
+            self._last_find = None
             return 0
-        return self.find_next(term, case_sensitive, reset=True)
 
-    def _new_find_flags(self):
-        """Create a QTextDocument.FindFlags value compatible with PyQt/PySide."""
-        try:
-            return QTextDocument.FindFlags()   # PyQt5 style (callable)
-        except TypeError:
-            return QTextDocument.FindFlags(0)  # fallback if constructor requires int
+        pattern = re.compile(re.escape(term), 0 if case_sensitive else re.IGNORECASE)
+        last = self._last_find
+        if last and last[0] == term and last[1] == case_sensitive:
+            matches = last[2]
+        else:
+            matches = [m.start() for m in pattern.finditer(self._plain)]
+            self._last_find = (term, case_sensitive, matches)
+        self._matches = matches
+
+        if not matches:
+            return 0
+        start = matches[0]
+        end = pattern.match(self._plain, start).end()
+        cursor = QTextCursor(self.document())
+        cursor.setPosition(_qt_len(self._plain[:start]))
+        cursor.setPosition(_qt_len(self._plain[:end]), QTextCursor.KeepAnchor)
+        self.setTextCursor(cursor)
+        self._current = 0
+        return len(matches)
 
     def find_next(self, term: str, case_sensitive: bool = False, reset: bool = False):
         if reset:
             self.moveCursor(QTextCursor.Start)
-        flags = self._new_find_flags()
-        if case_sensitive:
-            flags |= QTextDocument.FindCaseSensitively
+        flags = self._flags_fwd_cs if case_sensitive else self._flags_fwd
         found = self.find(term, flags)
         return 1 if found else 0
 
     def find_prev(self, term: str, case_sensitive: bool = False):
-        flags = QTextDocument.FindBackward
-        if case_sensitive:
-            flags |= QTextDocument.FindCaseSensitively
+        flags = self._flags_back_cs if case_sensitive else self._flags_back
         found = self.find(term, flags)
         return 1 if found else 0
@@ -2,10 +2,23 @@ from PyQt5.QtWidgets import QLabel, QStatusBar,QSizePolicy, QSpacerItem
 from PyQt5.QtCore import Qt, QTimer
 from PyQt5 import QtCore
 import time
-import platform, shutil, subprocess, sys, webbrowser, importlib, os, shlex, threading, queue
-from core.installer_utils import safe_install_tool, compat_try_install_tool, get_plugin_install_meta, has_cmd
+import platform, shutil, subprocess, sys, webbrowser, importlib, os, shlex, threading, queue, selectors
+from core.installer_utils import (safe_install_tool, compat_try_install_tool, get_plugin_install_meta, has_cmd,
+                                  INSTALL_TIMEOUT)
 from pathlib import Path
 from PyQt5.QtWidgets import QDialog, QVBoxLayout, QHBoxLayout, QLabel, QLineEdit, QPushButton, QCheckBox
+from PyQt5.QtGui import QIcon
+from functools import lru_cache
+
+
+# Asset icons are decoded once and shared by every tab (several appear in more than one place)
+@lru_cache(maxsize=64)
+def cached_icon(path: str) -> QIcon:
+    return QIcon(path)
+
+@lru_cache(maxsize=8)
+def cached_pixmap(path: str, w: int, h: int):
+    return cached_icon(path).pixmap(w, h)
 
 
 # Function to create a styled copyright label
@@ -89,6 +102,7 @@ def try_install_tool(command_or_tool, output_func, install_hint=None, install_ur
         install_url=install_url,
         max_attempts=max_attempts,
         run_streamed=_runner,  # preserves your streaming/UX
+        timeout=INSTALL_TIMEOUT,
     )
 
 # --- Live streaming command runner (stdout/stderr line-by-line) ---
@@ -96,6 +110,10 @@ def run_streamed(cmd, output_func, *, shell=False, timeout=None):
     """
     Run a command and stream stdout/stderr to output_func line-by-line.
     cmd: list[str] (preferred) or str (when shell=True)
+
+    The pipe is drained from the calling thread with a selector (no pump thread);
+    Windows pipes are not selectable, so there a pump thread reads while we wait.
+    On timeout the child is killed and reaped before TimeoutExpired is raised.
     """
     if not shell and isinstance(cmd, str):
         cmd = shlex.split(cmd)
@@ -105,20 +123,59 @@ def run_streamed(cmd, output_func, *, shell=False, timeout=None):
         shell=shell,
         stdout=subprocess.PIPE,
         stderr=subprocess.STDOUT,
-        text=True,
-        bufsize=1
+        bufsize=0
     )
 
-    def pump():
-        for line in p.stdout:
-            output_func(line.rstrip("\n"))
+    def emit(raw: bytes):
+        output_func(raw.decode(errors="replace").rstrip("\r"))
+
+    if os.name == "nt":
+        def pump():
+            with p.stdout:
+                for line in p.stdout:
+                    emit(line.rstrip(b"\n"))
+
+        t = threading.Thread(target=pump, daemon=True)
+        t.start()
+        try:
+            rc = p.wait(timeout=timeout)
+        except subprocess.TimeoutExpired:
+            p.kill()
+            p.wait()
+            raise
+        t.join(timeout=1)
+        return rc
+
+    deadline = None if timeout is None else time.monotonic() + timeout
+    fd = p.stdout.fileno()
+    buf = b""
+    sel = selectors.DefaultSelector()
+    sel.register(p.stdout, selectors.EVENT_READ)
+    try:
+        while True:
+            if deadline is not None and time.monotonic() > deadline:
+                p.kill()
+                p.wait()
+                raise subprocess.TimeoutExpired(cmd, timeout)
+            if not sel.select(0.1):
+                # Child gone and nothing readable: a grandchild may still hold the pipe open
+                if p.poll() is not None:
+                    break
+                continue
+            chunk = os.read(fd, 4096)
+            if not chunk:
+                break
+            buf += chunk
+            while b"\n" in buf:
+                line, buf = buf.split(b"\n", 1)
+                emit(line)
+    finally:
+        sel.close()
         p.stdout.close()
 
-    t = threading.Thread(target=pump, daemon=True)
-    t.start()
-    rc = p.wait(timeout=timeout)
-    t.join(timeout=1)
-    return rc
+    if buf:
+        emit(buf)
+    return p.wait()
 
 # --- Sudo Prompt Dialog (Linux) ---
 class SudoPromptDialog(QDialog):
@@ -187,7 +244,7 @@ class ElapsedTicker:
           - QLabel:     ticker uses the provided label directly.
         """
         self._prefix = ""
-        self._start = None
+        self._start_ns = None
         self._timer = QtCore.QTimer()
         self._timer.setInterval(interval_ms)
         self._timer.timeout.connect(self._on_tick)
@@ -217,14 +274,14 @@ class ElapsedTicker:
 
     def start(self, prefix="Working…"):
         self._prefix = prefix
-        self._start = time.monotonic()
+        self._start_ns = time.monotonic_ns()
         self.show_label()
         self._timer.start()
         self._on_tick()
 
     def stop(self, final_note: str = None):
         self._timer.stop()
-        self._start = None          # <- without this, text may keep updating
+        self._start_ns = None       # <- without this, text may keep updating
         if final_note:
             self.label.setText(final_note)
             self.show_label()
@@ -232,9 +289,9 @@ class ElapsedTicker:
             self.hide_label()
 
     def _on_tick(self):
-        if self._start is None:
+        if self._start_ns is None:
             return
-        elapsed = int(time.monotonic() - self._start)
+        elapsed = (time.monotonic_ns() - self._start_ns) // 1_000_000_000
         m, s = divmod(elapsed, 60)
         self.label.setText(f"{self._prefix}  [{m:02d}:{s:02d}]")
 
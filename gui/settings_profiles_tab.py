@@ -7,8 +7,100 @@ from PyQt5.QtWidgets import (
     QScrollArea, QFormLayout, QLabel, QLineEdit, QPlainTextEdit, QSpinBox, QToolButton, QMessageBox,
     QDialog
 )
-from PyQt5.QtCore import Qt, pyqtSignal
-import webbrowser, subprocess, os, json
+from PyQt5.QtCore import Qt, pyqtSignal, pyqtSlot, QTimer, QObject, QRunnable, QThreadPool, QSignalBlocker
+import webbrowser, subprocess, os, json, tempfile
+from collections.abc import Mapping
+from types import MappingProxyType
+from functools import partial, lru_cache
+from core.scan_thread import DEFAULT_MAX_WORKERS
+
+# Optional: native JSON codec for custom profile save/load (stdlib json otherwise)
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+
+# Plugin modules don't change at runtime, so schemas/defaults are computed once per plugin set
+_DEFAULT_SCHEMA = {
+    "args": {
+        "type": "str",
+        "label": "Arguments",
+        "default": ""
+    }
+}
+
+
+@lru_cache(maxsize=4)
+def _schemas_for(plugin_items):
+    """plugin_items: tuple of (name, module) sorted by name. Returned dict is shared; don't mutate."""
+    return {name: getattr(module, "CONFIG_SCHEMA", _DEFAULT_SCHEMA) for name, module in plugin_items}
+
+
+# Interned read-only {"args": ...} records; most (mode, plugin) pairs share a handful of strings
+_ARG_RECORDS = {}
+
+
+@lru_cache(maxsize=4)
+def _default_profiles_for(plugin_items, profile_names):
+    """Build {mode: {plugin: {"args": ...}}}. Returned dict is shared; don't mutate."""
+    profiles = {mode: {} for mode in profile_names}
+    for plugin, module in plugin_items:
+        plugin_args = getattr(module, "DEFAULT_ARGS", {})
+        for mode in profile_names:
+            # Use plugin's default, or blank if not set
+            arg = plugin_args.get(mode, "")
+            profiles[mode][plugin] = _ARG_RECORDS.setdefault(arg, MappingProxyType({"args": arg}))
+    return profiles
+
+
+def _dumps_profile(data) -> bytes:
+    if orjson is not None:
+        return orjson.dumps(data, option=orjson.OPT_INDENT_2)
+    return json.dumps(data, ensure_ascii=False, indent=2).encode("utf-8")
+
+
+def _loads_profile(raw: bytes):
+    if orjson is not None:
+        return orjson.loads(raw)
+    return json.loads(raw.decode("utf-8"))
+
+
+# ---------- Custom profile persistence (off the GUI thread) ----------
+
+class _SaveSignals(QObject):
+    finished = pyqtSignal(bool, str)  # success, error message
+
+
+class _ProfileWriter(QRunnable):
+    """Atomically replace the profile file: write a uniquely named temp file beside it, then os.replace()."""
+    def __init__(self, path, data):
+        super().__init__()
+        self.path = path
+        self.data = data
+        self.signals = _SaveSignals()
+
+    def run(self):
+        tmp = None
+        try:
+            # Unique name per save: two writers in flight never share (or replace) a half-written file
+            fd, tmp = tempfile.mkstemp(
+                dir=os.path.dirname(self.path) or ".",
+                prefix=os.path.basename(self.path) + ".",
+                suffix=".tmp",
+            )
+            with os.fdopen(fd, "wb") as f:
+                f.write(_dumps_profile(self.data))
+            os.replace(tmp, self.path)
+        except Exception as e:
+            if tmp:
+                try:
+                    os.unlink(tmp)
+                except OSError:
+                    pass
+            self.signals.finished.emit(False, str(e))
+            return
+        self.signals.finished.emit(True, "")
 
 
 class ScanProfileSettingsTab(QWidget):
@@ -17,6 +109,9 @@ class ScanProfileSettingsTab(QWidget):
     customProfileSaved  = pyqtSignal(dict)  # flattened: {tool_key: "args"}
     customProfileLoaded = pyqtSignal(dict)  # flattened: {tool_key: "args"}
 
+    ROW_BATCH = 12  # plugin rows built per materialization step
+    LARGE_VALUE_CHARS = 120  # multiline values longer than this get a real text editor
+
     def __init__(self, plugin_map, parent=None):
         super().__init__(parent)
         self.plugin_map = plugin_map   # {plugin_name: plugin_module}
@@ -27,7 +122,8 @@ class ScanProfileSettingsTab(QWidget):
 
         # Custom args store (persists across profile switches)
         # Shape: {plugin: {"args": "..."}}
-        self.custom_args = {plugin: self.profile_configs["Normal"][plugin].copy() for plugin in self.schemas}
+        # Rows start as the shared read-only Normal records and are copied on first write
+        self.custom_args = dict(self.profile_configs["Normal"])
 
         # UI build
         self.init_ui()
@@ -37,27 +133,14 @@ class ScanProfileSettingsTab(QWidget):
 
     # ---------- Helpers: schema & defaults ----------
 
+    def _plugin_items(self):
+        return tuple(sorted(self.plugin_map.items(), key=lambda kv: kv[0]))
+
     def get_plugin_schemas(self):
-        schemas = {}
-        for name, module in self.plugin_map.items():
-            schemas[name] = getattr(module, "CONFIG_SCHEMA", {
-                "args": {
-                    "type": "str",
-                    "label": "Arguments",
-                    "default": ""
-                }
-            })
-        return schemas
+        return dict(_schemas_for(self._plugin_items()))
 
     def build_default_profiles(self):
-        profiles = {mode: {} for mode in self.profiles}
-        for plugin, module in self.plugin_map.items():
-            plugin_args = getattr(module, "DEFAULT_ARGS", {})
-            for mode in self.profiles:
-                # Use plugin's default, or blank if not set
-                arg = plugin_args.get(mode, "")
-                profiles[mode][plugin] = {"args": arg}
-        return profiles
+        return _default_profiles_for(self._plugin_items(), tuple(self.profiles))
 
     # ---------- UI ----------
 
@@ -65,12 +148,18 @@ class ScanProfileSettingsTab(QWidget):
         self.layout = QVBoxLayout(self)
         self.setLayout(self.layout)
 
+        # One sheet for every arg field (matched by object name) instead of one per widget
+        self.setStyleSheet(
+            "QLineEdit#argField, QPlainTextEdit#argField, QSpinBox#argField "
+            "{ border: 2px solid #00d9ff; border-radius: 3px; }"
+        )
+
         # --- Max Concurrent Scans control ---
         concurrency_row = QHBoxLayout()
         concurrency_label = QLabel("⚡ Max Concurrent Scans:")
         self.concurrency_spin = QSpinBox()
         self.concurrency_spin.setRange(1, 8)
-        self.concurrency_spin.setValue(2)  # Default value
+        self.concurrency_spin.setValue(DEFAULT_MAX_WORKERS)  # same default ScanThread uses
         concurrency_row.addWidget(concurrency_label)
         concurrency_row.addWidget(self.concurrency_spin)
         concurrency_row.addStretch()
@@ -88,9 +177,9 @@ class ScanProfileSettingsTab(QWidget):
         self.profile_group = QButtonGroup(self)
         self.profile_radios = {}
         profile_row = QHBoxLayout()
-        for prof in self.profiles:
+        for i, prof in enumerate(self.profiles):
             rb = QRadioButton(prof)
-            self.profile_group.addButton(rb)
+            self.profile_group.addButton(rb, i)  # id == index into self.profiles
             self.profile_radios[prof] = rb
             profile_row.addWidget(rb)
         self.profile_radios['Normal'].setChecked(True)
@@ -101,11 +190,28 @@ class ScanProfileSettingsTab(QWidget):
         self.scroll.setWidgetResizable(True)
         self.scroll_content = QWidget()
         self.tools_area_layout = QFormLayout(self.scroll_content)
+        # Fixed policies: inserting a row doesn't re-decide wrapping/growth for every other row
+        self.tools_area_layout.setFieldGrowthPolicy(QFormLayout.AllNonFixedFieldsGrow)
+        self.tools_area_layout.setRowWrapPolicy(QFormLayout.DontWrapRows)
         self.scroll_content.setLayout(self.tools_area_layout)
         self.scroll.setWidget(self.scroll_content)
         self.layout.addWidget(self.scroll)
 
-        self.tool_fields = {}  # {plugin: {field: widget}}
+        # Rows are materialized in batches as the user scrolls towards them, so
+        # startup cost tracks what is visible rather than the whole plugin set.
+        self.tool_fields = {}  # {plugin: {field: widget}} for rows built so far
+        self._pending_plugins = list(self.schemas)
+        bar = self.scroll.verticalScrollBar()
+        bar.valueChanged.connect(self._materialize_visible_rows)
+        bar.rangeChanged.connect(self._materialize_visible_rows)
+        self._materialize_rows(self.ROW_BATCH)
+
+        # Keystrokes are collected into custom_args once typing pauses
+        self._dirty_fields = {}  # {(plugin, field): widget} edited since last flush
+        self._dirty_timer = QTimer(self)
+        self._dirty_timer.setSingleShot(True)
+        self._dirty_timer.setInterval(120)
+        self._dirty_timer.timeout.connect(self._flush_custom_args)
 
         # Save / Load Custom Profile buttons (shown only in Custom)
         buttons_row = QHBoxLayout()
@@ -130,6 +236,7 @@ class ScanProfileSettingsTab(QWidget):
 
         self.on_profile_change()  # Initial fill
 
+    @pyqtSlot()
     def update_resource_warning(self):
         val = self.concurrency_spin.value()
         if val == 1:
@@ -145,16 +252,24 @@ class ScanProfileSettingsTab(QWidget):
 
     # ---------- Profile switching & field building ----------
 
+    @pyqtSlot()
     def on_profile_change(self):
-        selected = None
-        for prof, rb in self.profile_radios.items():
-            if rb.isChecked():
-                selected = prof
-                break
+        # toggled fires for the radio being unchecked too; only react to the newly checked one
+        sender = self.sender()
+        if sender is not None and not sender.isChecked():
+            return
+
+        checked_id = self.profile_group.checkedId()
+        selected = self.profiles[checked_id] if checked_id >= 0 else None
 
         if getattr(self, "_last_mode_emitted", None) == selected:
             return
         self._last_mode_emitted = selected
+
+        # Don't lose edits still waiting on the debounce timer
+        if self._dirty_timer.isActive():
+            self._dirty_timer.stop()
+            self._flush_custom_args()
         
         self.current_mode = selected
 
@@ -169,91 +284,148 @@ class ScanProfileSettingsTab(QWidget):
         else:
             config = self.profile_configs[selected]
 
-        # Clear and rebuild tool fields
-        for i in reversed(range(self.tools_area_layout.count())):
-            item = self.tools_area_layout.itemAt(i)
-            if item and item.widget():
-                item.widget().deleteLater()
-        self.tool_fields = {}
-
-        # Build all plugin fields with help button (emoji)
-        for plugin, fields in self.schemas.items():
-            self.tool_fields[plugin] = {}
-            plugin_label = QLabel(f"<b>{plugin}</b>")
-            # ORANGE color for tool/plugin name
-            plugin_label.setStyleSheet("color: #ff9900; font-weight: bold; font-size: 15px;")
-            self.tools_area_layout.addRow(plugin_label)
-
-            for field, opts in fields.items():
-                value = config.get(plugin, {}).get(field, opts.get("default", ""))
-
-                # Choose field type
-                if opts["type"] == "str":
-                    w = QPlainTextEdit() if opts.get("multiline") else QLineEdit()
-                    if isinstance(w, QPlainTextEdit):
-                        w.setPlainText(str(value))
-                        w.setFixedHeight(28)
-                    else:
-                        w.setText(str(value))
-                    w.setStyleSheet("""
-                        border: 2px solid #00d9ff;
-                        border-radius: 3px;
-                    """)
-                    # Editable only in Custom
-                    w.setReadOnly(not custom_active)
-                    # Connect change to capture into self.custom_args
-                    if isinstance(w, QLineEdit):
-                        w.textChanged.connect(self.on_any_arg_changed)
-                    else:
-                        w.textChanged.connect(self.on_any_arg_changed)  # QPlainTextEdit has textChanged(str)
-                elif opts["type"] == "int":
-                    w = QSpinBox()
-                    w.setMinimum(0)
-                    w.setMaximum(10000)
-                    w.setValue(int(value) if str(value).isdigit() else opts.get("default", 0))
-                    w.setStyleSheet("""
-                        border: 2px solid #00d9ff;
-                        border-radius: 3px;
-                    """)
-                    w.setReadOnly(not custom_active)
-                    w.valueChanged.connect(self.on_any_arg_changed)
-                else:
-                    w = QLineEdit(str(value))
-                    w.setReadOnly(not custom_active)
-                    w.setStyleSheet("""
-                        border: 2px solid #00d9ff;
-                        border-radius: 3px;
-                    """)
-                    w.textChanged.connect(self.on_any_arg_changed)
-
-                arg_row = QHBoxLayout()
-                arg_label = QLabel(opts.get("label", field))
-                arg_row.addWidget(arg_label)
-                arg_row.addWidget(w)
-
-                # Help Button with Emoji
-                help_btn = QToolButton()
-                help_btn.setText("📝")
-                help_btn.setToolTip("Open docs/help page")
-                plugin_mod = self.plugin_map[plugin]
-                doc_url = getattr(plugin_mod, "INSTALL_URL", "")
-                if not doc_url:
-                    doc_url = f"https://www.google.com/search?q={plugin}+usage"
-                help_btn.clicked.connect(lambda _, url=doc_url: webbrowser.open(url))
-                arg_row.addWidget(help_btn)
-
-                row_widget = QWidget()
-                row_widget.setLayout(arg_row)
-                self.tools_area_layout.addRow(row_widget)
-                self.tool_fields[plugin][field] = w
-
-        # If Custom was selected, auto-load saved profile so fields reflect disk
-        if custom_active:
-            self._apply_custom_args_to_fields(self.custom_args)
+        # Rows are built once; a profile switch only pushes values + edit state.
+        # Updates are suspended so the whole pass costs a single repaint.
+        self.scroll_content.setUpdatesEnabled(False)
+        try:
+            for plugin, fields in self.tool_fields.items():
+                for field, w in fields.items():
+                    opts = self.schemas[plugin][field]
+                    value = config.get(plugin, {}).get(field, opts.get("default", ""))
+                    with QSignalBlocker(w):
+                        self._set_widget_value(w, value, opts)
+                        # Editable only in Custom
+                        w.setReadOnly(not custom_active)
+        finally:
+            self.scroll_content.setUpdatesEnabled(True)
+            self.scroll_content.update()
 
         # Let parent know which profile is active
         self.profileChanged.emit(self.current_mode)
 
+    @pyqtSlot()
+    def _materialize_visible_rows(self):
+        """Build the next batch of rows once the viewport nears the end of what exists."""
+        if not self._pending_plugins:
+            return
+        bar = self.scroll.verticalScrollBar()
+        if bar.maximum() - bar.value() <= bar.pageStep():
+            self._materialize_rows(self.ROW_BATCH)
+
+    def _materialize_rows(self, count):
+        batch, self._pending_plugins = self._pending_plugins[:count], self._pending_plugins[count:]
+        if not batch:
+            return
+        # New rows start out showing whatever profile is active right now
+        custom_active = (self.current_mode == "Custom")
+        config = self.custom_args if custom_active else self.profile_configs[self.current_mode]
+        # One layout pass + repaint per batch instead of one per inserted row
+        self.scroll_content.setUpdatesEnabled(False)
+        try:
+            for plugin in batch:
+                self._build_plugin_rows(plugin, config.get(plugin, {}), custom_active)
+        finally:
+            self.scroll_content.setUpdatesEnabled(True)
+            self.tools_area_layout.activate()
+
+    def _build_plugin_rows(self, plugin, values, editable):
+        """Create the header (name + help) and field rows for one plugin."""
+        self.tool_fields[plugin] = {}
+        plugin_label = QLabel(f"<b>{plugin}</b>")
+        # ORANGE color for tool/plugin name
+        plugin_label.setStyleSheet("color: #ff9900; font-weight: bold; font-size: 15px;")
+
+        # One help button per plugin, on the header row
+        help_btn = QToolButton()
+        help_btn.setText("📝")
+        help_btn.setToolTip("Open docs/help page")
+        plugin_mod = self.plugin_map[plugin]
+        doc_url = getattr(plugin_mod, "INSTALL_URL", "")
+        if not doc_url:
+            doc_url = f"https://www.google.com/search?q={plugin}+usage"
+        help_btn.setProperty("docUrl", doc_url)
+        help_btn.clicked.connect(self._open_help)
+        self.tools_area_layout.addRow(plugin_label, help_btn)
+
+        for field, opts in self.schemas[plugin].items():
+            value = values.get(field, opts.get("default", ""))
+            row = None  # container when the field needs an extra "…" button
+
+            # Choose field type
+            if opts["type"] == "str":
+                # A full QPlainTextEdit (document, layout, undo stack) only pays off
+                # for values that are actually long; otherwise a line edit + expand button.
+                text = str(value)
+                if opts.get("multiline") and ("\n" in text or len(text) > self.LARGE_VALUE_CHARS):
+                    w = QPlainTextEdit()
+                    w.setFixedHeight(28)
+                else:
+                    w = QLineEdit()
+                    if opts.get("multiline"):
+                        expand_btn = QToolButton()
+                        expand_btn.setText("…")
+                        expand_btn.setToolTip("Edit in a larger editor")
+                        expand_btn.clicked.connect(partial(self._expand_field, w, opts.get("label", field)))
+                        row = QWidget()
+                        row_layout = QHBoxLayout(row)
+                        row_layout.setContentsMargins(0, 0, 0, 0)
+                        row_layout.addWidget(w)
+                        row_layout.addWidget(expand_btn)
+                changed = w.textChanged
+            elif opts["type"] == "int":
+                w = QSpinBox()
+                w.setMinimum(0)
+                w.setMaximum(10000)
+                changed = w.valueChanged
+            else:
+                w = QLineEdit()
+                changed = w.textChanged
+            w.setObjectName("argField")
+
+            # Fill before connecting so the initial value doesn't count as an edit
+            self._set_widget_value(w, value, opts)
+            # Editable only in Custom
+            w.setReadOnly(not editable)
+            # Connect change to capture into self.custom_args
+            changed.connect(partial(self._on_field_changed, plugin, field, w))
+
+            self.tools_area_layout.addRow(opts.get("label", field), row or w)
+            self.tool_fields[plugin][field] = w
+
+    def _expand_field(self, line_edit, title, *_):
+        """Open a modal multi-line editor for a line-edit backed multiline field."""
+        dlg = QDialog(self)
+        dlg.setWindowTitle(title)
+        dlg.resize(600, 300)
+        layout = QVBoxLayout(dlg)
+        edit = QPlainTextEdit()
+        edit.setPlainText(line_edit.text())
+        edit.setReadOnly(line_edit.isReadOnly())
+        layout.addWidget(edit)
+        btn = QPushButton("OK")
+        btn.clicked.connect(dlg.accept)
+        layout.addWidget(btn)
+        if dlg.exec_() == QDialog.Accepted and not line_edit.isReadOnly():
+            line_edit.setText(edit.toPlainText())
+
+    @pyqtSlot()
+    def _open_help(self):
+        url = self.sender().property("docUrl")
+        if url:
+            webbrowser.open(url)
+
+    def _set_widget_value(self, w, value, opts):
+        if isinstance(w, QPlainTextEdit):
+            w.setPlainText(str(value))
+        elif isinstance(w, QSpinBox):
+            try:
+                iv = int(value)
+            except (TypeError, ValueError):
+                iv = opts.get("default", 0)
+            w.setValue(iv)
+        else:
+            w.setText(str(value))
+
     # ---------- Tool help ----------
 
     def show_tool_help(self, tool_name):
@@ -307,29 +479,49 @@ class ScanProfileSettingsTab(QWidget):
 
     # ---------- Custom args change tracking ----------
 
+    @pyqtSlot()
     def on_any_arg_changed(self, *_):
+        # Cheap per-keystroke path: the field scan runs once typing pauses
+        self._dirty_timer.start()
+
         # Switch to Custom mode if not already
         if self.current_mode != "Custom":
             self.profile_radios["Custom"].setChecked(True)
             self.current_mode = "Custom"
             self.profileChanged.emit(self.current_mode)
 
-        # Update custom_args with current values from the visible fields
-        for plugin, fields in self.tool_fields.items():
-            for field, widget in fields.items():
-                if isinstance(widget, QLineEdit):
-                    value = widget.text()
-                elif isinstance(widget, QPlainTextEdit):
-                    value = widget.toPlainText()
-                elif isinstance(widget, QSpinBox):
-                    value = widget.value()
-                else:
-                    # Fallback
-                    try:
-                        value = widget.text()
-                    except Exception:
-                        value = ""
-                self.custom_args.setdefault(plugin, {})[field] = value
+    def _on_field_changed(self, plugin, field, widget, *_):
+        # Only the edited widget is remembered; no scan over every field
+        self._dirty_fields[(plugin, field)] = widget
+        self.on_any_arg_changed()
+
+    @pyqtSlot()
+    def _flush_custom_args(self):
+        # Update custom_args with the values of the fields edited since the last flush
+        dirty, self._dirty_fields = self._dirty_fields, {}
+        for (plugin, field), widget in dirty.items():
+            self._custom_row(plugin)[field] = self._read_widget_value(widget)
+
+    def _custom_row(self, plugin):
+        """Writable custom_args entry for plugin (copy-on-write of a shared default record)."""
+        row = self.custom_args.get(plugin)
+        if not isinstance(row, dict):
+            row = dict(row or {})
+            self.custom_args[plugin] = row
+        return row
+
+    def _read_widget_value(self, widget):
+        if isinstance(widget, QLineEdit):
+            return widget.text()
+        if isinstance(widget, QPlainTextEdit):
+            return widget.toPlainText()
+        if isinstance(widget, QSpinBox):
+            return widget.value()
+        # Fallback
+        try:
+            return widget.text()
+        except Exception:
+            return ""
 
     # ---------- Save / Load Custom profile ----------
 
@@ -342,11 +534,13 @@ class ScanProfileSettingsTab(QWidget):
         flat = {}
         for tool, inner in (data or {}).items():
             # only 'args' field participates in runtime commands
-            flat[tool] = (inner.get("args") if isinstance(inner, dict) else "")
+            flat[tool] = (inner.get("args") if isinstance(inner, Mapping) else "")
         return flat
 
     def _apply_custom_args_to_fields(self, data: dict):
         """Push current self.custom_args into visible widgets when Custom is active."""
+        # Programmatic fills must not look like user edits (no _on_field_changed storm)
+        blockers = [QSignalBlocker(w) for fields in self.tool_fields.values() for w in fields.values()]
         for plugin, fields in self.tool_fields.items():
             src = (data or {}).get(plugin, {})
             for field, widget in fields.items():
@@ -360,52 +554,57 @@ class ScanProfileSettingsTab(QWidget):
                         widget.setValue(int(val))
                     except Exception:
                         pass
+        del blockers
 
     def _collect_fields_into_custom(self):
         """Refresh self.custom_args from the visible widgets."""
+        self._dirty_timer.stop()
+        self._dirty_fields.clear()
         for plugin, fields in self.tool_fields.items():
             for field, widget in fields.items():
-                if isinstance(widget, QLineEdit):
-                    value = widget.text()
-                elif isinstance(widget, QPlainTextEdit):
-                    value = widget.toPlainText()
-                elif isinstance(widget, QSpinBox):
-                    value = widget.value()
-                else:
-                    try:
-                        value = widget.text()
-                    except Exception:
-                        value = ""
-                self.custom_args.setdefault(plugin, {})[field] = value
+                self._custom_row(plugin)[field] = self._read_widget_value(widget)
 
     def _load_custom_profile_silent(self):
         """Internal: load if exists, no message boxes."""
         try:
-            with open(self._custom_profile_path(), "r", encoding="utf-8") as f:
-                loaded = json.load(f)
+            with open(self._custom_profile_path(), "rb") as f:
+                loaded = _loads_profile(f.read())
             if isinstance(loaded, dict):
                 # Expect nested shape {tool:{'args':...}}
                 self.custom_args.update(loaded)
         except Exception:
             pass
 
+    @pyqtSlot()
     def save_custom_profile(self):
         """Persist the current Custom arguments to disk and emit a flattened map."""
         # Ensure we capture current on-screen edits before saving
         self._collect_fields_into_custom()
-        try:
-            with open(self._custom_profile_path(), "w", encoding="utf-8") as f:
-                json.dump(self.custom_args, f, ensure_ascii=False, indent=2)
-            QMessageBox.information(self, "Success", "Custom profile saved!")
-            self.customProfileSaved.emit(self._flatten_args(self.custom_args))
-        except Exception as e:
-            QMessageBox.warning(self, "Error", f"Failed to save profile: {e}")
-
+        # Snapshot as plain dicts; the writer runs on the thread pool
+        data = {k: (dict(v) if isinstance(v, Mapping) else v) for k, v in self.custom_args.items()}
+        flat = self._flatten_args(data)
+
+        writer = _ProfileWriter(self._custom_profile_path(), data)
+        self._save_jobs = getattr(self, "_save_jobs", set())
+        self._save_jobs.add(writer)
+
+        def on_finished(success, error):
+            self._save_jobs.discard(writer)
+            if success:
+                QMessageBox.information(self, "Success", "Custom profile saved!")
+                self.customProfileSaved.emit(flat)
+            else:
+                QMessageBox.warning(self, "Error", f"Failed to save profile: {error}")
+
+        writer.signals.finished.connect(on_finished)
+        QThreadPool.globalInstance().start(writer)
+
+    @pyqtSlot()
     def load_custom_profile(self):
         """Load saved Custom arguments from disk into memory and into the visible fields."""
         try:
-            with open(self._custom_profile_path(), "r", encoding="utf-8") as f:
-                loaded = json.load(f)
+            with open(self._custom_profile_path(), "rb") as f:
+                loaded = _loads_profile(f.read())
             if not isinstance(loaded, dict):
                 loaded = {}
         except FileNotFoundError:
@@ -8,35 +8,23 @@ from PyQt5.QtCore import QThread, pyqtSignal
 import os, sys, platform, shutil, subprocess, webbrowser
 from pathlib import Path
 from typing import Callable, Tuple, Optional, List
-from core.installer_utils import safe_install_tool, get_plugin_install_meta, has_cmd, create_docker_shim
+from core.installer_utils import (safe_install_tool, get_plugin_install_meta, has_cmd, create_docker_shim,
+                                  infer_docker_image, invalidate_path_index)
+from core.plugin_loader import PluginMeta
+from core.tools_utils import is_tool_installed
 from gui.common_widgets import ElapsedTicker
 # --------------------------- helper utilities ----------------------------------
 
 from typing import Callable, List, Optional, Tuple
-import os, sys, shutil, subprocess, threading, platform, time
-from collections import deque
+import os, sys, re, json, shutil, signal, subprocess, threading, platform, time, selectors
 
 _INSTALLER_CANCEL_EVENT = threading.Event()
 _INSTALLER_PROCS = set()
 _INSTALLER_PROCS_LOCK = threading.Lock()
-has_cmd_cache = {}
 
-def has_cmd(cmd: str) -> bool:
-    """
-    Check if an executable is available on PATH (Windows-aware).
-    Caches results to avoid repeated lookups.
-    """
-    try:
-        if not isinstance(cmd, str) or not cmd.strip():
-            return False
-        key = cmd.strip().lower()
-        if key in has_cmd_cache:
-            return has_cmd_cache[key]
-        found = shutil.which(cmd) is not None
-        has_cmd_cache[key] = found
-        return found
-    except Exception:
-        return False
+# '\r\n', bare '\r' (progress bars) and '\n' all end a line
+_LINE_SPLIT_RE = re.compile(rb"\r\n?|\n")
+_CR_RE = re.compile(r"\r\n?")
 
 def _emit(output_cb: Callable[[str], None], text: str):
     """
@@ -52,6 +40,177 @@ def _emit(output_cb: Callable[[str], None], text: str):
         # Intentionally swallow to avoid breaking installers on UI errors
         pass
 
+# Seconds a cancelled child gets to exit after SIGTERM/CTRL_BREAK before it is killed
+_CANCEL_GRACE = 5.0
+
+def _terminate_tree(proc, force: bool = False):
+    """
+    Stop a child started by _run_cmd together with everything it spawned
+    (apt -> dpkg, go -> compiler). POSIX children lead their own session, so the
+    whole process group is signalled; on Windows CTRL_BREAK reaches the child's
+    process group (CREATE_NEW_PROCESS_GROUP), with kill() as the hard stop.
+    """
+    try:
+        if os.name == "nt":
+            if proc.poll() is not None:
+                return
+            if force:
+                proc.kill()
+            else:
+                proc.send_signal(signal.CTRL_BREAK_EVENT)
+        else:
+            # The group outlives its leader, so signal it even if proc already exited
+            os.killpg(proc.pid, signal.SIGKILL if force else signal.SIGTERM)
+    except ProcessLookupError:
+        pass
+    except Exception:
+        try:
+            if force:
+                proc.kill()
+            else:
+                proc.terminate()
+        except Exception:
+            pass
+
+class _BatchedEmitter:
+    """
+    Coalesce per-line output: lines are handed to output_cb joined by newlines,
+    at most every max_lines lines or max_interval_ms, whichever comes first.
+    (Each callback is a queued signal to the GUI thread; apt alone prints thousands of lines.)
+    """
+    # One emitter per child process: no per-instance __dict__
+    __slots__ = ("_cb", "_max_lines", "_interval", "_lines", "_timer", "_lock", "_flush_lock")
+
+    def __init__(self, output_cb: Callable[[str], None], max_lines: int = 64, max_interval_ms: int = 50):
+        self._cb = output_cb
+        self._max_lines = max_lines
+        self._interval = max_interval_ms / 1000.0
+        self._lines = []
+        self._timer = None
+        self._lock = threading.Lock()
+        self._flush_lock = threading.Lock()    # keeps batches in order across threads
+
+    def __call__(self, line: str):
+        with self._lock:
+            self._lines.append(line)
+            if len(self._lines) < self._max_lines:
+                if self._timer is None:
+                    self._timer = threading.Timer(self._interval, self.flush)
+                    self._timer.daemon = True
+                    self._timer.start()
+                return
+        self.flush()
+
+    def flush(self):
+        with self._flush_lock:
+            with self._lock:
+                lines, self._lines = self._lines, []
+                timer, self._timer = self._timer, None
+            if timer is not None:
+                timer.cancel()
+            if lines:
+                try:
+                    self._cb("\n".join(lines))
+                except Exception:
+                    # Same policy as _emit: UI errors must not break installers
+                    pass
+
+class _IoPump:
+    """
+    Single thread that drains the stdout of every running child through one
+    selector, instead of one blocking reader thread per process (POSIX only;
+    Windows pipes are not selectable, so _run_cmd keeps a reader thread there).
+
+    A registered pipe belongs to the pump: it is closed by the pump on EOF or
+    after discard(), and on_eof() is called exactly once.
+    """
+    _instance = None
+    _instance_lock = threading.Lock()
+
+    @classmethod
+    def get(cls) -> "_IoPump":
+        with cls._instance_lock:
+            if cls._instance is None:
+                cls._instance = cls()
+            return cls._instance
+
+    def __init__(self):
+        self._sel = selectors.DefaultSelector()
+        self._lock = threading.Lock()
+        self._pending = []                      # ("add" | "discard", pipe, callbacks)
+        self._wake_r, self._wake_w = os.pipe()  # lets add/discard interrupt select()
+        os.set_blocking(self._wake_r, False)
+        self._sel.register(self._wake_r, selectors.EVENT_READ, None)
+        self._thread = threading.Thread(target=self._loop, name="installer-io-pump", daemon=True)
+        self._thread.start()
+
+    def add(self, pipe, on_data: Callable[[bytes], None], on_eof: Callable[[], None]):
+        self._post(("add", pipe, (on_data, on_eof)))
+
+    def discard(self, pipe):
+        self._post(("discard", pipe, None))
+
+    def _post(self, op):
+        with self._lock:
+            self._pending.append(op)
+        try:
+            os.write(self._wake_w, b"\0")
+        except OSError:
+            pass
+
+    def _close(self, pipe, on_eof):
+        try:
+            self._sel.unregister(pipe)
+        except (KeyError, ValueError):
+            pass
+        try:
+            pipe.close()
+        except Exception:
+            pass
+        try:
+            on_eof()
+        except Exception:
+            pass
+
+    def _apply_pending(self):
+        with self._lock:
+            ops, self._pending = self._pending, []
+        for kind, pipe, callbacks in ops:
+            if kind == "add":
+                try:
+                    self._sel.register(pipe, selectors.EVENT_READ, callbacks)
+                except (KeyError, ValueError, OSError):
+                    self._close(pipe, callbacks[1])
+            else:
+                try:
+                    key = self._sel.get_key(pipe)
+                except (KeyError, ValueError):
+                    continue  # already hit EOF
+                self._close(pipe, key.data[1])
+
+    def _loop(self):
+        while True:
+            for key, _ in self._sel.select(timeout=0.5):
+                if key.data is None:
+                    try:
+                        os.read(self._wake_r, 4096)
+                    except OSError:
+                        pass
+                    continue
+                on_data, on_eof = key.data
+                try:
+                    chunk = os.read(key.fd, 65536)
+                except OSError:
+                    chunk = b""
+                if not chunk:
+                    self._close(key.fileobj, on_eof)
+                    continue
+                try:
+                    on_data(chunk)
+                except Exception:
+                    pass
+            self._apply_pending()
+
 def _run_cmd(args: List[str],
              output_cb: Callable[[str], None],
              cwd: Optional[str] = None,
@@ -61,9 +220,11 @@ def _run_cmd(args: List[str],
     Returns (exit_code, combined_output).
 
     Implementation details:
-      - Uses a background reader thread (prevents stdout deadlocks).
+      - Drains stdout off-thread (prevents stdout deadlocks): via the shared
+        _IoPump selector on POSIX, via a reader thread on Windows.
       - Enforces a real timeout (kills the process group on expiry).
-      - Bounds in-memory output with a deque to avoid OOM from chatty tools.
+      - Bounds in-memory output with a capped bytearray to avoid OOM from chatty tools.
+      - Hands output_cb batches of lines (see _BatchedEmitter), not one call per line.
     """
     if not isinstance(args, list) or not args:
         return 2, "runner error: empty args"
@@ -85,16 +246,15 @@ def _run_cmd(args: List[str],
             cwd=cwd,
             stdout=subprocess.PIPE,
             stderr=subprocess.STDOUT,
-            text=True,
-            bufsize=1,
-            universal_newlines=True,
+            bufsize=0,                         # raw pipe: the reader pulls big blocks
             creationflags=_creationflags,      # ← this must be the same name
             start_new_session=(os.name != "nt")
         )
-        # track for cancellation
+        # track for cancellation; request_cancel() sets `wake` so the waiter reacts at once
+        wake = threading.Event()
         try:
             with _INSTALLER_PROCS_LOCK:
-                _INSTALLER_PROCS.add(proc)
+                _INSTALLER_PROCS.add((proc, wake))
         except Exception:
             pass
     except FileNotFoundError:
@@ -102,94 +262,158 @@ def _run_cmd(args: List[str],
     except Exception as e:
         return 1, f"runner error: {e}"
 
-    # Collect output in a bounded buffer (keep last ~4 MB of text)
-    # Assuming avg 120 chars/line -> ~35k lines ~= 4.2 MB
-    max_lines = 35000
-    buf = deque(maxlen=max_lines)
+    # Collect raw output in one bounded buffer (keep the last 4 MiB)
+    cap = 4 * 1024 * 1024
+    buf = bytearray()
 
     done = threading.Event()
+    out = _BatchedEmitter(output_cb)
+    tail = b""
+
+    # Lines are split per block and decoded once each.
+    # '\r' (progress bars) and '\r\n' both end a line.
+    def _feed(chunk: bytes):
+        nonlocal tail
+        buf.extend(chunk)
+        if len(buf) > cap:
+            del buf[:len(buf) - cap]
+        data = tail + chunk
+        # A trailing '\r' may be the first half of '\r\n' split across reads
+        cut = len(data) - 1 if data.endswith(b"\r") else len(data)
+        lines = _LINE_SPLIT_RE.split(data[:cut])
+        tail = lines.pop() + data[cut:]
+        for raw in lines:
+            out(raw.decode("utf-8", "replace"))
+
+    def _finish():
+        nonlocal tail
+        last, tail = tail.rstrip(b"\r"), b""
+        if last:
+            out(last.decode("utf-8", "replace"))
+        done.set()
+        wake.set()
 
     def _reader():
+        # Windows fallback: block reads on the raw fd from a dedicated thread
         try:
             assert proc.stdout is not None
-            for line in iter(proc.stdout.readline, ''):
-                # Guard against None or binary glitches
-                line = line.replace("\r\n", "\n").replace("\r", "\n")
-                parts = line.split("\n")
-                for p in parts:
-                    if p == "" and line.endswith("\n") and parts.index(p) == len(parts)-1:
-                        # trailing newline -> skip empty
-                        continue
-                    buf.append(p)
-                    _emit(output_cb, p)
+            fd = proc.stdout.fileno()
+            while True:
+                chunk = os.read(fd, 65536)
+                if not chunk:
+                    break
+                _feed(chunk)
         except Exception as _e:
             # If reading fails, we still rely on timeout/return code
             pass
         finally:
-            done.set()
+            _finish()
 
-    t = threading.Thread(target=_reader, daemon=True)
-    t.start()
+    pump = None
+    t = None
+    if os.name != "nt":
+        pump = _IoPump.get()
+        pump.add(proc.stdout, _feed, _finish)
+    else:
+        t = threading.Thread(target=_reader, daemon=True)
+        t.start()
 
     start = time.time()
     code = None
     try:
-        if timeout:
-            # Wait until either reader finishes and process exits OR timeout fires
-            while True:
-                if proc.poll() is not None and done.is_set():
-                    break
-                if (time.time() - start) > timeout:
-                    # Kill the process and break
-                    try:
-                        proc.kill()
-                    except Exception:
-                        pass
+        # Sleep until something happens (EOF, cancel) or the timeout runs out;
+        # state is checked once per wakeup instead of polling every 50 ms.
+        while True:
+            remaining = None
+            if timeout:
+                remaining = timeout - (time.time() - start)
+                if remaining <= 0:
+                    # Kill the process group and break
+                    _terminate_tree(proc, force=True)
                     code = 124
                     break
-                                # cooperative cancel from UI
+
+            # cooperative cancel from UI
+            if _INSTALLER_CANCEL_EVENT.is_set():
+                _terminate_tree(proc)
+                code = 130  # standard "terminated" style
+                break
+
+            if done.is_set():
+                # Output closed: the process is exiting; still bounded by the timeout
                 try:
-                    if _INSTALLER_CANCEL_EVENT.is_set():
-                        try:
-                            proc.terminate()
-                        except Exception:
-                            pass
-                        code = 130  # standard "terminated" style
-                        break
-                except Exception:
-                    pass
+                    code = proc.wait(timeout=remaining)
+                except subprocess.TimeoutExpired:
+                    _terminate_tree(proc, force=True)
+                    code = 124
+                break
 
-                time.sleep(0.05)
-        # If we didn't timeout above, wait for process to exit cleanly
-        if code is None:
-            code = proc.wait()
+            wake.wait(remaining)
     finally:
         # unregister from cancel tracking
         try:
             with _INSTALLER_PROCS_LOCK:
-                _INSTALLER_PROCS.discard(proc)
+                _INSTALLER_PROCS.discard((proc, wake))
         except Exception:
             pass  
-        # Ensure reader terminates
-        try:
-            if proc.stdout:
-                try:
-                    proc.stdout.close()
-                except Exception:
-                    pass
-        except Exception:
-            pass
-        done.set()
-        t.join(timeout=1.0)
+        # Ensure reader terminates (the pump closes the pipes it owns)
+        if pump is not None:
+            pump.discard(proc.stdout)
+            done.wait(timeout=1.0)
+        else:
+            try:
+                if proc.stdout:
+                    try:
+                        proc.stdout.close()
+                    except Exception:
+                        pass
+            except Exception:
+                pass
+            t.join(timeout=1.0)
+        out.flush()
 
-    combined = "\n".join(buf).strip()
+    combined = _CR_RE.sub("\n", buf.decode("utf-8", "replace")).strip()
     if code == 124:
         return 124, "command timed out"
     return code, combined
 
-def _is_linux():   return platform.system().lower() == "linux"
-def _is_macos():   return platform.system().lower() == "darwin"
-def _is_windows(): return platform.system().lower() == "windows"
+def _run_silent(args: List[str], timeout: Optional[int] = 15) -> Tuple[int, str]:
+    """
+    Run a command whose output nobody reads (probes, shim checks).
+    Same (exit_code, output) contract as _run_cmd, but output is discarded at the
+    OS level: no reader thread, no buffer, just fork/exec/wait.
+    """
+    try:
+        proc = subprocess.run(
+            args,
+            stdin=subprocess.DEVNULL,
+            stdout=subprocess.DEVNULL,
+            stderr=subprocess.DEVNULL,
+            timeout=timeout,
+            check=False,
+        )
+    except FileNotFoundError:
+        return 127, f"command not found: {args[0]}"
+    except subprocess.TimeoutExpired:
+        return 124, "command timed out"
+    except Exception as e:
+        return 1, f"runner error: {e}"
+    return proc.returncode, ""
+
+# Host OS, resolved once at import (platform.system() may shell out to uname)
+_SYS = platform.system().lower()
+_IS_LINUX   = _SYS == "linux"
+_IS_MACOS   = _SYS == "darwin"
+_IS_WINDOWS = _SYS == "windows"
+
+# Effective uid is fixed for the process lifetime; probe it once
+try:
+    _IS_ROOT = os.geteuid() == 0
+    _HAS_GETEUID = True
+except Exception:
+    # No geteuid (Windows), or it failed in a restricted environment
+    _IS_ROOT = False
+    _HAS_GETEUID = False
 
 
 # ----------------------------- package helpers ---------------------------------
@@ -203,42 +427,49 @@ def _pipx_install(tool: str, output_cb: Callable[[str], None]) -> Tuple[bool, st
         return True, out or "OK"
     return False, out or "pipx install failed"
 
-def _apt_install(pkg: str, output_cb: Callable[[str], None]) -> Tuple[bool, str]:
-    """Do not attempt elevation here. If not root, return a clear instruction."""
+def _apt_install_many(pkgs: List[str], output_cb: Callable[[str], None]) -> Tuple[bool, str]:
+    """Do not attempt elevation here. If not root, return a clear instruction.
+    All packages go through one update + one install (single dependency resolution)."""
     if not has_cmd("apt-get"):
         return False, "apt-get not found on this system"
-    if hasattr(os, "geteuid"):
-        try:
-            if os.geteuid() != 0:
-                return False, f"Requires root. Try: sudo apt-get update && sudo apt-get install -y {pkg}"
-        except Exception:
-            # On some restricted environments geteuid might fail; proceed without forcing root message.
-            pass
+    names = " ".join(pkgs)
+    # If geteuid is unavailable/failed, proceed without forcing the root message.
+    if _HAS_GETEUID and not _IS_ROOT:
+        return False, f"Requires root. Try: sudo apt-get update && sudo apt-get install -y {names}"
     code_u, out_u = _run_cmd(["apt-get", "update"], output_cb)
     if code_u != 0:
         return False, out_u or "apt-get update failed"
-    code_i, out_i = _run_cmd(["apt-get", "install", "-y", pkg], output_cb)
+    code_i, out_i = _run_cmd(["apt-get", "install", "-y", *pkgs], output_cb)
     if code_i == 0:
         return True, out_i or "OK"
     return False, out_i or "apt-get install failed"
 
-def _brew_install(pkg: str, output_cb: Callable[[str], None]) -> Tuple[bool, str]:
+def _apt_install(pkg: str, output_cb: Callable[[str], None]) -> Tuple[bool, str]:
+    return _apt_install_many([pkg], output_cb)
+
+def _brew_install_many(pkgs: List[str], output_cb: Callable[[str], None]) -> Tuple[bool, str]:
     if not has_cmd("brew"):
         return False, "Homebrew not found. See https://brew.sh/"
-    code, out = _run_cmd(["brew", "install", pkg], output_cb)
+    code, out = _run_cmd(["brew", "install", *pkgs], output_cb)
     if code == 0:
         return True, out or "OK"
     return False, out or "brew install failed"
 
-def _choco_install(pkg: str, output_cb: Callable[[str], None]) -> Tuple[bool, str]:
+def _brew_install(pkg: str, output_cb: Callable[[str], None]) -> Tuple[bool, str]:
+    return _brew_install_many([pkg], output_cb)
+
+def _choco_install_many(pkgs: List[str], output_cb: Callable[[str], None]) -> Tuple[bool, str]:
     """Windows: Chocolatey is common. If missing, give a clear hint."""
     if not has_cmd("choco"):
         return False, "Chocolatey not found. Install from https://chocolatey.org/install"
-    code, out = _run_cmd(["choco", "install", pkg, "-y", "--no-progress"], output_cb)
+    code, out = _run_cmd(["choco", "install", *pkgs, "-y", "--no-progress"], output_cb)
     if code == 0:
         return True, out or "OK"
     return False, out or "choco install failed"
 
+def _choco_install(pkg: str, output_cb: Callable[[str], None]) -> Tuple[bool, str]:
+    return _choco_install_many([pkg], output_cb)
+
 def _go_install(module: str, output_cb: Callable[[str], None]) -> Tuple[bool, str]:
     if not has_cmd("go"):
         return False, "Go toolchain not found"
@@ -249,12 +480,27 @@ def _go_install(module: str, output_cb: Callable[[str], None]) -> Tuple[bool, st
     return False, out or "go install failed"
 
 
+# Install-hint dispatch, built once at import.
+# Native installers take (package_or_module, output_cb); "go" is given INSTALL_URL when set.
+_NATIVE_INSTALLERS = {
+    "apt": _apt_install,
+    "brew": _brew_install,
+    "choco": _choco_install,
+    "pip": _pipx_install,
+    "go": _go_install,
+}
+_BATCH_INSTALLERS = {"apt": _apt_install_many, "brew": _brew_install_many, "choco": _choco_install_many}
+_SERIAL_HINTS = frozenset({"apt", "brew", "choco", "docker", "git", "manual", ""})
+_PARALLEL_HINTS = frozenset({"pip", "go"})  # safe-only; do not assume _git_install exists
+
+
 # ---------------------------- safe installer callback --------------------------
 
 def try_install_tool_func(tool: str,
                           output_cb: Callable[[str], None],
                           install_hint: str = "",
-                          install_url: str = "") -> Tuple[bool, str]:
+                          install_url: str = "",
+                          cancel_event: Optional[threading.Event] = None) -> Tuple[bool, str]:
     """
     Hardened installer used by ToolInstallWorker.
 
@@ -266,7 +512,12 @@ def try_install_tool_func(tool: str,
       - Never elevates privileges automatically
       - Emits live output via output_cb
       - PEP 668 friendly (does not 'pip install' into system Python)
+      - Returns at once if cancel_event (default: the installer cancel event) is set;
+        a running child is stopped by _run_cmd when the event fires
     """
+    if (cancel_event or _INSTALLER_CANCEL_EVENT).is_set():
+        return False, "cancelled"
+
     hint = (install_hint or "").strip().lower()
     url  = (install_url or "").strip()
 
@@ -275,15 +526,15 @@ def try_install_tool_func(tool: str,
         return True, f"OK: {tool} already present on PATH"
 
     # 1) Route by OS + hint
-    if hint == "apt" and _is_linux():
+    if hint == "apt" and _IS_LINUX:
         ok, msg = _apt_install(tool, output_cb)
         return ok, msg
 
-    if hint == "brew" and _is_macos():
+    if hint == "brew" and _IS_MACOS:
         ok, msg = _brew_install(tool, output_cb)
         return ok, msg
 
-    if hint == "choco" and _is_windows():
+    if hint == "choco" and _IS_WINDOWS:
         ok, msg = _choco_install(tool, output_cb)
         return ok, msg
 
@@ -320,19 +571,86 @@ def try_install_tool_func(tool: str,
         return False, "Run via Docker (configure a TOOL_ALIAS shim in your plugin so ReconCraft can call it)."
 
     # 2) Fallback guidance per platform
-    if _is_linux():
+    if _IS_LINUX:
         return False, (f"Unknown install method '{hint}'. "
                        f"Try your package manager, e.g.: sudo apt-get install -y {tool}")
-    if _is_macos():
+    if _IS_MACOS:
         return False, (f"Unknown install method '{hint}'. "
                        f"Try: brew install {tool}")
-    if _is_windows():
+    if _IS_WINDOWS:
         return False, (f"Unknown install method '{hint}'. "
                        f"Try: choco install {tool} -y")
 
     return False, "Unsupported OS or missing install hint"
 
 
+# ------------------------------- worker helpers --------------------------------
+
+def _sudo_warmup_if_needed(jobs, output_emit: Callable[[str], None], sudo_prompt=None):
+    """
+    Pre-cache sudo on Linux if any apt job will run and we are not root.
+    jobs: per-plugin metadata dicts (only their "hint" is read).
+    sudo_prompt: zero-arg callable returning a password, asked at most once.
+    """
+    try:
+        # Linux only; if any apt job; and not root
+        if not _IS_LINUX:
+            return
+        if not any(m["hint"] == "apt" for m in jobs):
+            return
+        if _IS_ROOT:
+            return
+
+        if not callable(sudo_prompt):
+            output_emit("⚠️  apt installs may require sudo but no sudo_prompt is configured.")
+            return
+
+        pw = sudo_prompt()  # prompt once
+        if not pw:
+            output_emit("⚠️  Skipping sudo warm-up (no password entered). apt may fail.")
+            return
+
+        # validate & cache sudo for this session (-v). Feed through stdin to avoid TTY prompt.
+        proc = subprocess.run(
+            ["sudo", "-S", "-v"],
+            input=(pw + "\n").encode("utf-8"),
+            stdout=subprocess.PIPE,
+            stderr=subprocess.PIPE,
+        )
+        if proc.returncode == 0:
+            output_emit("🔑 Sudo cached for apt operations.")
+        else:
+            output_emit("⚠️  Sudo warm-up failed; apt may fail. You can retry with correct password.")
+    except Exception as e:
+        output_emit(f"⚠️  Sudo warm-up error: {e!r}")
+
+def _verify_docker_shim(shim_path, alias_name: str) -> bool:
+    """
+    Try running a new docker shim to ensure it actually works ('--version', then '-h').
+    Output is not needed, so this uses _run_silent (rc only).
+    """
+    try:
+        candidates = []
+        try:
+            if shim_path:
+                sp = str(shim_path)
+                candidates.append([sp, "--version"])
+                candidates.append([sp, "-h"])
+        except Exception:
+            pass
+        if alias_name:
+            candidates.append([alias_name, "--version"])
+            candidates.append([alias_name, "-h"])
+
+        for cmd in candidates:
+            rc, _out = _run_silent(cmd, timeout=15)
+            if rc == 0:
+                return True
+        return False
+    except Exception:
+        return False
+
+
 # ------------------------------- worker class ----------------------------------
 
 from PyQt5.QtCore import QThread, pyqtSignal
@@ -352,99 +670,49 @@ class ToolInstallWorker(QThread):
     finished = pyqtSignal(bool)       # ✅ success flag (True=all installed, False=some failed)
     missing  = pyqtSignal(list)       # ✅ still-missing plugin names
 
-    def __init__(self, missing_plugins, plugins):
+    def __init__(self, missing_plugins, plugins, plugin_metas=None):
         """
         :param missing_plugins: list[str] plugin module names to install
         :param plugins: dict[str, module] mapping plugin name -> imported module
+        :param plugin_metas: optional dict[str, PluginMeta] built at plugin load time
         """
         super().__init__()
         self.to_install = list(missing_plugins or [])
         self.plugins = plugins or {}
-
-    # === PATCH A: helpers inside ToolInstallWorker ===
-    def _sudo_warmup_if_needed(self, planned_jobs):
-        """
-        Pre-cache sudo on Linux if any apt job will run and we are not root.
-        Uses self.sudo_prompt() once if available. No change to installer helpers.
-        """
-        try:
-            if os.name != "posix":
-                return
-            # any apt job planned?
-            needs_apt = any((j.get("INSTALL_HINT") == "apt") for j in planned_jobs)
-            if not needs_apt:
-                return
-            # root?
-            if hasattr(os, "geteuid") and os.geteuid() == 0:
-                return
-
-            if not hasattr(self, "sudo_prompt") or not callable(self.sudo_prompt):
-                # We cannot warm-up; apt may still prompt/ fail silently
-                self.output.emit("⚠️  apt installs may require sudo but no sudo_prompt is configured.")
-                return
-
-            pw = self.sudo_prompt()  # prompt once
-            if not pw:
-                self.output.emit("⚠️  Skipping sudo warm-up (no password entered). apt may fail.")
-                return
-
-            # validate & cache sudo for this session (-v). Feed through stdin to avoid TTY prompt.
-            proc = subprocess.run(
-                ["sudo", "-S", "-v"],
-                input=(pw + "\n").encode("utf-8"),
-                stdout=subprocess.PIPE,
-                stderr=subprocess.PIPE,
-            )
-            if proc.returncode == 0:
-                self.output.emit("🔑 Sudo cached for apt operations.")
-            else:
-                self.output.emit("⚠️  Sudo warm-up failed; apt may fail. You can retry with correct password.")
-        except Exception as e:
-            self.output.emit(f"⚠️  Sudo warm-up error: {e!r}")
-
-    def _verify_docker_shim(self, alias_name: str):
-        """
-        Quick one-shot check that the docker shim actually runs.
-        We try '<alias> --version' or '-h' without breaking flow.
-        """
-        import subprocess, shutil
-        try:
-            exe = shutil.which(alias_name) or alias_name
-            # try --version then -h
-            for args in (["--version"], ["-h"]):
-                p = subprocess.run([exe] + args, stdout=subprocess.PIPE, stderr=subprocess.PIPE)
-                if p.returncode == 0:
-                    return True
-            return False
-        except Exception:
-            return False
+        self.plugin_metas = plugin_metas or {}
 
     #Improved Cancel Support
     def request_cancel(self):
         """
-        Signal the installer to cancel; terminate any running child processes.
+        Signal the installer to cancel; terminate any running child processes
+        (and their process groups), killing them if still alive after a grace period.
+        Also raises Qt's interruption flag, so isInterruptionRequested() agrees.
         """
         try:
             _INSTALLER_CANCEL_EVENT.set()
         except Exception:
             pass
-        # best-effort terminate whatever is running
+        QThread.requestInterruption(self)
+        # best-effort terminate whatever is running, and wake its waiter
         with _INSTALLER_PROCS_LOCK:
             procs = list(_INSTALLER_PROCS)
-        for proc in procs:
-            try:
-                if os.name == "nt":
-                    try:
-                        proc.terminate()
-                    except Exception:
-                        pass
-                else:
-                    try:
-                        proc.terminate()
-                    except Exception:
-                        pass
-            except Exception:
-                pass
+        for proc, wake in procs:
+            _terminate_tree(proc)
+            wake.set()
+
+        if procs:
+            def _escalate():
+                for proc, _wake in procs:
+                    # an exited (reaped) child's pid/pgid may already belong to another process
+                    if proc.poll() is None:
+                        _terminate_tree(proc, force=True)
+            t = threading.Timer(_CANCEL_GRACE, _escalate)
+            t.daemon = True
+            t.start()
+
+    def requestInterruption(self):
+        """Qt's cancel pathway: same effect as request_cancel()."""
+        self.request_cancel()
 
     # ---------- main loop ----------
     def run(self):
@@ -474,105 +742,161 @@ class ToolInstallWorker(QThread):
                 self.finished.emit(True)
                 return
 
-            # ---------------- helpers (local) ----------------
-            def _sudo_warmup_if_needed(jobs):
-                try:
-                    import os, subprocess
-                    # Linux only; if any apt job; and not root
-                    if os.name != "posix":
-                        return
-                    if not any(((getattr(self.plugins.get(pn), "INSTALL_HINT", "") or "").strip().lower() == "apt") for pn in jobs):
-                        return
-                    if hasattr(os, "geteuid") and os.geteuid() == 0:
-                        return
-
-                    if not hasattr(self, "sudo_prompt") or not callable(self.sudo_prompt):
-                        self.output.emit("⚠️  apt installs may require sudo but no sudo_prompt is configured.")
-                        return
-
-                    pw = self.sudo_prompt()  # prompt once
-                    if not pw:
-                        self.output.emit("⚠️  Skipping sudo warm-up (no password entered). apt may fail.")
-                        return
-
-                    proc = subprocess.run(
-                        ["sudo", "-S", "-v"],
-                        input=(pw + "\n").encode("utf-8"),
-                        stdout=subprocess.PIPE,
-                        stderr=subprocess.PIPE,
-                    )
-                    if proc.returncode == 0:
-                        self.output.emit("🔑 Sudo cached for apt operations.")
-                    else:
-                        self.output.emit("⚠️  Sudo warm-up failed; apt may fail. You can retry with correct password.")
-                except Exception as e:
-                    self.output.emit(f"⚠️  Sudo warm-up error: {e!r}")
-
-            def _verify_docker_shim(shim_path, alias_name):
-                """
-                Try running the new shim to ensure it actually works.
-                Uses module-level _run_cmd which returns (rc, out).
-                """
-                try:
-                    candidates = []
-                    try:
-                        if shim_path:
-                            sp = str(shim_path)
-                            candidates.append([sp, "--version"])
-                            candidates.append([sp, "-h"])
-                    except Exception:
-                        pass
-                    if alias_name:
-                        candidates.append([alias_name, "--version"])
-                        candidates.append([alias_name, "-h"])
-
-                    for cmd in candidates:
-                        rc, _out = _run_cmd(cmd, self.output.emit, timeout=15)
-                        if rc == 0:
-                            return True
-                    return False
-                except Exception:
-                    return False
-
-            # Partition hints for limited parallelism (avoid assuming new helpers)
-            def _hint_of(pn):
+            # Normalized plugin metadata, read once per plugin for the whole run
+            def _meta_of(pn):
                 pl = self.plugins.get(pn)
-                return (getattr(pl, "INSTALL_HINT", "manual") or "manual").strip().lower()
-
-            serial_set   = {"apt", "brew", "choco", "docker", "git", "manual", ""}
-            parallel_set = {"pip", "go"}  # safe-only; do not assume _git_install exists
+                pm = self.plugin_metas.get(pn) or PluginMeta.from_module(pn, pl)
+                return {
+                    "plugin": pl,
+                    "hint": pm.hint,
+                    "tool": pm.required,
+                    "url": pm.url,
+                    "alias": pm.alias,
+                    # names to probe on PATH; alias usually equals tool, so probe it once
+                    "names": tuple(dict.fromkeys(n for n in (pm.alias, pm.required) if n)),
+                    "docker_run": pm.docker_run,
+                    "image": infer_docker_image(pm.docker_run) if pm.docker_run else None,
+                }
+
+            def _present(m):
+                return any(has_cmd(n) for n in m["names"])
+
+            meta = {pn: _meta_of(pn) for pn in to_install}
+
+            # Warm start: everything may already be on PATH (one index sweep answers it)
+            if all(m["plugin"] and _present(m) for m in meta.values()):
+                self.output.emit("🎉 All tools are already installed.")
+                self.status.emit("✅ Nothing to install.")
+                self.progress.emit(100)
+                self.missing.emit([])
+                self.finished.emit(True)
+                return
 
-            serial_items   = [pn for pn in to_install if _hint_of(pn) in serial_set]
-            parallel_items = [pn for pn in to_install if _hint_of(pn) in parallel_set]
+            # Partition hints for limited parallelism (avoid assuming new helpers)
+            serial_items, parallel_items = [], []
+            for pn in to_install:
+                h = meta[pn]["hint"]
+                if h in _PARALLEL_HINTS:
+                    parallel_items.append(pn)
+                elif h in _SERIAL_HINTS:
+                    serial_items.append(pn)
 
             total = len(to_install)
             done_count = 0
+            last_pct = -1
+
+            def _progress():
+                # Only whole-percent changes reach the progress bar
+                nonlocal last_pct
+                pct = int(100 * done_count / total)
+                if pct != last_pct:
+                    last_pct = pct
+                    self.progress.emit(pct)
 
             # Warm up sudo once if needed
-            _sudo_warmup_if_needed(to_install)
+            _sudo_warmup_if_needed(meta.values(), self.output.emit, getattr(self, "sudo_prompt", None))
+
+            # --------------- batched package-manager installs ---------------
+            # One apt/brew/choco invocation per manager instead of one per plugin.
+            batches = {}
+            for pn in serial_items:
+                m = meta[pn]
+                if m["plugin"] and m["hint"] in _BATCH_INSTALLERS:
+                    batches.setdefault(m["hint"], []).append(pn)
+
+            handled = set()
+            for hint, names in batches.items():
+                if _INSTALLER_CANCEL_EVENT.is_set():
+                    break
+                pending = []
+                for pn in names:
+                    m = meta[pn]
+                    if _present(m):
+                        self.output.emit(f"✅ {pn} already available as '{m['alias'] or m['tool']}'.")
+                        handled.add(pn)
+                        done_count += 1
+                        _progress()
+                    else:
+                        pending.append(pn)
+                if not pending:
+                    continue
+
+                pkgs = list(dict.fromkeys(meta[pn]["tool"] for pn in pending))
+                self.status.emit(f"⚙ Installing {len(pending)} {hint} package(s)…")
+                self.output.emit(f"🔽 method: {hint} ({' '.join(pkgs)})")
+                ok, msg = _BATCH_INSTALLERS[hint](pkgs, self.output.emit)
+                invalidate_path_index()
+
+                for pn in pending:
+                    m = meta[pn]
+                    if _present(m):
+                        self.output.emit(f"✅ {pn} installed ({m['alias'] or m['tool']}).")
+                    elif not ok and len(pending) > 1:
+                        # One bad package can fail the whole batch; retry the rest one by one below
+                        continue
+                    else:
+                        self.output.emit(f"❌ {pn} failed: {msg}")
+                        if m["url"]:
+                            self.output.emit(f"   ↳ Refer: {m['url']}")
+                        still_missing.append(pn)
+                    handled.add(pn)
+                    done_count += 1
+                    _progress()
+
+            serial_items = [pn for pn in serial_items if pn not in handled]
+
+            import concurrent.futures
+
+            # --------------- docker image pulls (parallel fetch phase) ---------------
+            # Pulls are network-bound and independent; shim creation + verification
+            # stays in the serial loop below, in plugin order.
+            pulled = set()
+            images = []
+            if has_cmd("docker"):
+                for pn in serial_items:
+                    m = meta[pn]
+                    if m["plugin"] and m["hint"] == "docker" and m["docker_run"] and not _present(m):
+                        image = m["image"]
+                        if image and image not in images:
+                            images.append(image)
+
+            def _pull(image):
+                if _INSTALLER_CANCEL_EVENT.is_set():
+                    return None
+                self.output.emit(f"🐳 docker pull {image}")
+                try:
+                    _run_cmd(["docker", "pull", image], self.output.emit)
+                except Exception:
+                    pass
+                return image
+
+            if images:
+                with concurrent.futures.ThreadPoolExecutor(max_workers=min(16, max(4, len(images)))) as ex:
+                    for fut in concurrent.futures.as_completed([ex.submit(_pull, im) for im in images]):
+                        if _INSTALLER_CANCEL_EVENT.is_set():
+                            ex.shutdown(wait=False, cancel_futures=True)
+                        if not fut.cancelled() and fut.result():
+                            pulled.add(fut.result())
 
             # Core installer for one plugin (reuses your existing helpers/flow)
-            def _install_one(plugin_name):
-                plugin = self.plugins.get(plugin_name)
-                if not plugin:
+            def _install_one(plugin_name, m):
+                if _INSTALLER_CANCEL_EVENT.is_set():
+                    return False, "cancelled"
+                if not m["plugin"]:
                     self.output.emit(f"⚠️ Plugin '{plugin_name}' not found; skipping.")
                     return False, "plugin not found"
 
-                required_tool = getattr(plugin, "REQUIRED_TOOL", plugin_name)
-                install_hint  = (getattr(plugin, "INSTALL_HINT", "manual") or "manual").strip().lower()
-                install_url   = getattr(plugin, "INSTALL_URL", "") or ""
-                alias_name    = (
-                    getattr(plugin, "TOOL_ALIAS", "").strip()
-                    or getattr(plugin, "EXECUTABLE", "").strip()
-                    or required_tool
-                )
-                docker_run    = getattr(plugin, "DOCKER_RUN", "") or ""
+                required_tool = m["tool"]
+                install_hint  = m["hint"]
+                install_url   = m["url"]
+                alias_name    = m["alias"]
+                docker_run    = m["docker_run"]
 
                 self.status.emit(f"⚙ Installing {plugin_name}…")
                 self.output.emit(f"🔽 method: {install_hint}")
 
                 # Already present?
-                if has_cmd(alias_name) or has_cmd(required_tool):
+                if _present(m):
                     self.output.emit(f"✅ {plugin_name} already available as '{alias_name or required_tool}'.")
                     return True, "already present"
 
@@ -585,13 +909,9 @@ class ToolInstallWorker(QThread):
                     elif not docker_run:
                         ok, msg = False, "Plugin missing DOCKER_RUN."
                     else:
-                        # Best-effort: infer image from docker_run and pull it
-                        image = None
-                        for t in reversed(docker_run.split()):
-                            if "/" in t or ":" in t:
-                                image = t
-                                break
-                        if image:
+                        # Pull now unless the fetch phase already did
+                        image = m["image"]
+                        if image and image not in pulled:
                             self.output.emit(f"🐳 docker pull {image}")
                             try:
                                 _rc, _ = _run_cmd(["docker", "pull", image], self.output.emit)
@@ -610,27 +930,21 @@ class ToolInstallWorker(QThread):
                         else:
                             msg = "Failed to create shim"
 
-                # ---- apt / brew / choco / pip / go / git / manual ----
-                elif install_hint == "apt":
-                    ok, msg = _apt_install(required_tool, self.output.emit)
-                elif install_hint == "brew":
-                    ok, msg = _brew_install(required_tool, self.output.emit)
-                elif install_hint == "choco":
-                    ok, msg = _choco_install(required_tool, self.output.emit)
-                elif install_hint == "pip":
-                    ok, msg = _pipx_install(required_tool, self.output.emit)
-                elif install_hint == "go":
-                    mod = getattr(plugin, "INSTALL_URL", "") or required_tool
-                    ok, msg = _go_install(mod, self.output.emit)
+                # ---- apt / brew / choco / pip / go ----
+                elif install_hint in _NATIVE_INSTALLERS:
+                    target = (install_url or required_tool) if install_hint == "go" else required_tool
+                    ok, msg = _NATIVE_INSTALLERS[install_hint](target, self.output.emit)
 
+                # ---- git / manual ----
                 elif install_hint == "git":
                     # Keep your previous behavior (manual)
                     ok, msg = False, f"Manual git build required: {install_url or 'no URL provided'}"
                 else:  # manual or unknown
                     ok, msg = False, f"Manual install: {install_url or required_tool}"
 
-                # Verify installation result
-                path_ok = (has_cmd(alias_name) or has_cmd(required_tool))
+                # Verify installation result against a fresh PATH scan
+                invalidate_path_index()
+                path_ok = _present(m)
 
                 if ok and path_ok:
                     self.output.emit(f"✅ {plugin_name} installed ({alias_name or required_tool}).")
@@ -644,25 +958,38 @@ class ToolInstallWorker(QThread):
 
             # --------------- run serial jobs ---------------
             for pn in serial_items:
-                ok, _msg = _install_one(pn)
+                ok, _msg = _install_one(pn, meta[pn])
                 if not ok:
                     still_missing.append(pn)
                 done_count += 1
-                self.progress.emit(int(100 * done_count / total))
+                _progress()
 
             # --------------- run parallel-safe jobs (pip/go) ---------------
             if parallel_items:
                 self.output.emit(f"🧵 Running {len(parallel_items)} parallel installs (pip/go)...")
-                import concurrent.futures
-                with concurrent.futures.ThreadPoolExecutor(max_workers=min(4, len(parallel_items))) as ex:
-                    futmap = {ex.submit(_install_one, pn): pn for pn in parallel_items}
+                # pipx/go installs are download-bound, so allow more than a CPU-sized pool
+                with concurrent.futures.ThreadPoolExecutor(max_workers=min(16, max(4, len(parallel_items)))) as ex:
+                    # Plugins sharing a package (same method + module/tool) install it once
+                    futmap = {}
+                    by_pkg = {}
+                    for pn in parallel_items:
+                        m = meta[pn]
+                        # same target _install_one installs: go uses INSTALL_URL, pip the package name
+                        key = (m["hint"], (m["url"] or m["tool"]) if m["hint"] == "go" else m["tool"])
+                        if key in by_pkg:
+                            by_pkg[key].append(pn)
+                        else:
+                            by_pkg[key] = futmap[ex.submit(_install_one, pn, m)] = [pn]
                     for fut in concurrent.futures.as_completed(futmap):
-                        pn = futmap[fut]
-                        ok, _msg = fut.result()
-                        if not ok:
-                            still_missing.append(pn)
-                        done_count += 1
-                        self.progress.emit(int(100 * done_count / total))
+                        if _INSTALLER_CANCEL_EVENT.is_set():
+                            # Drop queued installs; running ones see the cancel in _run_cmd
+                            ex.shutdown(wait=False, cancel_futures=True)
+                        ok = (not fut.cancelled()) and fut.result()[0]
+                        for pn in futmap[fut]:
+                            if not ok:
+                                still_missing.append(pn)
+                            done_count += 1
+                        _progress()
 
             # Ensure progress bar completes visually
             self.progress.emit(100)
@@ -688,6 +1015,43 @@ class ToolInstallWorker(QThread):
             self.finished.emit(False)
 
 
+# On-disk cache of tool-check results: PATH probes rarely change between launches
+_STATUS_CACHE_FILE = Path.home() / ".cache" / "reconcraft" / "tool_status.json"
+_STATUS_CACHE_TTL = 24 * 3600   # seconds
+
+def _status_key(runtime_name, script_path=None) -> str:
+    """Cache key for one probe: a SCRIPT_PATH changes what _check_script() answers."""
+    return f"{runtime_name}|{script_path or ''}"
+
+def _path_fingerprint() -> str:
+    """PATH plus the newest mtime of its directories (adding/removing a tool bumps it)."""
+    path = os.environ.get("PATH", "")
+    newest = 0
+    for d in path.split(os.pathsep):
+        try:
+            newest = max(newest, os.stat(d).st_mtime_ns)
+        except OSError:
+            pass
+    return f"{newest}|{path}"
+
+def _load_status_cache() -> dict:
+    try:
+        with open(_STATUS_CACHE_FILE, "r", encoding="utf-8") as f:
+            data = json.load(f)
+        return data if isinstance(data, dict) else {}
+    except Exception:
+        return {}
+
+def _save_status_cache(data: dict):
+    try:
+        _STATUS_CACHE_FILE.parent.mkdir(parents=True, exist_ok=True)
+        tmp = _STATUS_CACHE_FILE.with_suffix(".tmp")
+        with open(tmp, "w", encoding="utf-8") as f:
+            json.dump(data, f)
+        os.replace(tmp, _STATUS_CACHE_FILE)
+    except Exception:
+        pass  # cache is an optimization only
+
 # ToolCheckWorker checks if required tools are installed.
 class ToolCheckWorker(QThread):
     progress = pyqtSignal(int)        # For progress bar
@@ -695,36 +1059,128 @@ class ToolCheckWorker(QThread):
     output = pyqtSignal(str)          # For output console
     finished = pyqtSignal(list)       # Emit missing tools at end
 
-    def __init__(self, plugins, is_tool_installed_func):
+    def __init__(self, plugins, plugin_metas=None):
         super().__init__()
         self.plugins = plugins
-        self.is_tool_installed = is_tool_installed_func
+        self.plugin_metas = plugin_metas or {}
+
+    @staticmethod
+    def clear_cache():
+        """Forget persisted tool-check results (next check probes everything)."""
+        try:
+            _STATUS_CACHE_FILE.unlink()
+        except FileNotFoundError:
+            pass
+        except Exception:
+            pass
+
+    def _meta(self, plugin_name, plugin_module) -> PluginMeta:
+        # runtime name is alias -> executable -> required tool (resolved once in PluginMeta)
+        return self.plugin_metas.get(plugin_name) or PluginMeta.from_module(plugin_name, plugin_module)
+
+    @staticmethod
+    def _check_script(runtime_name, script_path) -> bool:
+        """
+        Fallback for script-based plugins whose tool is not on PATH: is_tool_installed
+        may start --version/-h probes, so run() calls this from a thread pool.
+        """
+        try:
+            return bool(is_tool_installed(runtime_name, script_path))
+        except Exception:
+            return False
 
     def run(self):
-        total = len(self.plugins)
+        names = list(self.plugins)
+        total = len(names)
+        results = {}    # plugin name -> (runtime name, found, script path)
+
+        # The per-plugin lines go to the console as one block at the end; while
+        # checking, status text is throttled (~20 Hz) and progress moves on whole percents.
+        last_status = 0.0
+        last_pct = -1
+
+        def _report(plugin_name, runtime_name, found, script_path=None):
+            nonlocal last_status, last_pct
+            results[plugin_name] = (runtime_name, found, script_path)
+            now_m = time.monotonic()
+            if now_m - last_status >= 0.05:
+                last_status = now_m
+                self.status.emit(f"Checking {plugin_name}...")
+            pct = int(100 * len(results) / total)
+            if pct != last_pct:
+                last_pct = pct
+                self.progress.emit(pct)
+
+        # Snapshot PATH for this run; the index is rebuilt on first lookup
+        invalidate_path_index()
+
+        # Cached results are valid while PATH (and its directories) are unchanged and within TTL.
+        # Read on the worker thread: the file can sit on a slow home directory.
+        fingerprint = _path_fingerprint()
+        cache = _load_status_cache()
+        entries = cache.get("entries", {}) if cache.get("fingerprint") == fingerprint else {}
+        now = time.time()
+
+        todo = []
+        for name in names:
+            pm = self._meta(name, self.plugins[name])
+            hit = entries.get(_status_key(pm.alias, pm.script))
+            # A SCRIPT_PATH can appear without touching PATH, so only its positives are trusted
+            if hit and now - hit[1] < _STATUS_CACHE_TTL and (hit[0] or not pm.script):
+                _report(name, pm.alias, bool(hit[0]), pm.script)
+            else:
+                todo.append((name, pm.alias, pm.script))
+
+        if todo:
+            # Several plugins can share one tool (e.g. nmap): probe each name once per run.
+            # PATH index lookups are dict hits and stay inline; only the SCRIPT_PATH
+            # fallbacks start subprocesses, so those go to a thread pool.
+            by_tool = {}
+            for name, runtime_name, script_path in todo:
+                by_tool.setdefault((runtime_name, script_path), []).append(name)
+
+            def _record(runtime_name, script_path, found):
+                if found or not script_path:
+                    entries[_status_key(runtime_name, script_path)] = [found, now]
+                for plugin_name in by_tool[(runtime_name, script_path)]:
+                    _report(plugin_name, runtime_name, found, script_path)
+
+            scripted = []
+            for runtime_name, script_path in by_tool:
+                if has_cmd(runtime_name):
+                    _record(runtime_name, script_path, True)
+                elif script_path:
+                    scripted.append((runtime_name, script_path))
+                else:
+                    _record(runtime_name, script_path, False)
+
+            if scripted:
+                import concurrent.futures
+                with concurrent.futures.ThreadPoolExecutor(max_workers=min(8, len(scripted))) as ex:
+                    futmap = {ex.submit(self._check_script, *key): key for key in scripted}
+                    for fut in concurrent.futures.as_completed(futmap):
+                        _record(*futmap[fut], fut.result())
+            _save_status_cache({"fingerprint": fingerprint, "entries": entries})
+
+        # report in plugin order regardless of completion order
+        lines = []
         missing_tools = []
-        for i, (plugin_name, plugin_module) in enumerate(self.plugins.items()):
-            
-            # prefer alias -> executable -> required tool
-            runtime_name = (
-                getattr(plugin_module, "TOOL_ALIAS", "").strip()
-                or getattr(plugin_module, "EXECUTABLE", "").strip()
-                or getattr(plugin_module, "REQUIRED_TOOL", plugin_name)
-            )
-
-            if shutil.which(runtime_name) is None:
+        for plugin_name in names:
+            runtime_name, found, script_path = results[plugin_name]
+            if found:
+                lines.append(f"✅ {plugin_name}: '{runtime_name}' found.")
+            elif script_path:
+                lines.append(f"❌ {plugin_name}: '{runtime_name}' not found on PATH or at SCRIPT_PATH '{script_path}'.")
                 missing_tools.append(plugin_name)
-                self.output.emit(f"❌ {plugin_name}: '{runtime_name}' not found on PATH.")
             else:
-                self.output.emit(f"✅ {plugin_name}: '{runtime_name}' found.")
-
-            self.status.emit(f"Checking {plugin_name}...")
-            self.progress.emit(int(100 * (i + 1) / total))
+                lines.append(f"❌ {plugin_name}: '{runtime_name}' not found on PATH.")
+                missing_tools.append(plugin_name)
 
         if missing_tools:
-            self.output.emit("\n⚠️ Missing: " + ", ".join(missing_tools))
+            lines.append("\n⚠️ Missing: " + ", ".join(missing_tools))
         else:
-            self.output.emit("\n🎉 All dynamically loaded tools are installed!")
+            lines.append("\n🎉 All dynamically loaded tools are installed!")
+        self.output.emit("\n".join(lines))
 
         self.status.emit("Check Tools Complete.")
         self.finished.emit(missing_tools)
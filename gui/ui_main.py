@@ -9,21 +9,22 @@ try:
         QLineEdit, QLabel, QCheckBox, QListWidget, QGroupBox, QHBoxLayout,
         QToolButton, QProgressBar, QGridLayout, QListWidgetItem, QTreeWidget,
         QTreeWidgetItem, QFileDialog, QTableWidget, QSplitter,QSizePolicy, QSpacerItem,
-        QMenu, QAction, QMessageBox, QToolButton
-
+        QMenu, QAction, QMessageBox, QPlainTextEdit
     )
-    from PyQt5.QtCore import Qt, pyqtSignal, QUrl, QSize, QObject, pyqtSignal, Qt, QEventLoop, QTimer
-    from PyQt5.QtGui import QIcon, QDesktopServices
+    from PyQt5.QtCore import Qt, pyqtSignal, QUrl, QSize, QObject, QEventLoop, QTimer, QThread, QSignalBlocker
+    from PyQt5.QtGui import QIcon, QDesktopServices, QPalette, QColor
+    from PyQt5.QtWidgets import QApplication
     QT_BINDING = "PyQt5"
 except Exception:
     from PySide6.QtWidgets import (
         QMainWindow, QWidget, QTabWidget, QVBoxLayout, QPushButton, QTextEdit,
         QLineEdit, QLabel, QCheckBox, QListWidget, QGroupBox, QHBoxLayout,
         QToolButton, QProgressBar, QGridLayout, QListWidgetItem, QTreeWidget,
-        QTreeWidgetItem, QFileDialog
+        QTreeWidgetItem, QFileDialog, QPlainTextEdit
     )
-    from PySide6.QtCore import Qt, Signal as pyqtSignal, QUrl, QSize
-    from PySide6.QtGui import QIcon, QDesktopServices
+    from PySide6.QtCore import Qt, Signal as pyqtSignal, QUrl, QSize, QThread, QSignalBlocker
+    from PySide6.QtGui import QIcon, QDesktopServices, QPalette, QColor
+    from PySide6.QtWidgets import QApplication
     QT_BINDING = "PySide6"
 
 # === Standard library =========================================================
@@ -31,6 +32,7 @@ import os
 import sys
 import re
 import csv
+import time
 import json
 import shutil
 import platform
@@ -39,9 +41,6 @@ import webbrowser
 import ipaddress, traceback
 from urllib.parse import urlparse
 from pathlib import Path
-from datetime import datetime
-from PyQt5.QtWidgets import QTreeWidgetItem
-from PyQt5.QtCore import Qt
 
 # === Optional third-party =====================================================
 try:
@@ -52,23 +51,206 @@ except ImportError:
 # === Project imports ==========================================================
 from core.scan_thread import ScanThread
 from core.cvss_calc import CVSSCalcTab
-from core.tools_utils import is_tool_installed
-from core.plugin_loader import discover_plugins
+from core.plugin_loader import discover_plugins, build_plugin_metas
 from core.report_model import load_run_model
 from core.report_exporter import (export_csv, export_html, export_pdf, export_json, export_copy_raw,
     export_raw_to_html,export_findings_csv,export_findings_json
 )
-from core.installer_utils import get_plugin_install_meta, has_cmd
+from core.installer_utils import get_plugin_install_meta, has_cmd, invalidate_path_index
 
 from gui.flow_layout import FlowLayout
 from gui.settings_profiles_tab import ScanProfileSettingsTab
-from gui.common_widgets import try_install_tool, get_copyright_label, ElapsedTicker,SudoPromptDialog
+from gui.common_widgets import (try_install_tool, get_copyright_label, ElapsedTicker, SudoPromptDialog,
+                                cached_icon, cached_pixmap)
 from gui.tool_worker import ToolCheckWorker, ToolInstallWorker
 from gui.ansi_text_viewer import AnsiTextViewer, strip_ansi
 
 import importlib.util  # keep last; rarely used and isolated
 
 
+# Theme colours live in a QPalette (a constant-cost swap); the one stylesheet below only
+# carries what a palette cannot express (tab shape, padding, fonts) and reads its colours,
+# borders included, from palette roles. Switching themes therefore never re-parses QSS.
+_THEME_COLORS = {
+    #          window     text       base       alt-base   button     button-text mid(border) dark(btn border) midlight(hover)
+    "dark":   ("#1e1e1e", "#ffffff", "#252526", "#2d2d2d", "#3a3f44", "#ffffff", "#444444", "#555555", "#50575e"),
+    "hacker": ("#000000", "#00ff00", "#000000", "#010101", "#001100", "#00ff00", "#00ff00", "#00ff00", "#004d00"),
+    "light":  ("#f0f0f0", "#000000", "#ffffff", "#e0e0e0", "#e0e0e0", "#000000", "#cccccc", "#999999", "#d0d0d0"),
+}
+
+_theme_palettes = {}
+
+def _theme_palette(theme: str) -> QPalette:
+    """Palette for a theme, built once on first use (needs a QApplication)."""
+    pal = _theme_palettes.get(theme)
+    if pal is None:
+        (window, text, base, alt_base, button, button_text,
+         mid, dark, midlight) = (QColor(c) for c in _THEME_COLORS[theme])
+        pal = QPalette()
+        pal.setColor(QPalette.Window, window)
+        pal.setColor(QPalette.WindowText, text)
+        pal.setColor(QPalette.Base, base)
+        pal.setColor(QPalette.AlternateBase, alt_base)
+        pal.setColor(QPalette.Text, text)
+        pal.setColor(QPalette.Button, button)
+        pal.setColor(QPalette.ButtonText, button_text)
+        pal.setColor(QPalette.ToolTipBase, base)
+        pal.setColor(QPalette.ToolTipText, text)
+        pal.setColor(QPalette.Mid, mid)
+        pal.setColor(QPalette.Dark, dark)
+        pal.setColor(QPalette.Midlight, midlight)
+        _theme_palettes[theme] = pal
+    return pal
+
+
+_THEME_QSS = """
+    QTabWidget::pane {
+        border: 1px solid palette(mid);
+        background: palette(alternate-base);
+    }
+    QTabBar::tab {
+        background: palette(window);
+        padding: 8px;
+        min-width: 110px;
+        max-width: 110px;
+        border: 1px solid palette(mid);
+        border-bottom: none;
+        border-top-left-radius: 4px;
+        border-top-right-radius: 4px;
+        margin-right: 1px;
+    }
+    QTabBar::tab:selected {
+        background: palette(button);
+        font-weight: bold;
+    }
+    QTabBar::tab:hover {
+        background: palette(midlight);
+    }
+    QLabel, QCheckBox, QPushButton, QListWidget, QLineEdit, QTextEdit {
+        font-size: 14px;
+    }
+    QScrollArea {
+        background-color: palette(alternate-base);
+        border: 1px solid palette(mid);
+        border-radius: 6px;
+    }
+    QPushButton {
+        background-color: palette(button);
+        border: 1px solid palette(dark);
+        padding: 6px;
+        border-radius: 5px;
+    }
+    QPushButton:hover {
+        background-color: palette(midlight);
+    }
+    QLineEdit, QTextEdit, QListWidget {
+        background-color: palette(base);
+        border: 1px solid palette(mid);
+        border-radius: 3px;
+        padding: 4px;
+    }
+"""
+
+# Theme toggle cycles dark -> light -> hacker -> dark; the button names the next theme
+_NEXT_THEME = {"dark": "light", "light": "hacker", "hacker": "dark"}
+_THEME_BUTTON_TEXT = {
+    "dark": "☀ Switch to Light Theme",
+    "light": "💻 Switch to Hackuuuurr Theme",
+    "hacker": "🌙 Switch to Dark Theme",
+}
+
+
+# Dashboard stat cards: set once on the dashboard tab, matched by object name
+_STATS_GROUP_QSS = """
+    QGroupBox#statcard {
+        border: 2px solid #00d9ff;
+        border-radius: 8px;
+        margin-top: 6px;
+        padding: 6px;
+        font-weight: bold;
+        color: #00d9ff;
+    }
+    QGroupBox#statcard QLabel {
+        color: #ffffff;
+        font-size: 15px;
+        margin-left: 4px;
+    }
+"""
+
+# Dashboard metrics: (card title, ReconCraftUI attribute holding its value label)
+_METRICS = (
+    ("🧮 Total Scans Run", "total_scans_label"),
+    ("🕵️‍♂️ Last Target", "last_target_label"),
+    ("🧰 Tools Used", "last_tools_label"),
+    ("🕒 Last Scan Time", "last_time_label"),
+    ("✅ Status", "last_status_label"),
+    ("📁 Last Report", "last_report_label"),
+)
+
+# Scan progress bar; only the chunk colour differs per state
+_PB_TMPL = """
+    QProgressBar {
+        border: 1px solid #444;
+        border-radius: 5px;
+        text-align: center;
+        background-color: #111;
+        color: #ffffff;
+        font-weight: bold;
+        font-size: 14px;
+    }
+    QProgressBar::chunk {
+        background-color: %s;
+    }
+"""
+
+# ScanThread status -> (status label text, progress bar stylesheet)
+_SCAN_STATUS_VIEW = {
+    status: (text, _PB_TMPL % color)
+    for status, text, color in (
+        ("indeterminate", "Status: Initializing...", "#00d9ff"),                 # blue: scan start
+        ("done_success", "Status: ✅ Scan completed successfully.", "#00c853"),  # green
+        ("done_error", "Status: ❌ Scan completed with some errors.", "#d32f2f"), # red
+    )
+}
+
+# Dashboard "Status" card text per ScanThread final status
+_DASHBOARD_STATUS = {
+    "done_success": "✅ Successful",
+    "done_error": "⚠️ Completed with errors",
+}
+
+
+# Output console: history cap (lines) and the flush cadence of the buffered log.
+# A flush that writes more than _LOG_BUSY_LINES doubles the interval (up to the max),
+# so a flooding scan paints a few large inserts instead of saturating the event loop.
+_CONSOLE_MAX_LINES = 5000
+_LOG_FLUSH_MS = 100
+_LOG_FLUSH_MAX_MS = 800
+_LOG_BUSY_LINES = 200
+
+
+def _set_if_changed(label, text: str):
+    """setText only when the text differs (setText always re-lays out the label)."""
+    if label.text() != text:
+        label.setText(text)
+
+
+# Characters replaced with "_" when a target names its scan folder
+_SAFE_TARGET_RE = re.compile(r"[^\w.-]")
+
+# Target parsing (compiled once, used for every scan launch)
+_TARGET_SPLIT_RE = re.compile(r"[,\n]+")
+_WHITESPACE_RE = re.compile(r"\s+")
+# Anything outside [A-Za-z0-9._:/-]: dots, dashes, underscores, colon (for :port), slash (for CIDR/URL remnants)
+_TARGET_SPECIAL_RE = re.compile(r"[^A-Za-z0-9._:/-]")
+# Domain names (simple & safe)
+_DOMAIN_RE = re.compile(
+    r"^(?=.{1,253}$)(?:[A-Za-z0-9](?:[A-Za-z0-9-]{0,61}[A-Za-z0-9])?\.)+[A-Za-z]{2,}$"
+)
+# Lines accepted from an uploaded target file
+_UPLOAD_TARGET_RE = re.compile(r"^[a-zA-Z0-9\-._:,]+$")
+
+
 # This is the main UI class for the ReconCraft application
 class ReconCraftUI(QMainWindow):
     
@@ -119,12 +301,13 @@ class ReconCraftUI(QMainWindow):
         if shims.exists():
             os.environ["PATH"] = str(shims) + os.pathsep + os.environ.get("PATH", "")
 
-        # DEFAULT THEME DARK
+        # DEFAULT THEME DARK (component stylesheet is set once; themes swap palettes)
+        self.setStyleSheet(_THEME_QSS)
         self.theme_mode = "dark"
         self.set_dark_theme()
 
         # Set the custom window icon
-        self.setWindowIcon(QIcon("assets/reconcraft_icon.png"))
+        self.setWindowIcon(cached_icon("assets/reconcraft_icon.png"))
 
         self.tool_container_layout = QVBoxLayout()
         self.plugins = {}
@@ -133,9 +316,17 @@ class ReconCraftUI(QMainWindow):
         self.setCentralWidget(self.tabs)
         self.init_dashboard_tab()           # call to initialize the dashboard tab
         self.init_scan_tab()                # call to initialize the scan tab
-        self.init_settings_tab(self.plugin_map)   # call to initialize the settings tab   
-        self.init_reports_tab()             # call to initialize the reports tab
-        self.init_cvss_tab()                # call to initialize the CVSS Calculator tab
+
+        # Settings, Reports and CVSS are built on first visit (placeholder tabs until then)
+        self._tab_builders = {}
+        self._add_lazy_tab(lambda index: self.init_settings_tab(self.plugin_map, index),
+                           "assets/settings.jpg", "Settings",
+                           "⚙️ Settings – Customize ReconCraft preferences")
+        self._add_lazy_tab(self.init_reports_tab, "assets/report.png", "Reports",
+                           "📊 Reports – View generated scan reports")
+        self._add_lazy_tab(self.init_cvss_tab, "assets/cvss_icon.png", "CVSS Calc.",
+                           "CVSS Calculator")
+        self.tabs.currentChanged.connect(self._lazy_build_tab)
 
         self.refresh_plugins()  # Refreshing plugins on startup
   
@@ -161,16 +352,85 @@ class ReconCraftUI(QMainWindow):
             pass
         return result["v"]
     
+    # Lazy tabs: a cheap placeholder holds the slot until the user opens it
+    def _add_lazy_tab(self, builder, icon_path, text, tooltip):
+        placeholder = QWidget()
+        index = self.tabs.addTab(placeholder, cached_icon(icon_path), text)
+        self.tabs.setTabToolTip(index, tooltip)
+        self._tab_builders[placeholder] = builder
+
+    def _lazy_build_tab(self, index):
+        placeholder = self.tabs.widget(index)
+        builder = self._tab_builders.pop(placeholder, None)
+        if builder is None:
+            return
+        with QSignalBlocker(self.tabs):
+            self.tabs.removeTab(index)
+            builder(index)               # inserts the real tab at the same position
+            self.tabs.setCurrentIndex(index)
+        placeholder.deleteLater()
+
     # Initialize the CVSS Calculator tab
-    def init_cvss_tab(self):
+    def init_cvss_tab(self, index=None):
         self.cvss_tab = CVSSCalcTab()
-        self.tabs.addTab(self.cvss_tab, QIcon("assets/cvss_icon.png"), "")
-        index = self.tabs.indexOf(self.cvss_tab)
+        if index is None:
+            index = self.tabs.addTab(self.cvss_tab, cached_icon("assets/cvss_icon.png"), "")
+        else:
+            index = self.tabs.insertTab(index, self.cvss_tab, cached_icon("assets/cvss_icon.png"), "")
         self.tabs.setTabToolTip(index, "CVSS Calculator")
         self.tabs.setTabText(index, "CVSS Calc.")
 
+    #BUFFERED CONSOLE OUTPUT
+    def _queue_log(self, text):
+        """Write to the console through the log buffer (worker output and UI messages alike,
+        so lines always appear in the order they were produced)."""
+        self._log_buf.append(text)
+        self._log_buf_lines += text.count("\n") + 1
+        if not self._log_timer.isActive():
+            self._log_timer.start()
+
+    def _queue_log_lines(self, lines):
+        """Slot for ScanThread.log_signal, which delivers lines in batches."""
+        if lines:
+            self._queue_log("\n".join(lines))
+
+    def _on_progress(self, value):
+        """Slot for worker progress signals: keep the newest value, paint it on the next frame."""
+        self._pending_progress = value
+        if not self._progress_timer.isActive():
+            self._progress_timer.start()
+
+    def _flush_progress(self):
+        """Paint the latest progress value now (finished handlers call this so nothing stale lands later)."""
+        self._progress_timer.stop()
+        self.progress_bar.setValue(self._pending_progress)
+
+    def _flush_log(self):
+        """Write buffered output to the console in one appendPlainText() call."""
+        self._log_timer.stop()
+        if not self._log_buf:
+            self._log_timer.setInterval(_LOG_FLUSH_MS)
+            return
+        text = "\n".join(self._log_buf)
+        lines = self._log_buf_lines
+        self._log_buf.clear()
+        self._log_buf_lines = 0
+        if lines > _CONSOLE_MAX_LINES:
+            # the console would drop these right away; don't lay them out first
+            text = "\n".join(text.split("\n")[-_CONSOLE_MAX_LINES:])
+
+        # Adaptive cadence: back off while output floods in, snap back once it calms down
+        if lines > _LOG_BUSY_LINES:
+            self._log_timer.setInterval(min(self._log_timer.interval() * 2, _LOG_FLUSH_MAX_MS))
+        else:
+            self._log_timer.setInterval(_LOG_FLUSH_MS)
+        self.output_console.appendPlainText(text)
+
     #CLEAR OUTPUT FIELD
     def clear_output(self):
+        self._progress_timer.stop()
+        self._log_buf.clear()
+        self._log_buf_lines = 0
         self.output_console.clear()
         self.progress_bar.setValue(0)
         self.status_label.setText("Status: Idle")  
@@ -193,7 +453,7 @@ class ReconCraftUI(QMainWindow):
                 try:
                     # show immediate feedback but do not reset/clear yet
                     if hasattr(self, "output_console"):
-                        self.output_console.append("⏹️ Aborting scan…")
+                        self._queue_log("⏹️ Aborting scan…")
                     if hasattr(self, "status_label"):
                         self.status_label.setText("Aborting…")
                 except Exception:
@@ -206,7 +466,7 @@ class ReconCraftUI(QMainWindow):
                     # optional: surface the error to console
                     try:
                         if hasattr(self, "output_console"):
-                            self.output_console.append("⚠️ Failed to signal cancel to scan thread.")
+                            self._queue_log("⚠️ Failed to signal cancel to scan thread.")
                     except Exception:
                         pass
 
@@ -217,12 +477,12 @@ class ReconCraftUI(QMainWindow):
             if it is not None and hasattr(it, "request_cancel"):
                 try:
                     if hasattr(self, "output_console"):
-                        self.output_console.append("⏹️ Cancelling install…")
+                        self._queue_log("⏹️ Cancelling install…")
                     it.request_cancel()
                 except Exception:
                     try:
                         if hasattr(self, "output_console"):
-                            self.output_console.append("⚠️ Failed to signal cancel to installer.")
+                            self._queue_log("⚠️ Failed to signal cancel to installer.")
                     except Exception:
                         pass
 
@@ -272,33 +532,8 @@ class ReconCraftUI(QMainWindow):
 
     # Build plugin metadata for easier access
     def _build_plugin_metas(self, plugin_map):
-        metas = {}
-        for name, mod in (plugin_map or {}).items():
-            # Prefer new template’s get_install_info() if present
-            gi = {}
-            try:
-                if hasattr(mod, "get_install_info"):
-                    gi = mod.get_install_info() or {}
-            except Exception:
-                gi = {}
-
-            # Fallbacks to support old/simple plugins
-            required_tool = gi.get("required_tool") or getattr(mod, "REQUIRED_TOOL", "")
-            install_hint  = (gi.get("install_hint") or getattr(mod, "INSTALL_HINT", "manual") or "manual").lower()
-            install_url   = gi.get("install_url") or getattr(mod, "INSTALL_URL", "")
-            exec_name     = gi.get("exec_name") or getattr(mod, "EXECUTABLE", "") or required_tool
-            alias_name    = gi.get("alias_name") or getattr(mod, "TOOL_ALIAS", "") or exec_name or required_tool
-            docker_run    = gi.get("docker_run") or getattr(mod, "DOCKER_RUN", "")
-
-            metas[name] = {
-                "required_tool": required_tool,
-                "install_hint":  install_hint,
-                "install_url":   install_url,
-                "exec_name":     exec_name,
-                "alias_name":    alias_name,
-                "docker_run":    docker_run,
-            }
-        return metas
+        # One PluginMeta per plugin (alias/exec/docker etc.), shared with the tool workers
+        return build_plugin_metas(plugin_map)
 
 #DASHBOARD TAB
     def init_dashboard_tab(self):
@@ -329,7 +564,7 @@ class ReconCraftUI(QMainWindow):
 
         # 🛰️ Tool Logo/Icon (centered)
         logo = QLabel()
-        logo.setPixmap(QIcon("assets/reconcraft_icon.png").pixmap(570, 170))
+        logo.setPixmap(cached_pixmap("assets/reconcraft_icon.png", 570, 170))
         logo.setAlignment(Qt.AlignCenter)
         logo.setStyleSheet("margin-top: 4px; margin-bottom: 10px;")  # reduced
         layout.addWidget(logo)
@@ -347,7 +582,7 @@ class ReconCraftUI(QMainWindow):
 
         # GitHub button
         github_btn = QPushButton()
-        github_btn.setIcon(QIcon("assets/github_icon.png"))  # Make sure the icon is placed here
+        github_btn.setIcon(cached_icon("assets/github_icon.png"))  # Make sure the icon is placed here
         github_btn.setIconSize(QSize(24, 24))
         github_btn.setCursor(Qt.PointingHandCursor)
         github_btn.setToolTip("Visit GitHub")
@@ -367,53 +602,19 @@ class ReconCraftUI(QMainWindow):
         stats_grid = QGridLayout()
         stats_grid.setSpacing(12)
 
-        # 🧮 Initialize labels (these can be updated dynamically later)
-        self.total_scans_label = QLabel("5")
-        self.last_target_label = QLabel("example.com")
-        self.last_tools_label = QLabel("Nmap, Subfinder")
-        self.last_time_label = QLabel("2025-06-03 10:30 AM")
-        self.last_status_label = QLabel("✅ Successful")
-        self.last_report_label = QLabel("<a href='#'>demo_report_01.txt</a>")
-        self.last_report_label.setOpenExternalLinks(False)
-
-        # 📦 Define the metrics with labels
-        metrics = {
-            "🧮 Total Scans Run": self.total_scans_label,
-            "🕵️‍♂️ Last Target": self.last_target_label,
-            "🧰 Tools Used": self.last_tools_label,
-            "🕒 Last Scan Time": self.last_time_label,
-            "✅ Status": self.last_status_label,
-            "📁 Last Report": self.last_report_label
-        }
-
-        # 🧱 Add each metric to the grid as a group card
-        row, col = 0, 0
-        for title, label in metrics.items():
+        # 🧱 One group card per metric, three per row; labels are filled in
+        # from scan history by DashboardStatsWorker
+        for i, (title, attr) in enumerate(_METRICS):
+            label = QLabel("…")
+            setattr(self, attr, label)
             group = QGroupBox(title)
-            group.setStyleSheet("""
-                QGroupBox {
-                    border: 2px solid #00d9ff;
-                    border-radius: 8px;
-                    margin-top: 6px;
-                    padding: 6px;
-                    font-weight: bold;
-                    color: #00d9ff;
-                }
-                QLabel {
-                    color: #ffffff;
-                    font-size: 15px;
-                }
-            """)
+            group.setObjectName("statcard")
             inner_layout = QVBoxLayout()
-            label.setStyleSheet("margin-left: 4px;")
             inner_layout.addWidget(label)
             group.setLayout(inner_layout)
+            row, col = divmod(i, 3)
             stats_grid.addWidget(group, row, col)
-
-            col += 1
-            if col > 2:
-                col = 0
-                row += 1
+        self.last_report_label.setOpenExternalLinks(False)
 
         # ✅ Add grid to layout
         layout.addLayout(stats_grid)
@@ -426,12 +627,33 @@ class ReconCraftUI(QMainWindow):
 
         # 📋 Finalize Dashboard layout
         self.dashboard_tab.setLayout(layout)
+        self.dashboard_tab.setStyleSheet(_STATS_GROUP_QSS)
 
         # 🛠️ Add dashboard tab with icon and tooltip
-        index = self.tabs.addTab(self.dashboard_tab, QIcon("assets/home_icon.png"), "")
+        index = self.tabs.addTab(self.dashboard_tab, cached_icon("assets/home_icon.png"), "")
         self.tabs.setTabToolTip(index, "🏠 Dashboard – Overview of your scans")
         self.tabs.setTabText(index, "Dashboard")  # ✅ Use the captured index
 
+        # 📂 Read scan history off the UI thread; labels fill in when it lands
+        self._dashboard_worker = DashboardStatsWorker("Scan Results")
+        self._dashboard_worker.loaded.connect(self._on_dashboard_stats)
+        self._dashboard_worker.start()
+
+    def _on_dashboard_stats(self, stats):
+        if not stats or not stats.get("total"):
+            self._scan_count = 0
+            self.total_scans_label.setText("0")
+            for label in (self.last_target_label, self.last_tools_label,
+                          self.last_time_label, self.last_status_label, self.last_report_label):
+                label.setText("—")
+            return
+        self._scan_count = stats["total"]
+        self.total_scans_label.setText(str(stats["total"]))
+        self.last_target_label.setText(stats["target"])
+        self.last_tools_label.setText(", ".join(stats["tools"]) or "—")
+        self.last_time_label.setText(stats["time"])
+        self.last_status_label.setText("✅ Successful" if stats["report"] else "⚠️ No reports")
+        self.last_report_label.setText(stats["report"] or "—")
     
  #SCAN TAB
     def init_scan_tab(self):
@@ -461,7 +683,7 @@ class ReconCraftUI(QMainWindow):
 
         # Add a clear button next to the input    
         clear_btn = QToolButton()
-        clear_btn.setIcon(QIcon("assets/clear_icon.jpg"))
+        clear_btn.setIcon(cached_icon("assets/clear_icon.jpg"))
         clear_btn.setToolTip("Clear target")
         clear_btn.clicked.connect(self.target_input.clear)
 
@@ -484,7 +706,7 @@ class ReconCraftUI(QMainWindow):
 
         # After creating self.target_input and clear_btn
         upload_btn = QPushButton()
-        upload_btn.setIcon(QIcon("assets/upload_icon.jpg"))  # Use a suitable upload icon in your assets
+        upload_btn.setIcon(cached_icon("assets/upload_icon.jpg"))  # Use a suitable upload icon in your assets
         upload_btn.setToolTip("Upload targets from a .txt file")
         upload_btn.clicked.connect(self.upload_targets)
 
@@ -574,8 +796,10 @@ class ReconCraftUI(QMainWindow):
         plugin_action_layout.setSpacing(12)
 
         self.refresh_button = QPushButton("🔄 Refresh Plugins")
-        self.refresh_button.setToolTip("Reload plugins and update tool list")
-        self.refresh_button.clicked.connect(self.refresh_plugins)
+        self.refresh_button.setToolTip("Reload changed plugins and update tool list (Shift+click: reload all)")
+        self.refresh_button.clicked.connect(
+            lambda: self.refresh_plugins(force=bool(QApplication.keyboardModifiers() & Qt.ShiftModifier))
+        )
 
         self.check_tools_btn = QPushButton("🧪 Check Tools")
         self.check_tools_btn.setToolTip("Check if all loaded tools are installed")
@@ -656,11 +880,13 @@ class ReconCraftUI(QMainWindow):
         self.status_label = QLabel("Status: Idle")
         layout.addWidget(self.status_label)
 
-        self.output_console = QTextEdit()
+        # Plain-text console: no rich-text parsing, and history is capped so
+        # each append stays cheap however long a scan runs
+        self.output_console = QPlainTextEdit()
         self.output_console.setReadOnly(True)
-        # Render output as plain text to keep font size consistent even with emojis
-        self.output_console.setAcceptRichText(False)
-        self.output_console.setText("Scan output will be shown here.")
+        self.output_console.setUndoRedoEnabled(False)
+        self.output_console.setMaximumBlockCount(_CONSOLE_MAX_LINES)
+        self.output_console.setPlainText("Scan output will be shown here.")
         self.output_console.setStyleSheet("""
             background-color: #111;
             color: #33ff33;
@@ -671,6 +897,21 @@ class ReconCraftUI(QMainWindow):
         layout.addWidget(QLabel("Output:"))
         layout.addWidget(self.output_console)
 
+        # Worker/scan output is buffered and written in one insert per timer tick
+        self._log_buf = []
+        self._log_buf_lines = 0
+        self._log_timer = QTimer(self)
+        self._log_timer.setSingleShot(True)
+        self._log_timer.setInterval(_LOG_FLUSH_MS)
+        self._log_timer.timeout.connect(self._flush_log)
+
+        # Worker progress is latest-value-wins: at most one repaint per ~16 ms frame
+        self._pending_progress = 0
+        self._progress_timer = QTimer(self)
+        self._progress_timer.setSingleShot(True)
+        self._progress_timer.setInterval(16)
+        self._progress_timer.timeout.connect(self._flush_progress)
+
     # ➕ Add Clear and Reset buttons
         button_row = QWidget()
         button_layout = QVBoxLayout()
@@ -693,7 +934,7 @@ class ReconCraftUI(QMainWindow):
         button_row.setLayout(button_layout)
         layout.addWidget(button_row)
 
-        scan_index=self.tabs.addTab(self.scan_tab, QIcon("assets/scan.png"), "")
+        scan_index=self.tabs.addTab(self.scan_tab, cached_icon("assets/scan.png"), "")
         self.tabs.setTabToolTip(scan_index, "🔍 Scan – Start recon with selected tools")
         self.tabs.setTabText(scan_index, "Scan")
 
@@ -713,12 +954,12 @@ class ReconCraftUI(QMainWindow):
         self.statusBar().showMessage("Starting tool check...")
         
         
-        self.check_worker = ToolCheckWorker(self.plugins, is_tool_installed)
-        self.check_worker.progress.connect(self.progress_bar.setValue)
+        self.check_worker = ToolCheckWorker(self.plugins, self.plugin_metas)
+        self.check_worker.progress.connect(self._on_progress)
         self.check_worker.status.connect(self.statusBar().showMessage)
         
         #self.check_worker.status.connect(self._bind_status_to_ticker("check_ticker"))
-        self.check_worker.output.connect(self.output_console.append)
+        self.check_worker.output.connect(self._queue_log)
         self.check_worker.finished.connect(self._on_check_tools_finished)
         # start
         self.check_worker.start()
@@ -748,14 +989,14 @@ class ReconCraftUI(QMainWindow):
             return
 
         # ✅ Create ToolInstallWorker (matches __init__(missing_plugins, plugins))
-        self.installer_worker = ToolInstallWorker(self.missing_tools, self.plugins)
+        self.installer_worker = ToolInstallWorker(self.missing_tools, self.plugins, self.plugin_metas)
         # Provide the sudo popup callable (defined in ui_main.py as prompt_sudo_password)
         self.installer_worker.sudo_prompt = self.prompt_sudo_password
         
         # Wire signals to your existing slots/handlers
-        self.installer_worker.output.connect(self.output_console.append)
+        self.installer_worker.output.connect(self._queue_log)
         self.installer_worker.status.connect(self.statusBar().showMessage)
-        self.installer_worker.progress.connect(self.progress_bar.setValue)
+        self.installer_worker.progress.connect(self._on_progress)
 
         # Keep the missing list in sync for the UI (optional but useful)
         self.installer_worker.missing.connect(lambda lst: setattr(self, "missing_tools", lst))
@@ -769,16 +1010,6 @@ class ReconCraftUI(QMainWindow):
         # Start once
         self.installer_worker.start()
 
-        # ✅ Connect signals for real-time feedback
-        self.installer_worker.output.connect(self.output_console.append)
-        self.installer_worker.status.connect(self.statusBar().showMessage)
-        self.installer_worker.progress.connect(self.progress_bar.setValue)
-        
-       # This method is called when the ToolInstallWorker finishes installing tools
-        self.installer_worker.finished.connect(self._on_install_tools_finished) 
-       # ✅ Start the worker thread
-        self.installer_worker.start()
-
 
     def _on_install_tools_finished(self, ok: bool):
         t = getattr(self, "install_ticker", None)
@@ -787,12 +1018,16 @@ class ReconCraftUI(QMainWindow):
             self._switch_context("idle")
 
         self.statusBar().showMessage("Install complete." if ok else "Some tools could not be installed. See logs.", 6000)
-        self.output_console.append("✅ All missing tools (if any) have been handled.")
+        self._flush_progress()
+        self._flush_log()
+        self._queue_log("✅ All missing tools (if any) have been handled.")
 
        
     # This method is called when the ToolCheckWorker finishes checking tools
     def _on_check_tools_finished(self, missing_tools):
         
+        self._flush_progress()
+        self._flush_log()
         self.missing_tools = missing_tools
         if missing_tools:
             self.check_result_label.setText("Some tools missing.")
@@ -839,19 +1074,10 @@ class ReconCraftUI(QMainWindow):
                     pass
                 return t
 
-            # Domain regex (simple & safe)
-            domain_re = re.compile(
-                r"^(?=.{1,253}$)(?:[A-Za-z0-9](?:[A-Za-z0-9-]{0,61}[A-Za-z0-9])?\.)+[A-Za-z]{2,}$"
-            )
-
-            # Allowed character class for pre-validation (before domain/IP checks)
-            # Allows dots, dashes, underscores, colon (for :port), slash (for CIDR/URL remnants).
-            _allowed_pattern = r"[A-Za-z0-9._:/-]"
-            _special_finder = re.compile(fr"[^{_allowed_pattern}]")
-
             tokens = []
+            notes = []      # warnings/rejections, written to the console in one append
             # split by comma and newlines
-            for chunk in re.split(r"[,\n]+", raw or ""):
+            for chunk in _TARGET_SPLIT_RE.split(raw or ""):
                 t = _norm(chunk)
                 if not t:
                     continue
@@ -859,20 +1085,16 @@ class ReconCraftUI(QMainWindow):
                 t = _strip_url(t)
 
                 # remove any internal whitespace and warn
-                t_ws = re.sub(r"\s+", "", t)
+                t_ws = _WHITESPACE_RE.sub("", t)
                 if t_ws != t:
-                    if hasattr(self, "output_console"):
-                        self.output_console.append(f"⚠️ Removed spaces from “{t}” → “{t_ws}”.")
+                    notes.append(f"⚠️ Removed spaces from “{t}” → “{t_ws}”.")
                     t = t_ws
 
                 # 🔒 Special characters check (early failure with explicit message)
-                bad_chars = _special_finder.findall(t)
+                bad_chars = _TARGET_SPECIAL_RE.findall(t)
                 if bad_chars:
                     bad_display = "".join(sorted(set(bad_chars)))
-                    if hasattr(self, "output_console"):
-                        self.output_console.append(
-                            f"❌ Invalid target: special characters detected [{bad_display}] in “{t0}”."
-                        )
+                    notes.append(f"❌ Invalid target: special characters detected [{bad_display}] in “{t0}”.")
                     continue
 
                 # drop trailing dot on domains like "example.com."
@@ -895,18 +1117,18 @@ class ReconCraftUI(QMainWindow):
                         ipaddress.IPv4Network(t, strict=False)
                         is_ok = True
                     except Exception:
-                        if domain_re.match(t):
+                        if _DOMAIN_RE.match(t):
                             is_ok = True
 
                 if not is_ok:
-                    if hasattr(self, "output_console"):
-                        self.output_console.append(
-                            f"❌ Invalid target format: “{t0}”. Remove special chars/spaces or fix typos."
-                        )
+                    notes.append(f"❌ Invalid target format: “{t0}”. Remove special chars/spaces or fix typos.")
                     continue
 
                 tokens.append(t.lower())
 
+            if notes and hasattr(self, "output_console"):
+                self._queue_log("\n".join(notes))
+
             # de-duplicate while preserving order
             seen = set()
             cleaned = []
@@ -919,7 +1141,7 @@ class ReconCraftUI(QMainWindow):
 #UPLOAD TARGETS FROM FILE
     def upload_targets(self):
     
-        allowed_pattern = re.compile(r'^[a-zA-Z0-9\-._:,]+$')
+        allowed_pattern = _UPLOAD_TARGET_RE
 
         file_path, _ = QFileDialog.getOpenFileName(
             self,
@@ -944,12 +1166,12 @@ class ReconCraftUI(QMainWindow):
                                     lines.append(item)
                 elif ext.lower() == ".xlsx":
                     if pd is None:
-                        self.output_console.append("❌ 'pandas' library is required to read Excel files. Please install it.")
+                        self._queue_log("❌ 'pandas' library is required to read Excel files. Please install it.")
                         return
                     try:
                         df = pd.read_excel(file_path, header=None)
                     except Exception as ex:
-                        self.output_console.append(f"❌ Error reading Excel file: {str(ex)}")
+                        self._queue_log(f"❌ Error reading Excel file: {str(ex)}")
                         return
                     for value in df.values.flatten():
                         if pd.isna(value):
@@ -958,11 +1180,11 @@ class ReconCraftUI(QMainWindow):
                         if value:
                             lines.append(value)
                 else:
-                    self.output_console.append("❌ Unsupported file type.")
+                    self._queue_log("❌ Unsupported file type.")
                     return
 
                 if not lines:
-                    self.output_console.append("❌ The uploaded file is empty.")
+                    self._queue_log("❌ The uploaded file is empty.")
                     return
 
                 valid_lines = []
@@ -974,19 +1196,19 @@ class ReconCraftUI(QMainWindow):
                         invalid_lines.append(line)
 
                 if not valid_lines:
-                    self.output_console.append("❌ No valid targets found (special characters detected).")
+                    self._queue_log("❌ No valid targets found (special characters detected).")
                     return
 
                 self.target_input.setText(", ".join(valid_lines))
-                self.output_console.append(f"✅ Imported {len(valid_lines)} valid targets from file.")
+                self._queue_log(f"✅ Imported {len(valid_lines)} valid targets from file.")
 
                 if invalid_lines:
-                    self.output_console.append(f"⚠️ Ignored {len(invalid_lines)} invalid lines due to special characters:")
+                    self._queue_log(f"⚠️ Ignored {len(invalid_lines)} invalid lines due to special characters:")
                     for invalid in invalid_lines:
-                        self.output_console.append(f"   - {invalid}")
+                        self._queue_log(f"   - {invalid}")
 
             except Exception as e:
-                self.output_console.append(f"❌ Failed to import targets: {str(e)}")
+                self._queue_log(f"❌ Failed to import targets: {str(e)}")
 
 
     # DYNAMICALLY POPULATE TOOL/PLUGIN CHECKBOXES
@@ -1057,17 +1279,26 @@ class ReconCraftUI(QMainWindow):
 
 #RESET TOOLS
     def reset_tools(self):
-        # Uncheck all tool checkboxes
-        for checkbox in self.tool_checkboxes.values():
-            checkbox.setChecked(False)
+        # Uncheck all tool checkboxes: no per-box signals, one repaint at the end
+        self.scan_tab.setUpdatesEnabled(False)
+        try:
+            for checkbox in self.tool_checkboxes.values():
+                if checkbox.isChecked():
+                    with QSignalBlocker(checkbox):
+                        checkbox.setChecked(False)
+        finally:
+            self.scan_tab.setUpdatesEnabled(True)
 
         # Clear the target input field
         self.target_input.clear()
   
 #REFRESH PLUGINS
 
-    def refresh_plugins(self):
-        
+    def refresh_plugins(self, force=False):
+        """
+        Rebuild the tool list from plugins/. Modules are cached by file mtime, so only
+        new or edited plugins are executed again; force=True re-executes all of them.
+        """
         # Remove all existing checkboxes from layout
         for i in reversed(range(self.tool_container_layout.count())):
             widget = self.tool_container_layout.itemAt(i).widget()
@@ -1078,22 +1309,42 @@ class ReconCraftUI(QMainWindow):
         # --- LOAD PLUGINS DYNAMICALLY ---
         plugins_dir = os.path.join(os.getcwd(), "plugins")
         self.plugins = {}  # <--- ADD THIS: plugin name => plugin module
-
-        for filename in os.listdir(plugins_dir):
-            if filename.endswith(".py") and not filename.startswith("__"):
+        cache = getattr(self, "_plugin_cache", {})   # plugin name -> (mtime, module)
+        if force:
+            cache = {}
+        fresh = {}
+
+        with os.scandir(plugins_dir) as entries:
+            for entry in entries:
+                filename = entry.name
+                if not (filename.endswith(".py") and not filename.startswith("__")):
+                    continue
                 plugin_name = filename[:-3]  # remove .py
-                plugin_path = os.path.join(plugins_dir, filename)
-                spec = importlib.util.spec_from_file_location(plugin_name, plugin_path)
-                plugin_module = importlib.util.module_from_spec(spec)
                 try:
-                    spec.loader.exec_module(plugin_module)
-                    self.plugins[plugin_name] = plugin_module
-                except Exception as e:
-                    self.output_console.append(f"❌ Failed to load {plugin_name}: {e}")
-
-        # Reload tool checkboxes
+                    mtime = entry.stat().st_mtime
+                except OSError:
+                    continue
+                cached = cache.get(plugin_name)
+                if cached and cached[0] == mtime:
+                    plugin_module = cached[1]
+                else:
+                    spec = importlib.util.spec_from_file_location(plugin_name, entry.path)
+                    plugin_module = importlib.util.module_from_spec(spec)
+                    try:
+                        spec.loader.exec_module(plugin_module)
+                    except Exception as e:
+                        self._queue_log(f"❌ Failed to load {plugin_name}: {e}")
+                        continue
+                fresh[plugin_name] = (mtime, plugin_module)
+                self.plugins[plugin_name] = plugin_module
+        # Plugins whose files vanished drop out with the old dict
+        self._plugin_cache = fresh
+        self.plugin_metas = self._build_plugin_metas(self.plugins)
+
+        # Reload tool checkboxes (fresh PATH sweep: tools may have been installed outside the app)
+        invalidate_path_index()
         self.init_dynamic_tool_checkboxes(self.tool_container_layout)
-        self.output_console.append("🔁 Plugins refreshed successfully.\n")
+        self._queue_log("🔁 Plugins refreshed successfully.\n")
 
     # Central lock/unlock for scan UI (start/abort, targets, tool checkboxes, etc.)
     def _set_scan_ui_running(self, running: bool):
@@ -1134,6 +1385,7 @@ class ReconCraftUI(QMainWindow):
     def handle_scan_finished(self, status: str):
             
             """Stop ticker, reset context when scan finishes."""
+            self._flush_progress()      # pending worker progress must not land after the final value
             note = "Scan complete." if status == "done_success" else "Scan failed."
             try:
                 if hasattr(self, "scan_ticker") and self.scan_ticker:
@@ -1151,24 +1403,20 @@ class ReconCraftUI(QMainWindow):
                 except Exception:
                     pass
 
-            # Progress bar color (your existing behavior)
-            if status == "done_success":
-                # Green
-                self.progress_bar.setStyleSheet("QProgressBar::chunk {background-color: #28a745;}")
-            else:
-                # Red
-                self.progress_bar.setStyleSheet("QProgressBar::chunk {background-color: #dc3545;}")
-
-            # Also set a final progress value for clarity
+            # Final progress value for clarity
             try:
                 if hasattr(self, "progress_bar") and self.progress_bar:
                     self.progress_bar.setValue(100 if status == "done_success" else 0)
             except Exception:
                 pass
             
-            # Update status line (your existing behavior)
+            # Status line + progress bar colour (green/red)
             self.update_status_label(status)
 
+            # Dashboard "last scan" cards
+            self.update_dashboard(', '.join(getattr(self, "_current_targets", [])),
+                                  getattr(self, "_current_plugins", []), status)
+
             # Unlock scan UI so a new run can be started
             try:
                 # Re-enable Start button (support common attribute names defensively)
@@ -1191,8 +1439,9 @@ class ReconCraftUI(QMainWindow):
                 pass
 
             # Refresh the Reports tree so new results appear immediately
+            # (not built yet = the tab loads a fresh tree on first visit)
             try:
-                if hasattr(self, "load_report_tree"):
+                if hasattr(self, "report_tree"):
                     self.load_report_tree()
             except Exception:
                 pass
@@ -1210,8 +1459,9 @@ class ReconCraftUI(QMainWindow):
                 except Exception:
                     pass
 
-            # Final console note (your existing behavior)
-            self.output_console.append("📌 Scan finished.")
+            # Final console note (your existing behavior), after any buffered scan output
+            self._flush_log()
+            self._queue_log("📌 Scan finished.")
 
 
 # FOR STARTING & LAUNCHING SCAN
@@ -1226,11 +1476,11 @@ class ReconCraftUI(QMainWindow):
             # -- Targets --
         targets_input = self.target_input.text().strip() if hasattr(self, "target_input") else ""
         if not targets_input:
-            self.output_console.append("❌ Please enter at least one target.")
+            self._queue_log("❌ Please enter at least one target.")
             return
         targets = self._parse_and_validate_targets(targets_input)
         if not targets:
-            self.output_console.append("❌ Invalid target format. Remove Spaces or special characters.")
+            self._queue_log("❌ Invalid target format. Remove Spaces or special characters.")
             return
 
         # -- Selected tools --
@@ -1238,7 +1488,7 @@ class ReconCraftUI(QMainWindow):
             k for k, cb in getattr(self, "tool_checkboxes", {}).items() if cb.isChecked()
         ]
         if not selected_plugins:
-            self.output_console.append("❌ Please select at least one tool.")
+            self._queue_log("❌ Please select at least one tool.")
             return
 
         # -- Recompute availability for selected tools (single source of truth) --
@@ -1257,12 +1507,12 @@ class ReconCraftUI(QMainWindow):
                 missing.append(k)
 
         if missing:
-            self.output_console.append(f"⚠ Some selected tools are not installed: {', '.join(missing)}")
+            self._queue_log(f"⚠ Some selected tools are not installed: {', '.join(missing)}")
             if not available:
-                self.output_console.append("❌ No installed tools selected. Use 'Install Missing Tools' or select available tools.")
+                self._queue_log("❌ No installed tools selected. Use 'Install Missing Tools' or select available tools.")
                 return
             else:
-                self.output_console.append(f"➡ Proceeding with available tools only: {', '.join(available)}")
+                self._queue_log(f"➡ Proceeding with available tools only: {', '.join(available)}")
 
         selected_tools = available if available else selected_plugins
 
@@ -1271,7 +1521,7 @@ class ReconCraftUI(QMainWindow):
         scan_folder = self.prepare_scan_folder(targets) if hasattr(self, "prepare_scan_folder") else None
 
         if not scan_folder:
-            self.output_console.append("❌ Failed to prepare scan directory.")
+            self._queue_log("❌ Failed to prepare scan directory.")
             return
 
         # ✅ Now it’s safe to enable Abort and start ticker
@@ -1305,8 +1555,8 @@ class ReconCraftUI(QMainWindow):
 
 
         # ✅ Log starting message
-        self.output_console.append(f"🚀 Starting scan on {len(targets)} target(s)...")
-        self.output_console.append(f"📂 Scan folder created: {scan_folder}")
+        self._queue_log(f"🚀 Starting scan on {len(targets)} target(s)...")
+        self._queue_log(f"📂 Scan folder created: {scan_folder}")
 
 
         # 🔁 Reset status and progress bar for new scan
@@ -1320,12 +1570,16 @@ class ReconCraftUI(QMainWindow):
         # All validations passed — now lock the UI for a run
         self._set_scan_ui_running(True) 
 
-        # ✅ Get selected scan mode from settings tab
-        selected_mode = self.scan_profiles_widget.current_mode
+        # ✅ Get selected scan mode from settings tab ("Normal" until the tab is first opened)
+        profiles = getattr(self, "scan_profiles_widget", None)
+        selected_mode = profiles.current_mode if profiles is not None else "Normal"
 
         # ✅ Flatten custom args map for ScanThread
         custom_args_map = getattr(self, "_custom_args_cache", {}) or {}
 
+        # "Max Concurrent Scans" from Settings; an unopened tab means the shared DEFAULT_MAX_WORKERS
+        max_workers = profiles.concurrency_spin.value() if profiles is not None else None
+
         # ✅ Passing it to ScanThread, STARTING SCAN
         self.scan_thread = ScanThread(
             targets,
@@ -1334,86 +1588,29 @@ class ReconCraftUI(QMainWindow):
             selected_mode,                          # keep passing your UI mode as-is
             profile_mode=(selected_mode or "Normal"),  #explicit runtime profile
             custom_args_map=custom_args_map,            #flattened {tool_key: "args"}
+            max_workers=max_workers,
         )
 
         # connect FIRST
-        self.scan_thread.log_signal.connect(self.output_console.append)
-        self.scan_thread.progress_signal.connect(self.progress_bar.setValue)
+        self.scan_thread.log_signal.connect(self._queue_log_lines)
+        self.scan_thread.progress_signal.connect(self._on_progress)
         self.scan_thread.status_signal.connect(self.update_status_label)
+        # one handler does all end-of-scan work (status, progress, dashboard, console)
         self.scan_thread.finished_signal.connect(self.handle_scan_finished)
-        self.scan_thread.finished_signal.connect(
-            lambda status: (
-                self.update_status_label(status),
-                self.progress_bar.setValue(100) if status == "done_success" else None
-            )
-        )
+        self._current_targets = list(targets)
+        self._current_plugins = list(selected_plugins)
         
         #Starting the scan thread
         self.scan_thread.start()
-        self.output_console.append("🔄 Scan in progress...")
-        
-        # Update dashboard with initial scan status
-        self.scan_thread.finished_signal.connect(
-            lambda status: (
-                self.update_status_label(status),
-                self.update_dashboard(', '.join(targets), selected_plugins)
-            )
-        )
+        self._queue_log("🔄 Scan in progress...")
 
 # UPDATE STATUS LABEL
     def update_status_label(self, status):
-            if status == "indeterminate":
-                self.status_label.setText("Status: Initializing...")
-                self.progress_bar.setStyleSheet("""
-                    QProgressBar {
-                        border: 1px solid #444;
-                        border-radius: 5px;
-                        text-align: center;
-                        background-color: #111;
-                        color: #ffffff;
-                        font-weight: bold;
-                        font-size: 14px;
-                    }
-                    QProgressBar::chunk {
-                        background-color: #00d9ff;  /* Blue for scan start */
-                    }
-                """)
-                self._force_center_progress_text()
-
-            elif status == "done_success":
-                self.status_label.setText("Status: ✅ Scan completed successfully.")
-                self.progress_bar.setStyleSheet("""
-                    QProgressBar {
-                        border: 1px solid #444;
-                        border-radius: 5px;
-                        text-align: center;
-                        background-color: #111;
-                        color: #ffffff;
-                        font-weight: bold;
-                        font-size: 14px;
-                    }
-                    QProgressBar::chunk {
-                        background-color: #00c853;
-                    }
-                """)
-                self._force_center_progress_text()
-
-            elif status == "done_error":
-                self.status_label.setText("Status: ❌ Scan completed with some errors.")
-                self.progress_bar.setStyleSheet("""
-                    QProgressBar {
-                        border: 1px solid #444;
-                        border-radius: 5px;
-                        text-align: center;
-                        background-color: #111;
-                        color: #ffffff;
-                        font-weight: bold;
-                        font-size: 14px;
-                    }
-                    QProgressBar::chunk {
-                        background-color: #d32f2f;  /* Red for error */
-                    }
-                """)
+            view = _SCAN_STATUS_VIEW.get(status)
+            if view is not None:
+                text, qss = view
+                self.status_label.setText(text)
+                self.progress_bar.setStyleSheet(qss)
                 self._force_center_progress_text()
 
             elif "Completed" in status:
@@ -1434,13 +1631,14 @@ class ReconCraftUI(QMainWindow):
 
 
 #DASHBOARD UPDATE
-    def update_dashboard(self, target, plugins):
-        self.total_scans_label.setText("Total Scans Run: updated dynamically")
-        self.last_target_label.setText(f"Last Scan Target: {target}")
-        self.last_tools_label.setText(f"Tools Used: {', '.join(plugins)}")
-        now = datetime.now().strftime("%Y-%m-%d %I:%M %p")
-        self.last_time_label.setText(f"Last Scan Time: {now}")
-        self.last_status_label.setText("Scan Status: ✅ Successful")
+    def update_dashboard(self, target, plugins, status="done_success"):
+        self._scan_count = getattr(self, "_scan_count", 0) + 1
+        now = time.strftime("%Y-%m-%d %I:%M %p")
+        _set_if_changed(self.total_scans_label, str(self._scan_count))
+        _set_if_changed(self.last_target_label, target)
+        _set_if_changed(self.last_tools_label, ", ".join(plugins))
+        _set_if_changed(self.last_time_label, now)
+        _set_if_changed(self.last_status_label, _DASHBOARD_STATUS.get(status, _DASHBOARD_STATUS["done_error"]))
 
 # Display last report link
     def linking_display_report(self, item):
@@ -1469,6 +1667,10 @@ class ReconCraftUI(QMainWindow):
                 name = p.name
                 return name.startswith(".") or name.startswith("_") or name.endswith("~")
 
+            # Subtrees are built detached and inserted in one addTopLevelItems() call
+            # (one rowsInserted + one layout pass instead of one per item)
+            scan_items = []
+
             # Level 1: scan roots => "<scan_id>_<label>/"
             for scan_dir in sorted([d for d in root_dir.iterdir() if d.is_dir() and not is_hidden(d)]):
                 all_reports = scan_dir / "All Reports"
@@ -1487,7 +1689,7 @@ class ReconCraftUI(QMainWindow):
                     "scan_path": str(scan_dir),
                     "all_reports_path": str(all_reports),
                 })
-                self.report_tree.addTopLevelItem(scan_item)
+                scan_items.append(scan_item)
 
                 # Level 2: targets => "<target_name>/"
                 # Exclude known non-target folders that sometimes sit at the scan root
@@ -1557,7 +1759,12 @@ class ReconCraftUI(QMainWindow):
                         })
                         tool_item.addChild(run_item)
 
-            self.report_tree.expandToDepth(0)  # expand only first level by default
+            self.report_tree.setUpdatesEnabled(False)
+            try:
+                self.report_tree.addTopLevelItems(scan_items)
+                self.report_tree.expandToDepth(0)  # expand only first level by default
+            finally:
+                self.report_tree.setUpdatesEnabled(True)
 
 
 #clicking tree item to display report
@@ -1792,16 +1999,23 @@ class ReconCraftUI(QMainWindow):
         # Newest-first
         items.sort(key=lambda x: x[0], reverse=True)
 
-        for _, display_name, full_path in items:
-            item = QListWidgetItem(display_name)
-            item.setToolTip(full_path)
-            item.setData(Qt.UserRole, full_path)
-            self.report_list.addItem(item)
+        # Bulk insert: one repaint and no per-item signals instead of one per report
+        lst = self.report_list
+        lst.setUpdatesEnabled(False)
+        try:
+            with QSignalBlocker(lst):
+                for _, display_name, full_path in items:
+                    item = QListWidgetItem(display_name)
+                    item.setToolTip(full_path)
+                    item.setData(Qt.UserRole, full_path)
+                    lst.addItem(item)
+        finally:
+            lst.setUpdatesEnabled(True)
 
 
 
 #THIS IS FOR REPORT TAB
-    def init_reports_tab(self):
+    def init_reports_tab(self, index=None):
         """
         Build the Reports tab:
         - Title row (with refresh)
@@ -1818,7 +2032,7 @@ class ReconCraftUI(QMainWindow):
 
         # Single, canonical refresh button for the tree loader
         self.refresh_button = QPushButton()
-        self.refresh_button.setIcon(QIcon("assets/refresh_icon.png"))  # use one icon path consistently
+        self.refresh_button.setIcon(cached_icon("assets/refresh_icon.png"))  # use one icon path consistently
         self.refresh_button.setToolTip("Refresh Reports")
         self.refresh_button.setFixedSize(32, 32)
         self.refresh_button.setStyleSheet("border: none;")
@@ -1964,7 +2178,10 @@ class ReconCraftUI(QMainWindow):
         self.load_report_tree()
 
         # Attach tab to main tabs
-        report_index = self.tabs.addTab(self.report_tab, QIcon("assets/report.png"), "Reports")
+        if index is None:
+            report_index = self.tabs.addTab(self.report_tab, cached_icon("assets/report.png"), "Reports")
+        else:
+            report_index = self.tabs.insertTab(index, self.report_tab, cached_icon("assets/report.png"), "Reports")
         self.tabs.setTabToolTip(report_index, "📊 Reports – View generated scan reports")
 
         # Internal: model holder for exports
@@ -2267,7 +2484,7 @@ class ReconCraftUI(QMainWindow):
 #PREPARE SCAN RESULT FOLDER
     def prepare_scan_folder(self, target):
         base_folder = "Scan Results"
-        timestamp = datetime.now().strftime("%Y-%m-%d_%H-%M-%S")
+        timestamp = time.strftime("%Y-%m-%d_%H-%M-%S")
 
         # If 'target' is a list/tuple with multiple items → name folder as multi_<timestamp>
         # Else (single string or 1-item list) → <sanitized_target>_<timestamp>
@@ -2278,18 +2495,27 @@ class ReconCraftUI(QMainWindow):
             t = target[0] if isinstance(target, (list, tuple)) else target
 
             # Sanitize target for filesystem safety
-            safe_target = re.sub(r'[^\w.-]', '_', t)
+            safe_target = _SAFE_TARGET_RE.sub("_", t)
 
             # Combine sanitized name + timestamp
             folder_name = f"{safe_target}_{timestamp}"
 
         scan_folder_path = os.path.join(base_folder, folder_name)
 
-        os.makedirs(scan_folder_path, exist_ok=True)
+        # The base folder is created once per session; the timestamped scan folder
+        # is new, so a single mkdir normally suffices
+        if not getattr(self, "_scan_base_ok", False):
+            os.makedirs(base_folder, exist_ok=True)
+            self._scan_base_ok = True
+        try:
+            os.mkdir(scan_folder_path)
+        except OSError:
+            # same-second rerun, or the base folder was removed meanwhile
+            os.makedirs(scan_folder_path, exist_ok=True)
         return scan_folder_path
 
 #SETTINGS TAB
-    def init_settings_tab(self, plugin_map):
+    def init_settings_tab(self, plugin_map, index=None):
             self.settings_tab = QWidget()
             layout = QVBoxLayout()
 
@@ -2312,7 +2538,7 @@ class ReconCraftUI(QMainWindow):
             # Seed flattened custom args cache from settings tab's nested store
             try:
                 nested = getattr(self.scan_profiles_widget, "custom_args", {}) or {}
-                self._custom_args_cache = {k: (v.get("args") if isinstance(v, dict) else "") for k, v in nested.items()}
+                self._custom_args_cache = self.scan_profiles_widget._flatten_args(nested)
             except Exception:
                 self._custom_args_cache = {}
 
@@ -2324,14 +2550,27 @@ class ReconCraftUI(QMainWindow):
             #Copyright
             layout.addWidget(get_copyright_label())
 
-            self.theme_button = QPushButton("🌙 Switch to Light Theme")
+            self.theme_button = QPushButton(_THEME_BUTTON_TEXT[self.theme_mode])
             self.theme_button.clicked.connect(self.toggle_theme)
             layout.addWidget(self.theme_button)
 
+            # Tool checks reuse results from previous launches; let the user force a re-probe
+            self.clear_tool_cache_button = QPushButton("🧹 Clear Tool Status Cache")
+            self.clear_tool_cache_button.setToolTip("Forget cached Check Tools results so the next check probes every tool again.")
+            self.clear_tool_cache_button.clicked.connect(self._clear_tool_status_cache)
+            layout.addWidget(self.clear_tool_cache_button)
+
             self.settings_tab.setLayout(layout)
-            settings_index = self.tabs.addTab(self.settings_tab, QIcon("assets/settings.jpg"), "Settings")
+            if index is None:
+                settings_index = self.tabs.addTab(self.settings_tab, cached_icon("assets/settings.jpg"), "Settings")
+            else:
+                settings_index = self.tabs.insertTab(index, self.settings_tab, cached_icon("assets/settings.jpg"), "Settings")
             self.tabs.setTabToolTip(settings_index, "⚙️ Settings – Customize ReconCraft preferences")
 
+    def _clear_tool_status_cache(self):
+            ToolCheckWorker.clear_cache()
+            self.statusBar().showMessage("Tool status cache cleared. The next check will probe every tool.", 4000)
+
 # --- Profile bridge: receive active profile name from Settings tab ---
     def _on_profile_changed_from_settings(self, name: str):
             # Mirror the active profile (affects only command assembly)
@@ -2339,7 +2578,7 @@ class ReconCraftUI(QMainWindow):
             # Optional one-line telemetry for clarity
             try:
                 if hasattr(self, "output_console"):
-                    self.output_console.append(f"🧩 Active profile: {name}")
+                    self._queue_log(f"🧩 Active profile: {name}")
             except Exception:
                 pass
 
@@ -2372,211 +2611,106 @@ class ReconCraftUI(QMainWindow):
 #TOGGLE THEME
 
     def toggle_theme(self):
-        if self.theme_mode == "dark":
-            self.set_light_theme()
-            self.theme_button.setText("💻 Switch to Hackuuuurr Theme")
-            self.theme_mode = "light"
-        elif self.theme_mode == "light":
-            self.set_hacker_theme()
-            self.theme_button.setText("🌙 Switch to Dark Theme")
-            self.theme_mode = "hacker"
-        else:
-            self.set_dark_theme()
-            self.theme_button.setText("☀ Switch to Light Theme")
-            self.theme_mode = "dark"
+        self.theme_mode = _NEXT_THEME[self.theme_mode]
+        self._apply_theme(self.theme_mode)
+        self.theme_button.setText(_THEME_BUTTON_TEXT[self.theme_mode])
 
 
     def apply_current_theme_to_widget(self, widget):
         """Call this after adding new widgets/tabs to force them to match the selected theme."""
-        if self.theme_mode == "dark":
-            self.set_dark_theme(widget)
-        elif self.theme_mode == "light":
-            self.set_light_theme(widget)
-        else:
-            self.set_hacker_theme(widget)
+        self._apply_theme(self.theme_mode, widget)
 
 
+    def _apply_theme(self, theme: str, widget=None):
+        # Only the palette changes; _THEME_QSS (set once in __init__) follows its roles
+        pal = _theme_palette(theme)
+        if widget is not None:
+            widget.setPalette(pal)
+            return
+        app = QApplication.instance()
+        if app is not None:
+            app.setPalette(pal)
+        else:
+            self.setPalette(pal)
+
 #DARK THEME
-    def set_dark_theme(self):
-        self.setStyleSheet("""
-            QMainWindow {
-                background-color: #1e1e1e;
-            }
-            QWidget {
-                background-color: #1e1e1e;
-                color: #ffffff;
-            }
-            QTabWidget::pane {
-                border: 1px solid #444;
-                background: #2d2d2d;
-            }
-            QTabBar::tab {
-                background: #1e1e1e;
-                color: #ffffff;
-                padding: 8px;
-                min-width: 110px;
-                max-width: 110px;
-                border: 1px solid #444;
-                border-bottom: none;
-                border-top-left-radius: 4px;
-                border-top-right-radius: 4px;
-                margin-right: 1px;
-            }
-            QTabBar::tab:selected {
-                background: #3a3f44;
-                font-weight: bold;
-            }
-            QTabBar::tab:hover {
-                background: #50575e;
-            }
-            QLabel, QCheckBox, QPushButton, QListWidget, QLineEdit, QTextEdit {
-                color: #ffffff;
-                font-size: 14px;
-            }
-            QScrollArea {
-                background-color: #232629;
-                color: #fff;
-                border: 1px solid #333;
-                border-radius: 6px;
-            }
-            QPushButton {
-                background-color: #3a3f44;
-                border: 1px solid #555;
-                padding: 6px;
-                border-radius: 5px;
-            }
-            QPushButton:hover {
-                background-color: #50575e;
-            }
-            QLineEdit, QTextEdit, QListWidget {
-                background-color: #252526;
-                border: 1px solid #333;
-                border-radius: 3px;
-                padding: 4px;
-            }
-        """)
+    def set_dark_theme(self, widget=None):
+        self._apply_theme("dark", widget)
 
 
 #HACKER THEME
-    def set_hacker_theme(self):
-        self.setStyleSheet("""
-            QMainWindow {
-                background-color: #000000;
-            }
-            QWidget {
-                background-color: #000000;
-                color: #00ff00;
-                font-family: Consolas, Courier New, monospace;
-            }
-            QTabWidget::pane {
-                border: 1px solid #0f0;
-                background: #010101;
-            }
-            QTabBar::tab {
-                background: #000000;
-                color: #00ff00;
-                padding: 8px;
-                min-width: 110px;
-                max-width: 110px;
-                border: 1px solid #0f0;
-                border-bottom: none;
-                border-top-left-radius: 4px;
-                border-top-right-radius: 4px;
-                margin-right: 1px;
-            }
-            QTabBar::tab:selected {
-                background: #003300;
-                font-weight: bold;
-            }
-            QTabBar::tab:hover {
-                background: #004d00;
-            }
-            QLabel, QCheckBox, QPushButton, QListWidget, QLineEdit, QTextEdit {
-                color: #00ff00;
-                font-size: 14px;
-                font-family: Consolas, Courier New, monospace;
-            }
-            QScrollArea {
-                background-color: #040404;
-                color: #00ff00;
-                border: 1px solid #0f0;
-                border-radius: 6px;
-            }
-            QPushButton {
-                background-color: #001100;
-                border: 1px solid #0f0;
-                padding: 6px;
-                border-radius: 3px;
-            }
-            QPushButton:hover {
-                background-color: #004d00;
-            }
-            QLineEdit, QTextEdit, QListWidget {
-                background-color: #000000;
-                border: 1px solid #0f0;
-                border-radius: 3px;
-                padding: 4px;
-            }
-        """)
+    def set_hacker_theme(self, widget=None):
+        self._apply_theme("hacker", widget)
 
 #LIGHT THEME
 
-    def set_light_theme(self):
-        self.setStyleSheet("""
-            QMainWindow {
-                background-color: #f0f0f0;
-            }
-            QWidget {
-                background-color: #f0f0f0;
-                color: #000000;
-            }
-            QTabWidget::pane {
-                border: 1px solid #aaa;
-                background: #ffffff;
-            }
-            QTabBar::tab {
-                background: #ffffff;
-                color: #000000;
-                padding: 8px;
-                min-width: 110px;
-                max-width: 110px;
-                border: 1px solid #ccc;
-                border-bottom: none;
-                border-top-left-radius: 4px;
-                border-top-right-radius: 4px;
-            }
-            QTabBar::tab:selected {
-                background: #e0e0e0;
-                font-weight: bold;
-            }
-            QTabBar::tab:hover {
-                background: #d0d0d0;
-            }
-            QLabel, QCheckBox, QPushButton, QListWidget, QLineEdit, QTextEdit {
-                color: #000000;
-                font-size: 14px;
-            }
-            QScrollArea {
-                background-color: #e0e0e0;  # or match your main bg
-                border: none;
-                color: inherit;
-            }          
-            QPushButton {
-                background-color: #e0e0e0;
-                border: 1px solid #999;
-                padding: 6px;
-                border-radius: 5px;
-            }
-            QPushButton:hover {
-                background-color: #d0d0d0;
-            }
-            QLineEdit, QTextEdit, QListWidget {
-                background-color: #ffffff;
-                border: 1px solid #ccc;
-                border-radius: 3px;
-                padding: 4px;
-            }
-        """)
+    def set_light_theme(self, widget=None):
+        self._apply_theme("light", widget)
+
+
+class DashboardStatsWorker(QThread):
+    """
+    Summarise scan history from disk for the dashboard cards.
+    Emits loaded(dict) with total, target, tools, time and report; {} if nothing is there.
+    """
+    loaded = pyqtSignal(object)
+
+    # <sanitized_target>_<YYYY-mm-dd_HH-MM-SS>, as written by prepare_scan_folder()
+    _SCAN_NAME_RE = re.compile(r"^(?P<target>.+)_(?P<ts>\d{4}-\d{2}-\d{2}_\d{2}-\d{2}-\d{2})$")
+
+    def __init__(self, root_dir="Scan Results", parent=None):
+        super().__init__(parent)
+        self.root_dir = root_dir
+
+    def run(self):
+        try:
+            self.loaded.emit(self._collect())
+        except Exception:
+            self.loaded.emit({})
+
+    def _collect(self) -> dict:
+        if not os.path.isdir(self.root_dir):
+            return {}
+        scans = [e for e in os.scandir(self.root_dir)
+                 if e.is_dir() and not e.name.startswith((".", "_"))]
+        if not scans:
+            return {}
+        latest = max(scans, key=lambda e: e.stat().st_mtime)
+
+        m = self._SCAN_NAME_RE.match(latest.name)
+        if m:
+            target = m.group("target")
+            when = time.strptime(m.group("ts"), "%Y-%m-%d_%H-%M-%S")
+        else:
+            target = latest.name
+            when = time.localtime(latest.stat().st_mtime)
+
+        all_reports = os.path.join(latest.path, "All Reports")
+        tools = []
+        if os.path.isdir(all_reports):
+            tools = sorted(e.name for e in os.scandir(all_reports)
+                           if e.is_dir() and not e.name.startswith((".", "_")))
+
+        # Newest file anywhere under the scan folder
+        report, newest = "", -1.0
+        for dirpath, _dirs, files in os.walk(latest.path):
+            for name in files:
+                try:
+                    mtime = os.path.getmtime(os.path.join(dirpath, name))
+                except OSError:
+                    continue
+                if mtime > newest:
+                    report, newest = name, mtime
+
+        return {
+            "total": len(scans),
+            "target": target,
+            "tools": tools,
+            "time": time.strftime("%Y-%m-%d %I:%M %p", when),
+            "report": report,
+        }
+
+
 class _SudoPromptBridge(QObject):
     ask = pyqtSignal(str)        # package name
     answered = pyqtSignal(object)  # (password_or_None, skip_this: bool, skip_all: bool)